@@ -0,0 +1,8 @@
+"""Raw page cache helpers."""
+
+from .manager import CacheManager, PageStats, PruneResult
+from .metadata import PageMeta
+from .parsed import ParseCache
+from .store import RawStore
+
+__all__ = ["CacheManager", "PageMeta", "PageStats", "ParseCache", "PruneResult", "RawStore"]
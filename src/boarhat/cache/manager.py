@@ -0,0 +1,206 @@
+"""Expiry and size-bounded eviction for the raw page store."""
+
+import time
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+
+from boarhat.cache.metadata import parse_time
+from boarhat.cache.parsed import ParseCache
+from boarhat.cache.store import RawStore
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+# Time-to-live per category, matched with fnmatch patterns in order
+DEFAULT_TTLS: dict[str, float] = {
+    "characters": DAY,
+    "weapons": 3 * DAY,
+    "geniemon": 3 * DAY,
+    "demon_wedges": 3 * DAY,
+    "character_*": 7 * DAY,
+}
+DEFAULT_TTL = 3 * DAY
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+
+@dataclass
+class PageStats:
+    """Cache statistics for one category."""
+
+    category: str
+    size: int
+    fetched_at: str
+    accessed_at: str
+    ttl: float
+    expired: bool
+    history: int
+
+
+@dataclass
+class PruneResult:
+    """Outcome of a prune pass."""
+
+    expired: list[str] = field(default_factory=list)
+    evicted: list[str] = field(default_factory=list)
+    removed_objects: int = 0
+    removed_results: int = 0
+    freed_bytes: int = 0
+
+
+class CacheManager:
+    """
+    Cache policy on top of a `RawStore`.
+
+    Pages older than their category's TTL are refreshed on next use (with a
+    conditional request when validators are known), and the store is kept
+    under a total size cap by evicting old history snapshots first, then
+    current pages in least-recently-used order.
+    """
+
+    def __init__(
+        self,
+        store: RawStore,
+        ttls: dict[str, float] | None = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ):
+        """
+        Initialize the manager.
+
+        Args:
+            store: Raw page store to manage
+            ttls: Category pattern -> TTL in seconds (defaults to DEFAULT_TTLS)
+            max_size: Maximum total size of stored objects in bytes
+        """
+        self.store = store
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.max_size = max_size
+
+    def ttl_for(self, category: str) -> float:
+        """TTL in seconds for a category."""
+        for pattern, ttl in self.ttls.items():
+            if fnmatch(category, pattern):
+                return ttl
+        return DEFAULT_TTL
+
+    def _fetched_time(self, entry: dict) -> float | None:
+        """When an entry's current page was fetched, falling back to its object mtime."""
+        fetched = parse_time(entry.get("meta", {}).get("fetched_at", ""))
+        if fetched is not None:
+            return fetched
+        path = self.store.object_path(entry["current"])
+        return path.stat().st_mtime if path.exists() else None
+
+    def _is_entry_expired(self, category: str, entry: dict, now: float) -> bool:
+        """Whether an entry's current page has outlived its TTL."""
+        if not entry.get("current"):
+            return False
+        fetched = self._fetched_time(entry)
+        return fetched is None or now - fetched > self.ttl_for(category)
+
+    def is_expired(self, category: str) -> bool:
+        """Whether the category's cached page is past its TTL."""
+        entry = self.store.pages().get(category)
+        return entry is not None and self._is_entry_expired(category, entry, time.time())
+
+    def _object_sizes(self) -> dict[str, int]:
+        """Size on disk of every stored object."""
+        return {
+            digest: self.store.object_path(digest).stat().st_size
+            for digest in self.store.object_hashes()
+        }
+
+    def stats(self) -> list[PageStats]:
+        """Per-category statistics, sorted by category."""
+        sizes = self._object_sizes()
+        accessed = self.store.access_times()
+        now = time.time()
+        result = []
+        for category, entry in sorted(self.store.pages().items()):
+            current = entry.get("current")
+            result.append(
+                PageStats(
+                    category=category,
+                    size=sizes.get(current, 0) if current else 0,
+                    fetched_at=entry.get("meta", {}).get("fetched_at", ""),
+                    accessed_at=accessed.get(category, ""),
+                    ttl=self.ttl_for(category),
+                    expired=self._is_entry_expired(category, entry, now),
+                    history=len(entry["history"]),
+                )
+            )
+        return result
+
+    def total_size(self) -> int:
+        """Total size of stored objects in bytes."""
+        return sum(self._object_sizes().values())
+
+    def enforce_size_limit(self, result: PruneResult | None = None) -> PruneResult:
+        """Evict objects until the store fits within `max_size`."""
+        result = result or PruneResult()
+        sizes = self._object_sizes()
+        total = sum(sizes.values())
+        if total <= self.max_size:
+            return result
+
+        # History-only and orphaned objects go first, then current pages by last access
+        rank: dict[str, tuple[int, float]] = dict.fromkeys(sizes, (0, 0.0))
+        owners: dict[str, list[str]] = {}
+        accessed = self.store.access_times()
+        for category, entry in self.store.pages().items():
+            current = entry.get("current")
+            if current in sizes:
+                used = parse_time(accessed.get(category, "")) or 0.0
+                rank[current] = max(rank[current], (1, used))
+                owners.setdefault(current, []).append(category)
+
+        victims = set()
+        for digest in sorted(rank, key=rank.__getitem__):
+            if total <= self.max_size:
+                break
+            victims.add(digest)
+            total -= sizes[digest]
+            result.freed_bytes += sizes[digest]
+            result.evicted.extend(owners.get(digest, []))
+
+        self.store.evict(victims)
+        result.removed_objects += len(victims)
+        return result
+
+    def prune(self) -> PruneResult:
+        """
+        Delete unreferenced objects, then enforce the size cap.
+
+        Expired pages are only reported: they stay current, so they are
+        revalidated on next use and still serve as the offline fallback if
+        that request fails. Parse results of pages that are no longer
+        stored, and of local files unused for a while (see
+        `ParseCache.prune`), are deleted last.
+        """
+        result = PruneResult()
+        now = time.time()
+        result.expired = [
+            category
+            for category, entry in self.store.pages().items()
+            if self._is_entry_expired(category, entry, now)
+        ]
+
+        referenced = set()
+        for entry in self.store.pages().values():
+            if entry.get("current"):
+                referenced.add(entry["current"])
+            referenced.update(entry["history"])
+
+        sizes = self._object_sizes()
+        orphans = set(sizes) - referenced
+        if orphans:
+            self.store.evict(orphans)
+            result.removed_objects += len(orphans)
+            result.freed_bytes += sum(sizes[d] for d in orphans)
+
+        self.enforce_size_limit(result)
+
+        # Parse results of store pages are only worth keeping while their page is
+        removed, freed = ParseCache(self.store.root).prune(self.store.object_hashes())
+        result.removed_results += removed
+        result.freed_bytes += freed
+        return result
@@ -0,0 +1,68 @@
+"""Metadata for cached HTML pages."""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+
+def utc_now() -> str:
+    """Current UTC time as an ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def parse_time(value: str) -> float | None:
+    """Parse an ISO 8601 timestamp into seconds since the epoch."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
+
+def content_hash(content: str | bytes) -> str:
+    """SHA-256 hex digest of page content."""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+@dataclass
+class PageMeta:
+    """HTTP validators and bookkeeping for one cached page."""
+
+    url: str = ""
+    etag: str = ""
+    last_modified: str = ""
+    fetched_at: str = ""
+    sha256: str = ""
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Request headers for revalidating the cached copy."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            "url": self.url,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "fetched_at": self.fetched_at,
+            "sha256": self.sha256,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PageMeta":
+        """Create from dictionary."""
+        return cls(
+            url=data.get("url", ""),
+            etag=data.get("etag", ""),
+            last_modified=data.get("last_modified", ""),
+            fetched_at=data.get("fetched_at", ""),
+            sha256=data.get("sha256", ""),
+        )
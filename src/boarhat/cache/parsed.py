@@ -0,0 +1,207 @@
+"""Cache of parse results keyed by raw page content and scraper code version."""
+
+import functools
+import gzip
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Literal
+
+import bs4
+from lxml import etree
+
+import boarhat
+from boarhat.cache.metadata import content_hash
+
+# Packages whose code decides what a page parses into
+FINGERPRINTED_PACKAGES = ("scrapers", "models")
+
+# Where a parsed page came from: the raw page store, or a local file (`--input`)
+PageSource = Literal["store", "file"]
+
+# Entries for local files are kept this long after their last use
+FILE_ENTRY_MAX_AGE = 30 * 24 * 60 * 60
+
+
+@functools.cache
+def code_fingerprint() -> str:
+    """Hash of the scraper and model sources, so code changes invalidate parse results."""
+    package_dir = Path(boarhat.__file__).parent
+    versions = (boarhat.__version__, bs4.__version__, etree.__version__)
+    parts = [" ".join(versions).encode("utf-8")]
+    for name in FINGERPRINTED_PACKAGES:
+        for path in sorted((package_dir / name).rglob("*.py")):
+            parts.append(path.relative_to(package_dir).as_posix().encode("utf-8"))
+            parts.append(path.read_bytes())
+    return content_hash(b"\0".join(parts))
+
+
+class ParseCache:
+    """
+    Stored `run()` output for pages that were already parsed.
+
+    Entries live under `parsed/` in the cache directory, one gzip-compressed
+    JSON file per key. Keys combine the raw page hash with the code
+    fingerprint and anything else the output depends on, so an entry is
+    only ever reused for the exact same input. Each entry records whether
+    its page came from the raw page store or a local file, which decides
+    how `prune` expires it.
+    """
+
+    def __init__(self, root: Path):
+        """
+        Initialize the cache.
+
+        Args:
+            root: Cache directory (e.g. `data/raw`)
+        """
+        self.root = root / "parsed"
+
+    @staticmethod
+    def key(page_hash: str, *parts: str) -> str:
+        """Cache key for a page hash and the other inputs of a parse."""
+        return content_hash("\0".join((page_hash, code_fingerprint(), *parts)))
+
+    def path(self, key: str) -> Path:
+        """Path of the entry for a key."""
+        return self.root / key[:2] / f"{key}.json.gz"
+
+    def get(self, key: str) -> list[dict[str, Any]] | None:
+        """Stored records for a key, or None on a miss. A hit marks the entry as used."""
+        path = self.path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                records: list[dict[str, Any]] = json.load(f)["records"]
+            os.utime(path)
+            return records
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError):
+            # Unreadable entries are treated as misses and overwritten later
+            return None
+
+    def put(
+        self,
+        key: str,
+        page_hash: str,
+        records: list[dict[str, Any]],
+        source: PageSource = "store",
+    ) -> None:
+        """Store the records parsed from a page."""
+        with self.writer(key, page_hash, source) as writer:
+            for record in records:
+                writer.add(record)
+
+    def writer(self, key: str, page_hash: str, source: PageSource = "store") -> "EntryWriter":
+        """Writer that stores records for a key one at a time, as they are parsed."""
+        return EntryWriter(self.path(key), page_hash, source)
+
+    def prune(
+        self, live_pages: set[str], max_file_age: float = FILE_ENTRY_MAX_AGE
+    ) -> tuple[int, int]:
+        """
+        Delete entries whose page is gone.
+
+        Entries for store pages go when the page is no longer stored.
+        Local files are not in the store, so their entries go once unused
+        for `max_file_age` seconds instead. Unreadable entries always go.
+
+        Args:
+            live_pages: Hashes of the raw pages still in the store
+            max_file_age: Seconds since last use after which local-file entries go
+
+        Returns:
+            Tuple of (entries removed, bytes freed)
+        """
+        removed = freed = 0
+        cutoff = time.time() - max_file_age
+        for path in self.root.glob("*/*.json.gz"):
+            try:
+                with gzip.open(path, "rt", encoding="utf-8") as f:
+                    entry = json.load(f)
+                # Entries written before sources were recorded all came from the store
+                source = entry.get("source", "store")
+                page = entry.get("page")
+            except (OSError, ValueError):
+                source = page = None
+
+            stat = path.stat()
+            if source == "file":
+                stale = stat.st_mtime < cutoff
+            else:
+                stale = source is None or page not in live_pages
+            if stale:
+                freed += stat.st_size
+                path.unlink()
+                removed += 1
+        return removed, freed
+
+
+class EntryWriter:
+    """
+    Writes one parse cache entry record by record, so a parse is never held in full.
+
+    The entry is stored only on a clean exit; if parsing fails, nothing is
+    written and any earlier entry for the key is kept.
+
+    Example:
+        with cache.writer(key, page_hash) as writer:
+            for record in records:
+                writer.add(record)
+    """
+
+    def __init__(self, path: Path, page_hash: str, source: PageSource = "store"):
+        """
+        Initialize the writer.
+
+        Args:
+            path: Entry file
+            page_hash: Hash of the raw page the records come from
+            source: Where the page came from
+        """
+        self.path = path
+        self.page_hash = page_hash
+        self.source = source
+
+    def __enter__(self) -> "EntryWriter":
+        """Open a compressed temp file and write the entry header."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        self._tmp_path = Path(tmp_name)
+        self._raw = os.fdopen(fd, "wb")
+        # No file name or mtime in the header, so equal entries are equal bytes
+        self._file = gzip.GzipFile(filename="", mode="wb", fileobj=self._raw, mtime=0)
+        self._write(
+            f'{{"page": {json.dumps(self.page_hash)}, "source": {json.dumps(self.source)}, '
+            '"records": ['
+        )
+        self._separator = ""
+        return self
+
+    def _write(self, text: str) -> None:
+        """Write text (encoded as UTF-8)."""
+        self._file.write(text.encode("utf-8"))
+
+    def add(self, record: dict[str, Any]) -> None:
+        """Append one record."""
+        self._write(self._separator + json.dumps(record, ensure_ascii=False))
+        self._separator = ", "
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Move the entry into place, or discard it if writing failed."""
+        if exc_type is None:
+            self._write("]}")
+        self._file.close()
+        self._raw.close()
+        if exc_type is not None:
+            self._tmp_path.unlink(missing_ok=True)
+            return
+        os.replace(self._tmp_path, self.path)
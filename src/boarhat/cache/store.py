@@ -0,0 +1,299 @@
+"""Content-addressed, compressed store for raw HTML pages."""
+
+import gzip
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from boarhat.cache.metadata import PageMeta, content_hash, utc_now
+
+MANIFEST_VERSION = 1
+
+# Scrapers for the same cache directory may run in parallel threads
+_locks: dict[Path, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _lock_for(root: Path) -> threading.Lock:
+    """Lock guarding the manifest of one store directory."""
+    with _locks_guard:
+        return _locks.setdefault(root, threading.Lock())
+
+
+class RawStore:
+    """
+    Raw page cache keyed by content hash.
+
+    Pages are stored once per distinct content as gzip-compressed objects
+    under `objects/`, and `manifest.json` maps each category name to its
+    current hash, earlier hashes, and HTTP metadata. When each page was
+    last used is kept apart in `access.json`, so reading the cache leaves
+    the manifest untouched. Pages cached by older versions as flat
+    `<category>.html` files are imported on first access.
+    """
+
+    def __init__(self, root: Path):
+        """
+        Initialize the store.
+
+        Args:
+            root: Cache directory (e.g. `data/raw`)
+        """
+        self.root = root
+        self.objects_dir = root / "objects"
+        self.manifest_file = root / "manifest.json"
+        self.access_file = root / "access.json"
+        self._lock = _lock_for(root.resolve())
+
+    def __getstate__(self) -> dict:
+        """Pickle without the lock, so scrapers can be sent to worker processes."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore a pickled store with this process's lock for its directory."""
+        self.__dict__.update(state)
+        self._lock = _lock_for(self.root.resolve())
+
+    def _load_manifest(self) -> dict:
+        """Read the manifest from disk."""
+        if not self.manifest_file.exists():
+            return {"version": MANIFEST_VERSION, "pages": {}}
+        with open(self.manifest_file, encoding="utf-8") as f:
+            manifest: dict = json.load(f)
+        return manifest
+
+    def _save_manifest(self, manifest: dict) -> None:
+        """Atomically replace the manifest on disk."""
+        self._write_json(self.manifest_file, manifest)
+
+    def _load_access(self) -> dict[str, str]:
+        """Read the last-access times (category -> ISO time) from disk."""
+        if not self.access_file.exists():
+            return {}
+        with open(self.access_file, encoding="utf-8") as f:
+            access: dict[str, str] = json.load(f)
+        return access
+
+    def _set_access(self, category: str, accessed_at: str | None) -> None:
+        """Record (or with None, forget) when a category's page was last used."""
+        access = self._load_access()
+        if accessed_at is None and category not in access:
+            return
+        if accessed_at is None:
+            del access[category]
+        else:
+            access[category] = accessed_at
+        self._write_json(self.access_file, access)
+
+    def _write_json(self, path: Path, data: dict) -> None:
+        """Atomically replace a JSON file in the store directory."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix=f".{path.stem}-", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp_name, path)
+
+    def object_path(self, digest: str) -> Path:
+        """Path of the compressed object for a content hash."""
+        return self.objects_dir / digest[:2] / f"{digest}.html.gz"
+
+    def _write_object(self, content: bytes) -> str:
+        """Store content if not already present and return its hash."""
+        digest = content_hash(content)
+        path = self.object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                # mtime=0 keeps identical pages byte-identical on disk
+                f.write(gzip.compress(content, compresslevel=9, mtime=0))
+            os.replace(tmp_name, path)
+        return digest
+
+    def read_object(self, digest: str) -> bytes:
+        """Read and decompress an object."""
+        return gzip.decompress(self.object_path(digest).read_bytes())
+
+    def _import_legacy(self, category: str, manifest: dict) -> dict | None:
+        """Move a flat `<category>.html` cache file (and sidecar) into the store."""
+        legacy_file = self.root / f"{category}.html"
+        if not legacy_file.exists():
+            return None
+
+        content = legacy_file.read_bytes()
+        meta = PageMeta(sha256=content_hash(content))
+        sidecar = legacy_file.with_suffix(".meta.json")
+        if sidecar.exists():
+            with open(sidecar, encoding="utf-8") as f:
+                meta = PageMeta.from_dict(json.load(f))
+
+        entry = {"current": self._write_object(content), "history": [], "meta": meta.to_dict()}
+        manifest["pages"][category] = entry
+        self._save_manifest(manifest)
+
+        legacy_file.unlink()
+        if sidecar.exists():
+            sidecar.unlink()
+        return entry
+
+    def _raw_entry(self, category: str) -> dict | None:
+        """Manifest entry for a category, importing a legacy cache file if needed."""
+        with self._lock:
+            manifest = self._load_manifest()
+            entry: dict | None = manifest["pages"].get(category)
+            if entry is None:
+                entry = self._import_legacy(category, manifest)
+        return entry
+
+    def _entry(self, category: str) -> dict | None:
+        """Manifest entry for a category with a current page, if any."""
+        entry = self._raw_entry(category)
+        if entry is None or not entry.get("current"):
+            return None
+        return entry
+
+    def has(self, category: str) -> bool:
+        """Whether a current page is cached for the category."""
+        return self._entry(category) is not None
+
+    def current_hash(self, category: str) -> str | None:
+        """Content hash of the current page for the category."""
+        entry = self._entry(category)
+        return entry["current"] if entry else None
+
+    def history(self, category: str) -> list[str]:
+        """Earlier content hashes for the category, oldest first."""
+        entry = self._raw_entry(category)
+        return list(entry["history"]) if entry else []
+
+    def read(self, category: str) -> str:
+        """
+        Read the current page for a category.
+
+        Raises:
+            KeyError: If nothing is cached for the category
+        """
+        entry = self._entry(category)
+        if entry is None:
+            raise KeyError(category)
+        return self.read_object(entry["current"]).decode("utf-8")
+
+    def open(self, category: str) -> gzip.GzipFile:
+        """
+        Open the current page for a category as a decompressing byte stream.
+
+        Raises:
+            KeyError: If nothing is cached for the category
+        """
+        entry = self._entry(category)
+        if entry is None:
+            raise KeyError(category)
+        return gzip.open(self.object_path(entry["current"]), "rb")
+
+    def pages(self) -> dict[str, dict]:
+        """Snapshot of all manifest entries, keyed by category."""
+        with self._lock:
+            pages: dict[str, dict] = self._load_manifest()["pages"]
+        return pages
+
+    def access_times(self) -> dict[str, str]:
+        """When each category's current page was last used (ISO time), by category."""
+        with self._lock:
+            return self._load_access()
+
+    def object_hashes(self) -> set[str]:
+        """Hashes of all objects present on disk."""
+        return {path.name.split(".", 1)[0] for path in self.objects_dir.glob("*/*.html.gz")}
+
+    def touch(self, category: str) -> None:
+        """Record that the category's current page was just used."""
+        with self._lock:
+            entry = self._load_manifest()["pages"].get(category)
+            if entry is not None and entry.get("current"):
+                self._set_access(category, utc_now())
+
+    def evict(self, digests: set[str]) -> None:
+        """
+        Delete objects and drop every manifest reference to them.
+
+        Categories whose current page is evicted are fetched again on next use.
+        """
+        with self._lock:
+            manifest = self._load_manifest()
+            for category, entry in manifest["pages"].items():
+                if entry.get("current") in digests:
+                    entry["current"] = None
+                    entry.pop("meta", None)
+                    self._set_access(category, None)
+                entry["history"] = [h for h in entry["history"] if h not in digests]
+            self._save_manifest(manifest)
+
+            for digest in digests:
+                self.object_path(digest).unlink(missing_ok=True)
+
+    def meta(self, category: str) -> PageMeta | None:
+        """HTTP metadata of the current page for a category."""
+        entry = self._entry(category)
+        return PageMeta.from_dict(entry.get("meta", {})) if entry else None
+
+    def put(self, category: str, html_content: str, meta: PageMeta) -> str:
+        """
+        Store a page as the category's current version.
+
+        Returns:
+            Content hash of the page
+        """
+        digest = self._write_object(html_content.encode("utf-8"))
+        meta.sha256 = digest
+
+        with self._lock:
+            manifest = self._load_manifest()
+            entry = manifest["pages"].setdefault(category, {"current": None, "history": []})
+            previous = entry.get("current")
+            history = [h for h in entry["history"] if h not in (previous, digest)]
+            if previous and previous != digest:
+                history.append(previous)
+            entry["history"] = history
+            entry["current"] = digest
+            entry["meta"] = meta.to_dict()
+            entry.pop("accessed_at", None)  # Kept in access.json by newer versions
+            self._save_manifest(manifest)
+            self._set_access(category, utc_now())
+
+        return digest
+
+    def update_meta(self, category: str, meta: PageMeta) -> None:
+        """Replace the metadata of the category's current page."""
+        with self._lock:
+            manifest = self._load_manifest()
+            entry = manifest["pages"].get(category)
+            if entry is not None:
+                entry["meta"] = meta.to_dict()
+                self._save_manifest(manifest)
+
+    def invalidate(self, category: str) -> bool:
+        """
+        Drop the category's current page so the next run fetches it again.
+
+        The content stays in the store and is kept in the category's history.
+
+        Returns:
+            True if a page was cached
+        """
+        if not self.has(category):
+            return False
+
+        with self._lock:
+            manifest = self._load_manifest()
+            entry = manifest["pages"][category]
+            current = entry["current"]
+            entry["history"] = [h for h in entry["history"] if h != current] + [current]
+            entry["current"] = None
+            entry.pop("meta", None)
+            self._save_manifest(manifest)
+            self._set_access(category, None)
+        return True
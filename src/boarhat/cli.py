@@ -1,27 +1,123 @@
 """CLI tool for running scrapers."""
 
+import asyncio
+import functools
+import json
+from collections import Counter
+from collections.abc import Callable, Sequence
 from pathlib import Path
 
 import click
 from rich.console import Console
 from rich.table import Table
 
+from boarhat.cache import CacheManager, RawStore
+from boarhat.cache.manager import DEFAULT_MAX_SIZE
+from boarhat.data import MANIFEST_FILE, Manifest
+from boarhat.data.manifest import output_files
+from boarhat.export import export_sqlite
+from boarhat.loadout import FORMULAS, Formula, SlotLayout, evaluate, optimize_roster
+from boarhat.models import Catalog, Polarity, write_snapshot
+from boarhat.query import (
+    INDEXED_FIELDS,
+    RELATIONS_FILE,
+    SEARCH_INDEX_FILE,
+    QueryEngine,
+    RelationIndex,
+    SearchIndex,
+)
 from boarhat.scrapers import (
     CharacterScraper,
     DemonWedgeScraper,
     GeniemonScraper,
+    Transport,
     WeaponScraper,
 )
+from boarhat.scrapers.base import BaseScraper
 from boarhat.scrapers.character_detail import CharacterDetailScraper
+from boarhat.scrapers.fetch import run_scrapers
+from boarhat.server import DataServer
 
 console = Console()
 
 
+def _print_write_summary(scrapers: Sequence[BaseScraper]) -> None:
+    """Report how many output files were created, changed, or left as they were."""
+    statuses = Counter(s.output_status for s in scrapers if s.output_status)
+    console.print(
+        f"  Files: {statuses['new']} new, {statuses['changed']} changed, "
+        f"{statuses['unchanged']} unchanged"
+    )
+
+
+def _update_indexes(scrapers: Sequence[BaseScraper], data_dir: Path | None = None) -> None:
+    """
+    Rebuild the indexes saved next to the processed data when scraper outputs changed.
+
+    Indexes are only written into a processed data directory: the output
+    directory of a list scraper, or `data_dir` for character details
+    saved in its `characters/` directory. Details saved anywhere else are
+    not part of a dataset, and directories without list outputs are left
+    alone.
+    """
+    data_dirs = set()
+    for s in scrapers:
+        if s.output_status not in ("new", "changed"):
+            continue
+        if not isinstance(s, CharacterDetailScraper):
+            data_dirs.add(s.output_dir)
+        elif data_dir is not None and s.output_dir.resolve() == (data_dir / "characters").resolve():
+            data_dirs.add(data_dir)
+
+    for directory in sorted(data_dirs):
+        if not any(section != "details" for section, _ in output_files(directory)):
+            continue
+        catalog = Catalog.load(directory)
+        index = SearchIndex.build(catalog)
+        index.save(directory / SEARCH_INDEX_FILE)
+        RelationIndex.build(catalog).save(directory / RELATIONS_FILE)
+        Manifest.build(directory).save(directory / MANIFEST_FILE)
+        console.print(
+            f"  Search index: {len(index.documents)} documents, {len(index.postings)} terms"
+        )
+
+
 @click.group()
 @click.version_option(version="0.1.0")
-def cli():
+@click.option(
+    "--rate",
+    type=float,
+    default=2.0,
+    show_default=True,
+    help="Maximum requests per second to each host",
+)
+@click.option(
+    "--http2",
+    is_flag=True,
+    help="Use HTTP/2 (requires the h2 package)",
+)
+def cli(rate: float, http2: bool):
     """Boarhat - Duet Night Abyss Data Scraper."""
-    pass
+
+
+def pass_transport(f: Callable) -> Callable:
+    """
+    Pass the transport shared by every scraper in this process as the first argument.
+
+    The transport is created on first use with the group's `--rate` and
+    `--http2`, so commands that never fetch do not open a client.
+    """
+
+    def new_func(*args, **kwargs):
+        root = click.get_current_context().find_root()
+        transport = root.meta.get("transport")
+        if transport is None:
+            transport = Transport(rate=root.params["rate"], http2=root.params["http2"])
+            root.meta["transport"] = transport
+            root.call_on_close(transport.close)
+        return f(transport, *args, **kwargs)
+
+    return functools.update_wrapper(new_func, f)
 
 
 @cli.group()
@@ -50,19 +146,45 @@ def character():
     is_flag=True,
     help="Force fetch from URL (ignore cache)",
 )
-def character_list(source: str, output_dir: Path, no_cache: bool):
+@click.option(
+    "--revalidate",
+    is_flag=True,
+    help="Revalidate cached pages with ETag/Last-Modified before using them",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["json", "ndjson"]),
+    default="json",
+    show_default=True,
+    help="Output format (ndjson writes one compact object per line as items are scraped)",
+)
+@pass_transport
+def character_list(
+    transport: Transport,
+    source: str,
+    output_dir: Path,
+    no_cache: bool,
+    revalidate: bool,
+    output_format: str,
+):
     """Scrape character list from boarhat.gg."""
     cache_dir = Path("data/raw")
 
-    # Clear cache if requested
-    if no_cache and isinstance(source, str) and source.startswith("http"):
-        cache_file = cache_dir / "characters.html"
-        if cache_file.exists():
-            cache_file.unlink()
-            console.print(f"[yellow]Cleared cache: {cache_file}[/yellow]")
+    scraper = CharacterScraper(
+        source,
+        output_dir,
+        cache_dir,
+        transport,
+        revalidate=revalidate,
+        output_format=output_format,
+    )
 
-    scraper = CharacterScraper(source, output_dir, cache_dir)
-    data, output_path = scraper.run()
+    # Clear cache if requested
+    if no_cache and scraper.is_remote and scraper.clear_cache():
+        console.print(f"[yellow]Cleared cache: {scraper.category_name}[/yellow]")
+    _, output_path = scraper.run()
+    data = scraper.load_output()
 
     # Display summary
     table = Table(title="Character Summary")
@@ -86,6 +208,8 @@ def character_list(source: str, output_dir: Path, no_cache: bool):
     table.add_row("Rarities", ", ".join(f"{k}: {v}" for k, v in rarities.most_common()))
 
     console.print(table)
+    _print_write_summary([scraper])
+    _update_indexes([scraper])
     console.print(f"\n✓ Data saved to: [bold green]{output_path}[/bold green]")
 
 
@@ -98,12 +222,58 @@ def character_list(source: str, output_dir: Path, no_cache: bool):
     default=Path("data/processed/characters"),
     help="Output directory",
 )
+@click.option(
+    "--data-dir",
+    "data_dir",
+    type=click.Path(path_type=Path),
+    default=Path("data/processed"),
+    show_default=True,
+    help="Processed data directory (its indexes are updated when --output is its characters/)",
+)
 @click.option(
     "--no-cache",
     is_flag=True,
     help="Force fetch from URLs (ignore cache)",
 )
-def character_all(output_dir: Path, no_cache: bool):
+@click.option(
+    "--revalidate",
+    is_flag=True,
+    help="Revalidate cached pages with ETag/Last-Modified before using them",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Maximum number of pages fetched in parallel",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Parse detail pages in this many processes (default: parse in-process)",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["json", "ndjson"]),
+    default="json",
+    show_default=True,
+    help="Output format (ndjson writes one compact object per line as items are scraped)",
+)
+@pass_transport
+def character_all(
+    transport: Transport,
+    output_dir: Path,
+    data_dir: Path,
+    no_cache: bool,
+    revalidate: bool,
+    concurrency: int,
+    workers: int | None,
+    output_format: str,
+):
     """Scrape detailed data for all characters."""
     cache_dir = Path("data/raw")
 
@@ -111,10 +281,14 @@ def character_all(output_dir: Path, no_cache: bool):
     console.print("[bold yellow]Step 1: Getting character list...[/bold yellow]")
     list_scraper = CharacterScraper(
         "https://boarhat.gg/games/duet-night-abyss/character/",
-        Path("data/processed"),
+        data_dir,
         cache_dir,
+        transport,
+        revalidate=revalidate,
+        output_format=output_format,
     )
-    characters, _ = list_scraper.run()
+    list_scraper.run()
+    characters = list_scraper.load_output()
 
     console.print(f"\n[bold green]Found {len(characters)} characters[/bold green]\n")
 
@@ -123,41 +297,47 @@ def character_all(output_dir: Path, no_cache: bool):
         "[bold yellow]Step 2: Scraping detailed data for each character...[/bold yellow]\n"
     )
 
-    success_count = 0
-    failed = []
-
-    for i, char in enumerate(characters, 1):
+    scrapers = []
+    for char in characters:
         # Extract slug from URL
         slug = char.url.rstrip("/").split("/")[-1]
 
-        try:
-            console.print(f"[{i}/{len(characters)}] Scraping {char.name} ({slug})...")
+        url = f"https://boarhat.gg/games/duet-night-abyss/character/{slug}/"
+        scraper = CharacterDetailScraper(
+            url, output_dir, cache_dir, slug, transport, revalidate, output_format
+        )
+        if no_cache:
+            scraper.clear_cache()
+        scrapers.append(scraper)
 
-            if no_cache:
-                cache_file = cache_dir / f"character_{slug}.html"
-                if cache_file.exists():
-                    cache_file.unlink()
+    results = run_scrapers(scrapers, concurrency=concurrency, transport=transport, workers=workers)
 
-            url = f"https://boarhat.gg/games/duet-night-abyss/character/{slug}/"
-            scraper = CharacterDetailScraper(url, output_dir, cache_dir, slug)
-            data, _ = scraper.run()
+    success_count = 0
+    failed = []
 
-            if data:
-                success_count += 1
-                console.print("  [green]✓ Success[/green]")
-            else:
-                failed.append(char.name)
-                console.print("  [red]✗ No data[/red]")
+    for i, (char, scraper, result) in enumerate(zip(characters, scrapers, results, strict=True), 1):
+        console.print(f"[{i}/{len(characters)}] {char.name} ({scraper.character_slug})")
 
-        except Exception as e:
+        if isinstance(result, BaseException):
             failed.append(char.name)
-            console.print(f"  [red]✗ Error: {e}[/red]")
+            console.print(f"  [red]✗ Error: {result}[/red]")
+            continue
+
+        count, _ = result
+        if count:
+            success_count += 1
+            console.print("  [green]✓ Success[/green]")
+        else:
+            failed.append(char.name)
+            console.print("  [red]✗ No data[/red]")
 
     # Summary
     console.print("\n[bold green]Summary[/bold green]")
     console.print(f"  Total: {len(characters)}")
     console.print(f"  Success: {success_count}")
     console.print(f"  Failed: {len(failed)}")
+    _print_write_summary([list_scraper, *scrapers])
+    _update_indexes([list_scraper, *scrapers], data_dir)
 
     if failed:
         console.print("\n[yellow]Failed characters:[/yellow]")
@@ -177,25 +357,55 @@ def character_all(output_dir: Path, no_cache: bool):
     default=Path("data/processed/characters"),
     help="Output directory",
 )
+@click.option(
+    "--data-dir",
+    "data_dir",
+    type=click.Path(path_type=Path),
+    default=Path("data/processed"),
+    show_default=True,
+    help="Processed data directory (its indexes are updated when --output is its characters/)",
+)
 @click.option(
     "--no-cache",
     is_flag=True,
     help="Force fetch from URL (ignore cache)",
 )
-def get(character_slug: str, output_dir: Path, no_cache: bool):
+@click.option(
+    "--revalidate",
+    is_flag=True,
+    help="Revalidate cached pages with ETag/Last-Modified before using them",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["json", "ndjson"]),
+    default="json",
+    show_default=True,
+    help="Output format (ndjson writes one compact object per line as items are scraped)",
+)
+@pass_transport
+def get(
+    transport: Transport,
+    character_slug: str,
+    output_dir: Path,
+    data_dir: Path,
+    no_cache: bool,
+    revalidate: bool,
+    output_format: str,
+):
     """Scrape detailed data for a specific character."""
     cache_dir = Path("data/raw")
 
-    # Clear cache if requested
-    if no_cache:
-        cache_file = cache_dir / f"character_{character_slug}.html"
-        if cache_file.exists():
-            cache_file.unlink()
-            console.print(f"[yellow]Cleared cache: {cache_file}[/yellow]")
-
     url = f"https://boarhat.gg/games/duet-night-abyss/character/{character_slug}/"
-    scraper = CharacterDetailScraper(url, output_dir, cache_dir, character_slug)
-    data, output_path = scraper.run()
+    scraper = CharacterDetailScraper(
+        url, output_dir, cache_dir, character_slug, transport, revalidate, output_format
+    )
+
+    # Clear cache if requested
+    if no_cache and scraper.clear_cache():
+        console.print(f"[yellow]Cleared cache: {scraper.category_name}[/yellow]")
+    _, output_path = scraper.run()
+    data = scraper.load_output()
 
     if data:
         char = data[0]
@@ -205,6 +415,9 @@ def get(character_slug: str, output_dir: Path, no_cache: bool):
         console.print(f"  Base Stats: {len(char.base_stats)}")
         console.print(f"  Skills: {len(char.skills)}")
 
+    _print_write_summary([scraper])
+
+    _update_indexes([scraper], data_dir)
     console.print(f"\n✓ Data saved to: [bold green]{output_path}[/bold green]")
 
 
@@ -234,19 +447,53 @@ def weapon():
     is_flag=True,
     help="Force fetch from URL (ignore cache)",
 )
-def weapon_list(source: str, output_dir: Path, no_cache: bool):
+@click.option(
+    "--revalidate",
+    is_flag=True,
+    help="Revalidate cached pages with ETag/Last-Modified before using them",
+)
+@click.option(
+    "--parser",
+    type=click.Choice(["lxml", "bs4"]),
+    default=None,
+    help="HTML parser backend (default: lxml)",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["json", "ndjson"]),
+    default="json",
+    show_default=True,
+    help="Output format (ndjson writes one compact object per line as items are scraped)",
+)
+@pass_transport
+def weapon_list(
+    transport: Transport,
+    source: str,
+    output_dir: Path,
+    no_cache: bool,
+    revalidate: bool,
+    parser: str | None,
+    output_format: str,
+):
     """Scrape weapon list from boarhat.gg."""
     cache_dir = Path("data/raw")
 
-    # Clear cache if requested
-    if no_cache and isinstance(source, str) and source.startswith("http"):
-        cache_file = cache_dir / "weapons.html"
-        if cache_file.exists():
-            cache_file.unlink()
-            console.print(f"[yellow]Cleared cache: {cache_file}[/yellow]")
+    scraper = WeaponScraper(
+        source,
+        output_dir,
+        cache_dir,
+        transport,
+        revalidate=revalidate,
+        parser=parser,
+        output_format=output_format,
+    )
 
-    scraper = WeaponScraper(source, output_dir, cache_dir)
-    data, output_path = scraper.run()
+    # Clear cache if requested
+    if no_cache and scraper.is_remote and scraper.clear_cache():
+        console.print(f"[yellow]Cleared cache: {scraper.category_name}[/yellow]")
+    _, output_path = scraper.run()
+    data = scraper.load_output()
 
     # Display summary
     table = Table(title="Weapon Summary")
@@ -270,6 +517,8 @@ def weapon_list(source: str, output_dir: Path, no_cache: bool):
     table.add_row("Attack Types", ", ".join(f"{k}: {v}" for k, v in attack_types.most_common()))
 
     console.print(table)
+    _print_write_summary([scraper])
+    _update_indexes([scraper])
     console.print(f"\n✓ Data saved to: [bold green]{output_path}[/bold green]")
 
 
@@ -299,19 +548,53 @@ def geniemon():
     is_flag=True,
     help="Force fetch from URL (ignore cache)",
 )
-def geniemon_list(source: str, output_dir: Path, no_cache: bool):
+@click.option(
+    "--revalidate",
+    is_flag=True,
+    help="Revalidate cached pages with ETag/Last-Modified before using them",
+)
+@click.option(
+    "--parser",
+    type=click.Choice(["lxml", "bs4"]),
+    default=None,
+    help="HTML parser backend (default: lxml)",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["json", "ndjson"]),
+    default="json",
+    show_default=True,
+    help="Output format (ndjson writes one compact object per line as items are scraped)",
+)
+@pass_transport
+def geniemon_list(
+    transport: Transport,
+    source: str,
+    output_dir: Path,
+    no_cache: bool,
+    revalidate: bool,
+    parser: str | None,
+    output_format: str,
+):
     """Scrape geniemon list from boarhat.gg."""
     cache_dir = Path("data/raw")
 
-    # Clear cache if requested
-    if no_cache and isinstance(source, str) and source.startswith("http"):
-        cache_file = cache_dir / "geniemon.html"
-        if cache_file.exists():
-            cache_file.unlink()
-            console.print(f"[yellow]Cleared cache: {cache_file}[/yellow]")
+    scraper = GeniemonScraper(
+        source,
+        output_dir,
+        cache_dir,
+        transport,
+        revalidate=revalidate,
+        parser=parser,
+        output_format=output_format,
+    )
 
-    scraper = GeniemonScraper(source, output_dir, cache_dir)
-    data, output_path = scraper.run()
+    # Clear cache if requested
+    if no_cache and scraper.is_remote and scraper.clear_cache():
+        console.print(f"[yellow]Cleared cache: {scraper.category_name}[/yellow]")
+    _, output_path = scraper.run()
+    data = scraper.load_output()
 
     # Display summary
     table = Table(title="Geniemon Summary")
@@ -335,6 +618,8 @@ def geniemon_list(source: str, output_dir: Path, no_cache: bool):
     table.add_row("Rarities", ", ".join(f"{k}: {v}" for k, v in rarities.most_common()))
 
     console.print(table)
+    _print_write_summary([scraper])
+    _update_indexes([scraper])
     console.print(f"\n✓ Data saved to: [bold green]{output_path}[/bold green]")
 
 
@@ -364,19 +649,62 @@ def demon_wedge():
     is_flag=True,
     help="Force fetch from URL (ignore cache)",
 )
-def demon_wedge_list(source: str, output_dir: Path, no_cache: bool):
+@click.option(
+    "--revalidate",
+    is_flag=True,
+    help="Revalidate cached pages with ETag/Last-Modified before using them",
+)
+@click.option(
+    "--parser",
+    type=click.Choice(["lxml", "bs4"]),
+    default=None,
+    help="HTML parser backend (default: lxml)",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Parse the page in this many processes, split at card boundaries (lxml only)",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["json", "ndjson"]),
+    default="json",
+    show_default=True,
+    help="Output format (ndjson writes one compact object per line as items are scraped)",
+)
+@pass_transport
+def demon_wedge_list(
+    transport: Transport,
+    source: str,
+    output_dir: Path,
+    no_cache: bool,
+    revalidate: bool,
+    parser: str | None,
+    workers: int | None,
+    output_format: str,
+):
     """Scrape demon wedge list from boarhat.gg."""
     cache_dir = Path("data/raw")
 
-    # Clear cache if requested
-    if no_cache and isinstance(source, str) and source.startswith("http"):
-        cache_file = cache_dir / "demon_wedge.html"
-        if cache_file.exists():
-            cache_file.unlink()
-            console.print(f"[yellow]Cleared cache: {cache_file}[/yellow]")
+    scraper = DemonWedgeScraper(
+        source,
+        output_dir,
+        cache_dir,
+        transport,
+        revalidate=revalidate,
+        parser=parser,
+        workers=workers,
+        output_format=output_format,
+    )
 
-    scraper = DemonWedgeScraper(source, output_dir, cache_dir)
-    data, output_path = scraper.run()
+    # Clear cache if requested
+    if no_cache and scraper.is_remote and scraper.clear_cache():
+        console.print(f"[yellow]Cleared cache: {scraper.category_name}[/yellow]")
+    _, output_path = scraper.run()
+    data = scraper.load_output()
 
     # Display summary
     table = Table(title="Demon Wedge Summary")
@@ -400,9 +728,437 @@ def demon_wedge_list(source: str, output_dir: Path, no_cache: bool):
     table.add_row("Rarities", ", ".join(f"{k}: {v}" for k, v in rarities.most_common()))
 
     console.print(table)
+    _print_write_summary([scraper])
+    _update_indexes([scraper])
     console.print(f"\n✓ Data saved to: [bold green]{output_path}[/bold green]")
 
 
+def _format_size(size: int) -> str:
+    """Human-readable byte count."""
+    value = float(size)
+    for unit in ["B", "KB", "MB"]:
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+@cli.group()
+def cache():
+    """Raw page cache commands."""
+    pass
+
+
+@cache.command("stats")
+@click.option(
+    "--cache-dir",
+    type=click.Path(path_type=Path),
+    default=Path("data/raw"),
+    help="Cache directory",
+)
+def cache_stats(cache_dir: Path):
+    """Show cached pages, their age and size."""
+    manager = CacheManager(RawStore(cache_dir))
+
+    table = Table(title="Cache Summary")
+    table.add_column("Category", style="cyan")
+    table.add_column("Size", style="green", justify="right")
+    table.add_column("Fetched", style="green")
+    table.add_column("Last Used", style="green")
+    table.add_column("TTL", style="green", justify="right")
+    table.add_column("History", style="green", justify="right")
+
+    for page in manager.stats():
+        status = "[red]expired[/red]" if page.expired else ""
+        table.add_row(
+            page.category,
+            _format_size(page.size) if page.size else "-",
+            page.fetched_at or "-",
+            page.accessed_at or "-",
+            f"{page.ttl / 3600:.0f}h {status}".strip(),
+            str(page.history),
+        )
+
+    console.print(table)
+    console.print(
+        f"\nTotal: [bold green]{_format_size(manager.total_size())}[/bold green]"
+        f" of {_format_size(manager.max_size)}"
+    )
+
+
+@cache.command("prune")
+@click.option(
+    "--cache-dir",
+    type=click.Path(path_type=Path),
+    default=Path("data/raw"),
+    help="Cache directory",
+)
+@click.option(
+    "--max-size",
+    type=click.IntRange(min=0),
+    default=DEFAULT_MAX_SIZE // (1024 * 1024),
+    show_default=True,
+    help="Maximum cache size in MB",
+)
+def cache_prune(cache_dir: Path, max_size: int):
+    """Delete unreferenced pages and evict least recently used ones over the size cap."""
+    manager = CacheManager(RawStore(cache_dir), max_size=max_size * 1024 * 1024)
+    result = manager.prune()
+
+    console.print(f"  Expired (revalidated on next use): {len(result.expired)}")
+    for category in result.expired:
+        console.print(f"    - {category}")
+    console.print(f"  Evicted: {len(result.evicted)}")
+    for category in result.evicted:
+        console.print(f"    - {category}")
+    console.print(f"  Removed objects: {result.removed_objects}")
+    console.print(f"  Removed parse results: {result.removed_results}")
+    console.print(f"\n✓ Freed [bold green]{_format_size(result.freed_bytes)}[/bold green]")
+
+
+@cli.group()
+def export():
+    """Export the processed data to other formats."""
+    pass
+
+
+@export.command("sqlite")
+@click.option(
+    "--input",
+    "-i",
+    "data_dir",
+    type=click.Path(path_type=Path),
+    default=Path("data/processed"),
+    help="Processed data directory",
+)
+@click.option(
+    "--output",
+    "-o",
+    "output_file",
+    type=click.Path(path_type=Path),
+    default=Path("data/boarhat.db"),
+    help="Database file",
+)
+def export_sqlite_command(data_dir: Path, output_file: Path):
+    """Export all processed data to an indexed SQLite database."""
+    counts = export_sqlite(Catalog.load(data_dir), output_file)
+
+    # Display summary
+    table = Table(title="SQLite Export")
+    table.add_column("Table", style="cyan")
+    table.add_column("Rows", style="green")
+
+    for name, count in counts.items():
+        table.add_row(name, str(count))
+
+    console.print(table)
+    console.print(f"\n✓ Database saved to: [bold green]{output_file}[/bold green]")
+
+
+@cli.command()
+@click.option(
+    "--input",
+    "-i",
+    "data_dir",
+    type=click.Path(path_type=Path),
+    default=Path("data/processed"),
+    help="Processed data directory",
+)
+@click.option(
+    "--output",
+    "-o",
+    "output_file",
+    type=click.Path(path_type=Path),
+    default=Path("data/boarhat.snap"),
+    help="Snapshot file",
+)
+def snapshot(data_dir: Path, output_file: Path):
+    """Bundle all processed data into one binary snapshot for fast loading."""
+    counts = write_snapshot(Catalog.load(data_dir), output_file)
+
+    # Display summary
+    table = Table(title="Snapshot")
+    table.add_column("Section", style="cyan")
+    table.add_column("Records", style="green")
+
+    for name, count in counts.items():
+        table.add_row(name, str(count))
+
+    console.print(table)
+    console.print(f"\n✓ Snapshot saved to: [bold green]{output_file}[/bold green]")
+
+
+@cli.command()
+@click.argument("category", type=click.Choice(list(INDEXED_FIELDS)))
+@click.argument("filters", nargs=-1)
+@click.option(
+    "--input",
+    "-i",
+    "source",
+    type=click.Path(path_type=Path),
+    default=Path("data/processed"),
+    help="Processed data directory or snapshot file",
+)
+@click.option("--limit", "-n", default=20, help="Maximum number of rows to show (0 for all)")
+@click.option("--json", "as_json", is_flag=True, help="Print matching records as JSON")
+def query(category: str, filters: tuple[str, ...], source: Path, limit: int, as_json: bool):
+    """
+    Filter processed data by field values.
+
+    FILTERS are terms like element=Pyro,Hydro, rarity!=SR or name~blade;
+    all of them must match.
+    """
+    engine = QueryEngine.load(source)
+    try:
+        total = engine.count(category, filters)
+        records = engine.query(category, filters, limit=limit or None)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="FILTERS") from e
+
+    if as_json:
+        click.echo(json.dumps([r.to_dict() for r in records], ensure_ascii=False, indent=2))
+        return
+
+    # Display summary
+    fields = INDEXED_FIELDS[category]
+    table = Table(title=f"{category.capitalize()} ({total} matching)")
+    table.add_column("Name", style="cyan")
+    for name in fields:
+        table.add_column(name.replace("_", " ").title(), style="green")
+
+    for record in records:
+        table.add_row(record.name, *(str(getattr(record, name)) for name in fields))
+
+    console.print(table)
+    console.print(f"\n✓ Showing [bold green]{len(records)}[/bold green] of {total}")
+
+
+@cli.command()
+@click.argument("text", nargs=-1, required=True)
+@click.option(
+    "--input",
+    "-i",
+    "data_dir",
+    type=click.Path(path_type=Path),
+    default=Path("data/processed"),
+    help="Processed data directory",
+)
+@click.option("--limit", "-n", default=10, help="Maximum number of results")
+@click.option("--phrase", is_flag=True, help="Only match the words in this order, adjacent")
+def search(text: tuple[str, ...], data_dir: Path, limit: int, phrase: bool):
+    """Search skills, traits, effects and lore by keyword."""
+    query_text = " ".join(text)
+    hits = SearchIndex.open(data_dir).search(query_text, limit=limit, phrase=phrase)
+
+    # Display summary
+    table = Table(title=f"Search: {query_text}")
+    table.add_column("Score", style="yellow", justify="right")
+    table.add_column("Category", style="cyan")
+    table.add_column("Name", style="green")
+    table.add_column("Matched In")
+
+    for hit in hits:
+        table.add_row(
+            f"{hit.score:.2f}", hit.document.category, hit.document.name, ", ".join(hit.fields)
+        )
+
+    console.print(table)
+    console.print(f"\n✓ Found [bold green]{len(hits)}[/bold green] results")
+
+
+def _polarity(ctx: click.Context, param: click.Parameter, values: tuple[str, ...]):
+    """Polarity symbols from symbols or names ("◊" or "diamond")."""
+    try:
+        return tuple(
+            Polarity[v.upper()] if v.upper() in Polarity.__members__ else Polarity(v)
+            for v in values
+        )
+    except ValueError as e:
+        names = ", ".join(f"{p.name.lower()} ({p.value})" for p in Polarity)
+        raise click.BadParameter(f"{e} (expected one of: {names})") from e
+
+
+@cli.command()
+@click.option(
+    "--input",
+    "-i",
+    "data_dir",
+    type=click.Path(path_type=Path),
+    default=Path("data/processed"),
+    help="Processed data directory",
+)
+@click.option("--stat", "-s", default="ATK", show_default=True, help="Stat to maximize")
+@click.option(
+    "--character",
+    "-c",
+    "characters",
+    multiple=True,
+    help="Character to optimize (repeatable; default: all)",
+)
+@click.option("--slots", type=click.IntRange(min=0), default=8, show_default=True)
+@click.option(
+    "--capacity",
+    type=click.IntRange(min=0),
+    default=60,
+    show_default=True,
+    help="Total tolerance available",
+)
+@click.option(
+    "--polarity",
+    "-p",
+    "polarities",
+    multiple=True,
+    callback=_polarity,
+    help="Polarity of a polarized slot (repeatable), e.g. -p diamond -p ⊙",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Optimize characters in this many processes (default: in-process)",
+)
+def optimize(
+    data_dir: Path,
+    stat: str,
+    characters: tuple[str, ...],
+    slots: int,
+    capacity: int,
+    polarities: tuple[str, ...],
+    workers: int | None,
+):
+    """Find the demon wedge set that maximizes a stat for each character."""
+    catalog = Catalog.load(data_dir)
+    try:
+        layout = SlotLayout(slots, capacity, polarities)
+        loadouts = optimize_roster(
+            catalog,
+            stat,
+            layout,
+            characters or None,
+            RelationIndex.open(data_dir),
+            workers,
+        )
+    except ValueError as e:
+        raise click.UsageError(str(e)) from e
+    except KeyError as e:
+        raise click.BadParameter(f"Unknown character: {e}", param_hint="--character") from e
+
+    # Display summary
+    table = Table(title=f"Best {stat} Wedges ({slots} slots, {capacity} tolerance)")
+    table.add_column("Character", style="cyan")
+    table.add_column("Bonus", style="green", justify="right")
+    table.add_column(f"Max-Level {stat}", style="green", justify="right")
+    table.add_column("Tolerance", style="yellow", justify="right")
+    table.add_column("Wedges")
+
+    for loadout in sorted(loadouts, key=lambda lo: lo.value, reverse=True):
+        table.add_row(
+            loadout.character,
+            f"+{loadout.value:g}",
+            f"{loadout.stat_total:,.0f}" if loadout.stat_total is not None else "-",
+            f"{loadout.tolerance}/{capacity}",
+            ", ".join(catalog.wedges[i].name for i in loadout.wedges),
+        )
+
+    console.print(table)
+    nodes = sum(lo.nodes for lo in loadouts)
+    console.print(
+        f"\n✓ Optimized [bold green]{len(loadouts)}[/bold green] characters "
+        f"({nodes:,} search nodes)"
+    )
+
+
+@cli.command()
+@click.option(
+    "--input",
+    "-i",
+    "data_dir",
+    type=click.Path(path_type=Path),
+    default=Path("data/processed"),
+    help="Processed data directory",
+)
+@click.option(
+    "--formula",
+    "-f",
+    type=click.Choice(list(FORMULAS)),
+    default="attack",
+    show_default=True,
+    help="Damage formula",
+)
+@click.option("--limit", "-n", default=20, help="Number of rows to show")
+@click.option(
+    "--output",
+    "-o",
+    "output_file",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Write every ranked row to this CSV file",
+)
+def damage(data_dir: Path, formula: Formula, limit: int, output_file: Path | None):
+    """Rank every character, compatible weapon and refinement by estimated damage."""
+    try:
+        table = evaluate(Catalog.load(data_dir), formula, RelationIndex.open(data_dir))
+    except ValueError as e:
+        raise click.UsageError(str(e)) from e
+
+    # Display summary
+    summary = Table(title=f"Damage ({FORMULAS[formula]})")
+    summary.add_column("#", style="yellow", justify="right")
+    summary.add_column("Character", style="cyan")
+    summary.add_column("Weapon", style="cyan")
+    summary.add_column("Refinement", justify="right")
+    summary.add_column("Damage", style="green", justify="right")
+
+    for position, (character, weapon, rank, value) in enumerate(table.ranked(limit), 1):
+        summary.add_row(str(position), character, weapon, f"R{rank + 1}", f"{value:,.0f}")
+
+    console.print(summary)
+    console.print(f"\n✓ Evaluated [bold green]{len(table)}[/bold green] combinations")
+    if output_file is not None:
+        rows = table.write_csv(output_file)
+        console.print(f"✓ {rows} ranked rows saved to: [bold green]{output_file}[/bold green]")
+
+
+@cli.command()
+@click.option(
+    "--input",
+    "-i",
+    "data_dir",
+    type=click.Path(path_type=Path),
+    default=Path("data/processed"),
+    help="Processed data directory",
+)
+@click.option("--host", default="127.0.0.1", show_default=True, help="Address to listen on")
+@click.option("--port", "-p", default=8000, show_default=True, help="Port to listen on")
+@click.option(
+    "--poll",
+    type=click.FloatRange(min=0),
+    default=2.0,
+    show_default=True,
+    help="Seconds between checks for changed data (0 disables reloading)",
+)
+def serve(data_dir: Path, host: str, port: int, poll: float):
+    """Serve the processed data as a read-only JSON API."""
+    server = DataServer(data_dir, poll_interval=poll)
+
+    # Display summary
+    table = Table(title="API")
+    table.add_column("Path", style="cyan")
+    table.add_column("Responses", style="green")
+
+    for category in ("characters", "weapons", "geniemon", "wedges"):
+        count = sum(path.startswith(f"/{category}/") for path in server.responses)
+        table.add_row(f"/{category}, /{category}/<key>", str(count + 1))
+
+    console.print(table)
+    console.print(f"\n✓ Serving on [bold green]http://{host}:{port}/[/bold green]")
+    try:
+        asyncio.run(server.serve(host, port))
+    except KeyboardInterrupt:
+        pass
+
+
 @cli.command("list")
 def list_command():
     """List available scrapers."""
@@ -417,6 +1173,15 @@ def list_command():
     table.add_row("weapon list", "Scrape weapon data", "✓ Available")
     table.add_row("geniemon list", "Scrape geniemon data", "✓ Available")
     table.add_row("demon-wedge list", "Scrape demon wedge data", "✓ Available")
+    table.add_row("cache stats", "Show raw page cache usage", "✓ Available")
+    table.add_row("cache prune", "Expire and evict cached pages", "✓ Available")
+    table.add_row("export sqlite", "Export processed data to SQLite", "✓ Available")
+    table.add_row("snapshot", "Bundle processed data into a binary snapshot", "✓ Available")
+    table.add_row("query [category] [filters]", "Filter processed data by field", "✓ Available")
+    table.add_row("search [text]", "Keyword search over skills, effects and lore", "✓ Available")
+    table.add_row("optimize", "Find the best demon wedge set per character", "✓ Available")
+    table.add_row("damage", "Rank characters x weapons x refinements by damage", "✓ Available")
+    table.add_row("serve", "Serve processed data as a JSON API", "✓ Available")
 
     console.print(table)
 
@@ -435,7 +1200,23 @@ def list_command():
     is_flag=True,
     help="Force fetch from URLs (ignore cache)",
 )
-def all(output_dir: Path, no_cache: bool):
+@click.option(
+    "--revalidate",
+    is_flag=True,
+    help="Revalidate cached pages with ETag/Last-Modified before using them",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["json", "ndjson"]),
+    default="json",
+    show_default=True,
+    help="Output format (ndjson writes one compact object per line as items are scraped)",
+)
+@pass_transport
+def all(
+    transport: Transport, output_dir: Path, no_cache: bool, revalidate: bool, output_format: str
+):
     """Run all available scrapers."""
     console.print("[bold yellow]Running all scrapers...[/bold yellow]\n")
 
@@ -443,14 +1224,20 @@ def all(output_dir: Path, no_cache: bool):
 
     # Characters
     try:
-        if no_cache:
-            cache_file = cache_dir / "characters.html"
-            if cache_file.exists():
-                cache_file.unlink()
-
         source = "https://boarhat.gg/games/duet-night-abyss/character/"
-        scraper = CharacterScraper(source, output_dir, cache_dir)
+        scraper = CharacterScraper(
+            source,
+            output_dir,
+            cache_dir,
+            transport,
+            revalidate=revalidate,
+            output_format=output_format,
+        )
+        if no_cache:
+            scraper.clear_cache()
         scraper.run()
+        _print_write_summary([scraper])
+        _update_indexes([scraper])
     except Exception as e:
         console.print(f"[red]✗ Error scraping characters: {e}[/red]")
 
@@ -0,0 +1,12 @@
+"""Lazy access to the processed dataset."""
+
+from .dataset import Dataset, Section
+from .manifest import MANIFEST_FILE, Manifest, SectionEntries
+
+__all__ = [
+    "MANIFEST_FILE",
+    "Dataset",
+    "Manifest",
+    "Section",
+    "SectionEntries",
+]
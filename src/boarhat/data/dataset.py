@@ -0,0 +1,210 @@
+"""On-demand access to the processed dataset, one record at a time."""
+
+import json
+import mmap
+import os
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any, overload
+
+from boarhat.models.catalog import DEFAULT_DATA_DIR, Catalog
+from boarhat.models.snapshot import MODELS
+
+from .manifest import Manifest, SectionEntries
+
+
+class Section(Sequence):
+    """
+    Lazy view of one section: each record is read and rebuilt when accessed.
+
+    Records are looked up by position or by key (the site slug for
+    characters and details, the name otherwise; wedge names repeat across
+    variants, so `find` returns all of them).
+    """
+
+    def __init__(self, dataset: "Dataset", name: str, entries: SectionEntries):
+        """
+        Initialize the view.
+
+        Args:
+            dataset: Dataset the records are read from
+            name: Section name
+            entries: Record locations from the manifest
+        """
+        self.dataset = dataset
+        self.name = name
+        self.entries = entries
+        self._positions: dict[str, list[int]] | None = None
+
+    def __len__(self) -> int:
+        """Number of records."""
+        return len(self.entries)
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Any]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """Model object of one record (or a slice of records)."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"{self.name} index out of range")
+        return self.dataset.record(self.name, index)
+
+    def keys(self) -> list[str]:
+        """Key of every record, in file order (no records are read)."""
+        return self.entries.keys
+
+    def positions(self, key: str) -> list[int]:
+        """Positions of the records with a key."""
+        if self._positions is None:
+            self._positions = {}
+            for i, k in enumerate(self.entries.keys):
+                self._positions.setdefault(k, []).append(i)
+        return self._positions.get(key, [])
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Model object of the first record with a key, or `default`."""
+        positions = self.positions(key)
+        return self[positions[0]] if positions else default
+
+    def find(self, key: str) -> list[Any]:
+        """Model objects of every record with a key."""
+        return [self[i] for i in self.positions(key)]
+
+
+class Dataset:
+    """
+    Processed dataset opened without loading it.
+
+    Opening reads only the manifest (record keys and byte ranges, see
+    `Manifest`). The scraper outputs are memory-mapped on first use and a
+    record is parsed from its own byte range when accessed, so a script
+    that touches a few entities neither waits for nor holds the rest. The
+    most recently used model objects are kept in an LRU cache.
+
+    Mappings stay open until `close` (or the end of a `with` block).
+
+    Example:
+        with Dataset.open(Path("data/processed")) as dataset:
+            detail = dataset["details"].get("berenica")
+            weapon = dataset["weapons"].get("Aurate Yore")
+    """
+
+    def __init__(self, data_dir: Path, manifest: Manifest, cache_size: int = 128):
+        """
+        Initialize the dataset.
+
+        Args:
+            data_dir: Processed data directory
+            manifest: Record locations in `data_dir`
+            cache_size: Model objects kept in memory (0 disables caching)
+        """
+        self.data_dir = data_dir
+        self.manifest = manifest
+        self.cache_size = cache_size
+        self.sections = {
+            name: Section(self, name, entries) for name, entries in manifest.sections.items()
+        }
+        self._maps: dict[int, mmap.mmap] = {}
+        self._cache: OrderedDict[tuple[str, int], Any] = OrderedDict()
+
+    @classmethod
+    def open(cls, path: Path = DEFAULT_DATA_DIR, cache_size: int = 128) -> "Dataset":
+        """
+        Open a processed data directory, building its manifest if missing or stale.
+
+        Args:
+            path: Processed data directory
+            cache_size: Model objects kept in memory (0 disables caching)
+
+        Returns:
+            The dataset
+        """
+        return cls(path, Manifest.open(path), cache_size)
+
+    def __getitem__(self, name: str) -> Section:
+        """Lazy view of a section."""
+        return self.sections[name]
+
+    def __contains__(self, name: object) -> bool:
+        """Whether the dataset has a section."""
+        return name in self.sections
+
+    def __iter__(self) -> Iterator[str]:
+        """Section names."""
+        return iter(self.sections)
+
+    def __enter__(self) -> "Dataset":
+        """Use the dataset in a `with` block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the dataset at the end of the block."""
+        self.close()
+
+    def record(self, section: str, index: int) -> Any:
+        """
+        Model object of one record, from the cache or read from its file.
+
+        Args:
+            section: Section name
+            index: Position in the section
+
+        Returns:
+            The model object
+        """
+        key = (section, index)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        entries = self.manifest.sections[section]
+        data = self._map(entries.file_ids[index])
+        raw = data[entries.spans[2 * index] : entries.spans[2 * index + 1]]
+        model = MODELS[section].from_dict(json.loads(raw))
+
+        if self.cache_size > 0:
+            self._cache[key] = model
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return model
+
+    def _map(self, file_id: int) -> mmap.mmap:
+        """
+        Memory map of one scraper output, opened on first use.
+
+        Raises:
+            ValueError: If the file changed since the manifest was built
+        """
+        if file_id not in self._maps:
+            name, size, mtime_ns = self.manifest.files[file_id]
+            with open(self.data_dir / name, "rb") as f:
+                stat = os.fstat(f.fileno())
+                if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+                    raise ValueError(f"{name} changed since the dataset was opened")
+                self._maps[file_id] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._maps[file_id]
+
+    def close(self) -> None:
+        """Unmap the files and clear the cache."""
+        for data in self._maps.values():
+            data.close()
+        self._maps.clear()
+        self._cache.clear()
+
+    def catalog(self) -> Catalog:
+        """Read every record as model objects."""
+        return Catalog(
+            characters=list(self["characters"]),
+            details={detail.slug: detail for detail in self["details"]},
+            weapons=list(self["weapons"]),
+            geniemon=list(self["geniemon"]),
+            wedges=list(self["wedges"]),
+        )
@@ -0,0 +1,229 @@
+"""Manifest of where each record sits in the scraper outputs."""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from boarhat.models.catalog import output_file
+from boarhat.query.storage import read_index, write_index
+
+MANIFEST_FILE = "manifest.json"
+FORMAT_VERSION = 1
+
+# Section -> scraper output stem, relative to the processed data directory
+SECTION_STEMS = {
+    "characters": "characters",
+    "weapons": "weapons",
+    "geniemon": "geniemon",
+    "wedges": "demon_wedges",
+}
+
+
+def record_key(section: str, record: dict[str, Any]) -> str:
+    """Lookup key of a record: the site slug for characters, otherwise the name."""
+    if section == "characters":
+        url: str = record["url"]
+        return url.rstrip("/").rsplit("/", 1)[-1]
+    key: str = record["slug"] if section == "details" else record["name"]
+    return key
+
+
+def _skip_space(text: str, pos: int) -> int:
+    """Position of the next non-whitespace character."""
+    while pos < len(text) and text[pos] in " \t\r\n":
+        pos += 1
+    return pos
+
+
+def json_spans(raw: bytes) -> list[tuple[int, int, dict[str, Any]]]:
+    """
+    Byte range and value of each record in a JSON array file.
+
+    Args:
+        raw: File contents
+
+    Returns:
+        (start, end, record) per element, in file order
+
+    Raises:
+        ValueError: If the contents are not a JSON array
+    """
+    text = raw.decode("utf-8")
+    decoder = json.JSONDecoder()
+    pos = _skip_space(text, 0)
+    if text[pos : pos + 1] != "[":
+        raise ValueError("Expected a JSON array")
+
+    spans = []
+    # Character positions are converted to byte offsets one gap at a time
+    char_pos = byte_pos = 0
+    pos = _skip_space(text, pos + 1)
+    while text[pos : pos + 1] != "]":
+        record, end = decoder.raw_decode(text, pos)
+        start_byte = byte_pos + len(text[char_pos:pos].encode("utf-8"))
+        end_byte = start_byte + len(text[pos:end].encode("utf-8"))
+        spans.append((start_byte, end_byte, record))
+        char_pos, byte_pos = end, end_byte
+
+        pos = _skip_space(text, end)
+        if text[pos : pos + 1] == ",":
+            pos = _skip_space(text, pos + 1)
+        elif text[pos : pos + 1] != "]":
+            raise ValueError(f"Expected ',' or ']' at character {pos}")
+    return spans
+
+
+def ndjson_spans(raw: bytes) -> list[tuple[int, int, dict[str, Any]]]:
+    """Byte range and value of each non-blank line of an NDJSON file."""
+    spans = []
+    start = 0
+    for line in raw.splitlines(keepends=True):
+        if line.strip():
+            spans.append((start, start + len(line), json.loads(line)))
+        start += len(line)
+    return spans
+
+
+def output_files(data_dir: Path) -> list[tuple[str, Path]]:
+    """(section, file) of every scraper output present in a processed data directory."""
+    stems = [(section, data_dir / stem) for section, stem in SECTION_STEMS.items()]
+    detail_dir = data_dir / "characters"
+    names = sorted({p.name.split(".", 1)[0] for p in detail_dir.glob("*_detail.*json")})
+    stems += [("details", detail_dir / name) for name in names]
+    return [(section, path) for section, stem in stems if (path := output_file(stem)) is not None]
+
+
+@dataclass(slots=True)
+class SectionEntries:
+    """
+    Location of every record of one section.
+
+    Record `i` is bytes `spans[2i]:spans[2i + 1]` of `files[file_ids[i]]`.
+    """
+
+    keys: list[str] = field(default_factory=list)
+    file_ids: list[int] = field(default_factory=list)
+    spans: list[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """Number of records."""
+        return len(self.keys)
+
+
+@dataclass(slots=True)
+class Manifest:
+    """
+    Record locations for a processed data directory.
+
+    `files` holds each scraper output's path (relative to the data
+    directory), size and mtime, so a manifest that no longer matches the
+    files is detected with one `stat` per file.
+
+    Example:
+        manifest = Manifest.open(Path("data/processed"))
+        manifest.sections["weapons"].keys  # weapon names, in file order
+    """
+
+    files: list[tuple[str, int, int]] = field(default_factory=list)
+    sections: dict[str, SectionEntries] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, data_dir: Path) -> "Manifest":
+        """
+        Scan the scraper outputs of a processed data directory.
+
+        Each file is parsed once to find where its records start and end;
+        no model objects are created.
+
+        Args:
+            data_dir: Processed data directory
+
+        Returns:
+            The manifest
+        """
+        manifest = cls(sections={name: SectionEntries() for name in (*SECTION_STEMS, "details")})
+        for section, path in output_files(data_dir):
+            stat = path.stat()  # Before reading: a file replaced meanwhile then looks stale
+            raw = path.read_bytes()
+            file_id = len(manifest.files)
+            manifest.files.append(
+                (path.relative_to(data_dir).as_posix(), stat.st_size, stat.st_mtime_ns)
+            )
+            spans = ndjson_spans(raw) if path.suffix == ".ndjson" else json_spans(raw)
+            entries = manifest.sections[section]
+            for start, end, record in spans:
+                entries.keys.append(record_key(section, record))
+                entries.file_ids.append(file_id)
+                entries.spans += (start, end)
+        return manifest
+
+    @classmethod
+    def open(cls, data_dir: Path) -> "Manifest":
+        """
+        Load the manifest saved next to the processed data, rebuilding it if missing or stale.
+
+        Args:
+            data_dir: Processed data directory
+
+        Returns:
+            The manifest
+        """
+        manifest_file = data_dir / MANIFEST_FILE
+        if manifest_file.exists():
+            try:
+                manifest = cls.load(manifest_file)
+            except ValueError:
+                pass
+            else:
+                if manifest.is_current(data_dir):
+                    return manifest
+        manifest = cls.build(data_dir)
+        manifest.save(manifest_file)
+        return manifest
+
+    @classmethod
+    def load(cls, path: Path) -> "Manifest":
+        """
+        Read a saved manifest.
+
+        Raises:
+            ValueError: If the file was written by an incompatible version
+        """
+        data = read_index(path, FORMAT_VERSION)
+        return cls(
+            files=[tuple(entry) for entry in data["files"]],
+            sections={
+                name: SectionEntries(entries["keys"], entries["file_ids"], entries["spans"])
+                for name, entries in data["sections"].items()
+            },
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the manifest next to the processed data."""
+        write_index(
+            path,
+            {
+                "version": FORMAT_VERSION,
+                "files": self.files,
+                "sections": {
+                    name: {
+                        "keys": entries.keys,
+                        "file_ids": entries.file_ids,
+                        "spans": entries.spans,
+                    }
+                    for name, entries in self.sections.items()
+                },
+            },
+        )
+
+    def is_current(self, data_dir: Path) -> bool:
+        """Whether the recorded files are exactly the scraper outputs on disk."""
+        expected = {path.relative_to(data_dir).as_posix() for _, path in output_files(data_dir)}
+        if {name for name, _, _ in self.files} != expected:
+            return False
+        for name, size, mtime_ns in self.files:
+            stat = (data_dir / name).stat()
+            if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+                return False
+        return True
@@ -0,0 +1,5 @@
+"""Exporters for the processed dataset."""
+
+from .sqlite import export_sqlite
+
+__all__ = ["export_sqlite"]
@@ -0,0 +1,347 @@
+"""Export the processed dataset to an indexed SQLite database."""
+
+import json
+import os
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+
+from boarhat.models.catalog import Catalog
+
+SCHEMA = """
+CREATE TABLE characters (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    element TEXT NOT NULL,
+    role TEXT NOT NULL,
+    rarity TEXT NOT NULL,
+    proficiency TEXT NOT NULL,  -- JSON array
+    features TEXT NOT NULL,     -- JSON array
+    tier_farming TEXT NOT NULL,
+    tier_boss TEXT NOT NULL,
+    image_url TEXT NOT NULL,
+    url TEXT NOT NULL
+);
+
+-- Detail pages are per slug; two list entries can share one page
+CREATE TABLE character_profiles (
+    slug TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    image_url TEXT NOT NULL,
+    gender TEXT,
+    birthplace TEXT,
+    birthday TEXT,
+    allegiance TEXT
+);
+
+CREATE TABLE character_base_stats (
+    slug TEXT NOT NULL REFERENCES character_profiles(slug),
+    position INTEGER NOT NULL,
+    stat TEXT NOT NULL,
+    level_1 TEXT NOT NULL,
+    level_max TEXT NOT NULL,
+    PRIMARY KEY (slug, position)
+);
+
+CREATE TABLE traits (
+    slug TEXT NOT NULL REFERENCES character_profiles(slug),
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    effect TEXT NOT NULL,
+    PRIMARY KEY (slug, position)
+);
+
+CREATE TABLE skills (
+    id INTEGER PRIMARY KEY,
+    slug TEXT NOT NULL REFERENCES character_profiles(slug),
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    description TEXT NOT NULL
+);
+
+CREATE TABLE skill_stats (
+    skill_id INTEGER NOT NULL REFERENCES skills(id),
+    stat TEXT NOT NULL,
+    level_1 TEXT NOT NULL,
+    level_max TEXT NOT NULL,
+    PRIMARY KEY (skill_id, stat)
+);
+
+CREATE TABLE weapons (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    element TEXT NOT NULL,
+    weapon_type TEXT NOT NULL,
+    attack_type TEXT NOT NULL,
+    image_url TEXT NOT NULL,
+    skill TEXT NOT NULL
+);
+
+-- kind is "base" (base_stats) or "attribute" (attributes)
+CREATE TABLE weapon_stats (
+    weapon_id INTEGER NOT NULL REFERENCES weapons(id),
+    kind TEXT NOT NULL,
+    stat TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (weapon_id, kind, stat)
+);
+
+-- Refinement vectors extracted from weapon skills
+CREATE TABLE weapon_skill_effects (
+    weapon_id INTEGER NOT NULL REFERENCES weapons(id),
+    position INTEGER NOT NULL,
+    stat TEXT NOT NULL,
+    unit TEXT NOT NULL,
+    ranks TEXT NOT NULL,  -- JSON array
+    PRIMARY KEY (weapon_id, position)
+);
+
+CREATE TABLE wedges (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    subtype TEXT NOT NULL,
+    rarity TEXT NOT NULL,
+    restriction TEXT NOT NULL,
+    element TEXT NOT NULL,
+    polarity TEXT NOT NULL,
+    image_url TEXT NOT NULL,
+    main_attributes TEXT NOT NULL,  -- JSON array
+    effects TEXT NOT NULL,          -- JSON array
+    tolerance TEXT NOT NULL,
+    track TEXT NOT NULL,
+    source TEXT NOT NULL
+);
+
+CREATE TABLE geniemon (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    element TEXT NOT NULL,
+    geniemon_type TEXT NOT NULL,
+    rarity TEXT NOT NULL,
+    image_url TEXT NOT NULL,
+    active_skill TEXT NOT NULL,
+    cooldown TEXT NOT NULL,
+    passive_skill TEXT NOT NULL,
+    ascensions TEXT NOT NULL,  -- JSON array
+    location TEXT NOT NULL,
+    lore TEXT NOT NULL
+);
+"""
+
+# Created after the bulk insert, which is faster than maintaining them row by row
+INDEXES = """
+CREATE INDEX idx_characters_slug ON characters(slug);
+CREATE INDEX idx_characters_element ON characters(element);
+CREATE INDEX idx_characters_rarity ON characters(rarity);
+CREATE INDEX idx_characters_role ON characters(role);
+CREATE INDEX idx_skills_slug ON skills(slug);
+CREATE INDEX idx_weapons_element ON weapons(element);
+CREATE INDEX idx_weapons_weapon_type ON weapons(weapon_type);
+CREATE INDEX idx_weapon_stats_stat ON weapon_stats(stat);
+CREATE INDEX idx_weapon_skill_effects_stat ON weapon_skill_effects(stat);
+CREATE INDEX idx_wedges_element ON wedges(element);
+CREATE INDEX idx_wedges_rarity ON wedges(rarity);
+CREATE INDEX idx_wedges_restriction ON wedges(restriction);
+CREATE INDEX idx_wedges_polarity ON wedges(polarity);
+CREATE INDEX idx_geniemon_element ON geniemon(element);
+CREATE INDEX idx_geniemon_rarity ON geniemon(rarity);
+"""
+
+
+def _json(value: object) -> str:
+    """Compact JSON for list columns."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _rows(catalog: Catalog) -> Iterator[tuple[str, str, list[tuple]]]:
+    """Yield (table, insert statement, rows) for every table."""
+    yield (
+        "characters",
+        "INSERT INTO characters VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (
+                i,
+                c.name,
+                c.url.rstrip("/").split("/")[-1],
+                c.element,
+                c.role,
+                c.rarity,
+                _json(c.proficiency),
+                _json(c.features),
+                c.tier.farming,
+                c.tier.boss,
+                c.image_url,
+                c.url,
+            )
+            for i, c in enumerate(catalog.characters, 1)
+        ],
+    )
+
+    details = list(catalog.details.values())
+    yield (
+        "character_profiles",
+        "INSERT INTO character_profiles VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [
+            (
+                d.slug,
+                d.name,
+                d.image_url,
+                d.profile.gender if d.profile else None,
+                d.profile.birthplace if d.profile else None,
+                d.profile.birthday if d.profile else None,
+                d.profile.allegiance if d.profile else None,
+            )
+            for d in details
+        ],
+    )
+    yield (
+        "character_base_stats",
+        "INSERT INTO character_base_stats VALUES (?, ?, ?, ?, ?)",
+        [
+            (d.slug, pos, s.stat, s.level_1, s.level_max)
+            for d in details
+            for pos, s in enumerate(d.base_stats)
+        ],
+    )
+    yield (
+        "traits",
+        "INSERT INTO traits VALUES (?, ?, ?, ?)",
+        [(d.slug, pos, t.name, t.effect) for d in details for pos, t in enumerate(d.traits)],
+    )
+
+    skills = [(d.slug, pos, s) for d in details for pos, s in enumerate(d.skills)]
+    yield (
+        "skills",
+        "INSERT INTO skills VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (i, slug, pos, s.name, s.type, s.description)
+            for i, (slug, pos, s) in enumerate(skills, 1)
+        ],
+    )
+    yield (
+        "skill_stats",
+        "INSERT INTO skill_stats VALUES (?, ?, ?, ?)",
+        [
+            (i, stat, values.get("level_1", ""), values.get("level_max", ""))
+            for i, (_, _, s) in enumerate(skills, 1)
+            for stat, values in s.stats.items()
+        ],
+    )
+
+    yield (
+        "weapons",
+        "INSERT INTO weapons VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [
+            (i, w.name, w.element, w.weapon_type, w.attack_type, w.image_url, w.skill)
+            for i, w in enumerate(catalog.weapons, 1)
+        ],
+    )
+    yield (
+        "weapon_stats",
+        "INSERT INTO weapon_stats VALUES (?, ?, ?, ?)",
+        [
+            (i, kind, stat, value)
+            for i, w in enumerate(catalog.weapons, 1)
+            for kind, stats in (("base", w.base_stats), ("attribute", w.attributes))
+            for stat, value in stats.items()
+        ],
+    )
+    yield (
+        "weapon_skill_effects",
+        "INSERT INTO weapon_skill_effects VALUES (?, ?, ?, ?, ?)",
+        [
+            (i, pos, e.stat, e.unit, _json(e.ranks))
+            for i, w in enumerate(catalog.weapons, 1)
+            for pos, e in enumerate(w.skill_effects)
+        ],
+    )
+
+    yield (
+        "wedges",
+        "INSERT INTO wedges VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (
+                i,
+                w.name,
+                w.subtype,
+                w.rarity,
+                w.restriction,
+                w.element,
+                w.polarity,
+                w.image_url,
+                _json(w.main_attributes),
+                _json(w.effects),
+                w.tolerance,
+                w.track,
+                w.source,
+            )
+            for i, w in enumerate(catalog.wedges, 1)
+        ],
+    )
+    yield (
+        "geniemon",
+        "INSERT INTO geniemon VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (
+                i,
+                g.name,
+                g.element,
+                g.geniemon_type,
+                g.rarity,
+                g.image_url,
+                g.active_skill,
+                g.cooldown,
+                g.passive_skill,
+                _json(g.ascensions),
+                g.location,
+                g.lore,
+            )
+            for i, g in enumerate(catalog.geniemon, 1)
+        ],
+    )
+
+
+def export_sqlite(catalog: Catalog, output_file: Path) -> dict[str, int]:
+    """
+    Build a SQLite database from a catalog.
+
+    The database is built in a temp file with all rows inserted in one
+    transaction, then moved over `output_file`, so readers never see a
+    partial database.
+
+    Args:
+        catalog: Dataset to export
+        output_file: Database file to create or replace
+
+    Returns:
+        Table name -> number of rows
+    """
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    # Let SQLite create the file, so it gets the usual permissions
+    tmp_name = output_file.with_name(f".{output_file.name}.{os.getpid()}.tmp")
+    tmp_name.unlink(missing_ok=True)
+
+    counts = {}
+    conn = sqlite3.connect(tmp_name)
+    try:
+        # Nothing reads the temp file until it is complete
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.executescript(SCHEMA)
+        with conn:
+            for table, statement, rows in _rows(catalog):
+                conn.executemany(statement, rows)
+                counts[table] = len(rows)
+        conn.executescript(INDEXES)
+        conn.execute("ANALYZE")
+        conn.commit()
+    except BaseException:
+        conn.close()
+        tmp_name.unlink(missing_ok=True)
+        raise
+    conn.close()
+
+    os.replace(tmp_name, output_file)
+    return counts
@@ -0,0 +1,16 @@
+"""Loadout optimization and theorycrafting."""
+
+from .damage import FORMULAS, DamageTable, Formula, evaluate
+from .optimizer import Candidate, Loadout, SlotLayout, best_wedges, optimize_roster
+
+__all__ = [
+    "FORMULAS",
+    "Candidate",
+    "DamageTable",
+    "Formula",
+    "Loadout",
+    "SlotLayout",
+    "best_wedges",
+    "evaluate",
+    "optimize_roster",
+]
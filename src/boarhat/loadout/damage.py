@@ -0,0 +1,263 @@
+"""Damage estimates for every character, compatible weapon and refinement rank at once."""
+
+import csv
+import math
+import operator
+import re
+from array import array
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from itertools import repeat
+from pathlib import Path
+from typing import Literal
+
+from boarhat.models.catalog import Catalog
+from boarhat.models.stats import WeaponEffects, parse_stat_value
+from boarhat.models.weapon import Weapon
+from boarhat.query.relations import RelationIndex
+
+Formula = Literal["attack", "skill"]
+
+FORMULAS: dict[str, str] = {
+    "attack": "(character ATK + weapon ATK) x (1 + ATK) x crit multiplier x ATK speed x multishot",
+    "skill": "character ATK x (1 + Character ATK) x (Skill DMG + Skill Damage)",
+}
+
+# Skill effects that feed each formula term, by the stat name on the weapon
+ATK_BONUS = ("ATK",)
+CHARACTER_ATK_BONUS = ("Character ATK",)
+SKILL_DMG_BONUS = ("Skill DMG", "Skill Damage")
+CRIT_CHANCE_BONUS = ("CRIT Chance",)
+CRIT_DAMAGE_BONUS = ("CRIT Damage",)
+
+# Max-level weapon ATK: the last number of "18 | 225.94" or "(18 | 225.94)"
+WEAPON_ATK = re.compile(r"([\d.]+)\)?\s*$")
+
+
+def _percent(text: str | None, default: float) -> float:
+    """A base stat string as a fraction ("26%" -> 0.26) or plain number ("1.25")."""
+    parsed = parse_stat_value(text) if text else None
+    if parsed is None:
+        return default
+    return parsed.value / 100 if parsed.unit == "percent" else parsed.value
+
+
+def _weapon_atk(weapon: Weapon) -> float:
+    """Max-level ATK of a weapon (its smash, slash or spike ATK), NaN if unknown."""
+    for key, value in weapon.base_stats.items():
+        if key.endswith("_atk") and (match := WEAPON_ATK.search(value)):
+            return float(match[1])
+    return math.nan
+
+
+def _combine(op: Callable[[float, float], float], *columns: array) -> array:
+    """Fold equal-length columns elementwise with `op` (the loop runs in `map`)."""
+    result = columns[0]
+    for column in columns[1:]:
+        result = array("d", map(op, result, column))
+    return result
+
+
+def _gather(values: array, ids: array) -> array:
+    """`values[i]` for each `i` in `ids`."""
+    return array("d", map(values.__getitem__, ids))
+
+
+def _plus_one(values: array) -> array:
+    """`1 + v` for each value."""
+    return array("d", map((1.0).__add__, values))
+
+
+@dataclass(slots=True)
+class DamageTable:
+    """
+    One damage estimate per (character, compatible weapon, refinement rank).
+
+    Rows are parallel arrays; `character` and `weapon` index the name lists
+    and `rank` is 0 for an unrefined weapon.
+    """
+
+    formula: str
+    characters: list[str] = field(default_factory=list)
+    weapons: list[str] = field(default_factory=list)
+    character: array = field(default_factory=lambda: array("I"))
+    weapon: array = field(default_factory=lambda: array("I"))
+    rank: array = field(default_factory=lambda: array("I"))
+    damage: array = field(default_factory=lambda: array("d"))
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return len(self.damage)
+
+    def ranked(self, limit: int | None = None) -> list[tuple[str, str, int, float]]:
+        """
+        Rows as (character, weapon, rank, damage), highest damage first.
+
+        Rows without an estimate (missing stats) are left out.
+        """
+        order = sorted(
+            (i for i, value in enumerate(self.damage) if not math.isnan(value)),
+            key=self.damage.__getitem__,
+            reverse=True,
+        )
+        return [
+            (
+                self.characters[self.character[i]],
+                self.weapons[self.weapon[i]],
+                self.rank[i],
+                self.damage[i],
+            )
+            for i in order[:limit]
+        ]
+
+    def write_csv(self, path: Path) -> int:
+        """
+        Write the ranked rows as CSV, with refinements numbered from 1.
+
+        Returns:
+            Number of rows written
+        """
+        rows = self.ranked()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["rank", "character", "weapon", "refinement", "damage"])
+            for position, (character, weapon, rank, damage) in enumerate(rows, 1):
+                writer.writerow([position, character, weapon, rank + 1, f"{damage:.2f}"])
+        return len(rows)
+
+
+def _bonus(effects: WeaponEffects, stats: tuple[str, ...], ranks: int) -> array:
+    """
+    Total bonus per (weapon, rank), row-major, as a fraction (20% -> 0.2).
+
+    Shorter refinement vectors keep their last value at higher ranks.
+    """
+    bonus = array("d", [0.0]) * (len(effects.names) * ranks)
+    for i, stat in enumerate(effects.stats):
+        if stat not in stats or effects.units[i] != "percent":
+            continue
+        base = effects.weapons[i] * ranks
+        value = 0.0
+        for rank in range(ranks):
+            step = effects.ranks[i * effects.width + rank] if rank < effects.width else math.nan
+            if not math.isnan(step):
+                value = step / 100
+            bonus[base + rank] += value
+    return bonus
+
+
+def evaluate(
+    catalog: Catalog, formula: Formula = "attack", relations: RelationIndex | None = None
+) -> DamageTable:
+    """
+    Evaluate a damage formula for every character with every weapon it can use.
+
+    The (character, weapon, rank) rows are laid out as index arrays first;
+    every formula term is then a whole-column gather or elementwise
+    operation, so no per-row Python code runs during evaluation. Weapon
+    skill percentages scale the matching base stat; crits use the expected
+    multiplier `1 + min(crit chance, 1) x (crit damage - 1)`. The results
+    compare loadouts with each other and are not in-game damage numbers.
+
+    Args:
+        catalog: Loaded dataset
+        formula: "attack" or "skill" (see `FORMULAS`)
+        relations: Relations built from `catalog` (default: built here)
+
+    Returns:
+        The table, in (character, weapon, rank) order
+
+    Raises:
+        ValueError: If the formula is unknown, or no weapon has skill
+            effects (outputs scraped before refinement vectors existed)
+    """
+    if formula not in FORMULAS:
+        raise ValueError(f"Unknown formula {formula!r} (available: {', '.join(FORMULAS)})")
+    if relations is None or not relations.matches(catalog):
+        relations = RelationIndex.build(catalog)
+
+    effects = catalog.weapon_effects()
+    if not effects.width:
+        raise ValueError("No weapon has skill effects; re-run the weapon scraper")
+    ranks = effects.width
+    table = DamageTable(
+        formula, [c.name for c in catalog.characters], [w.name for w in catalog.weapons]
+    )
+
+    # Row layout
+    adjacency = relations.character_weapons
+    for character in range(len(adjacency)):
+        for weapon in adjacency[character]:
+            table.character.extend([character] * ranks)
+            table.weapon.extend([weapon] * ranks)
+            table.rank.extend(range(ranks))
+    weapon_rank = array("I", map(operator.add, map(ranks.__mul__, table.weapon), table.rank))
+
+    # Per-character and per-weapon columns
+    matrix = catalog.stat_matrix()
+    character_atk = array("d")
+    skill_dmg = array("d")
+    for c in catalog.characters:
+        slug = c.url.rstrip("/").split("/")[-1]
+        has_detail = slug in matrix.slugs
+        atk_name = f"{c.element} ATK"
+        character_atk.append(
+            matrix.value(slug, atk_name) if has_detail and atk_name in matrix.stats else math.nan
+        )
+        skill_dmg.append(
+            matrix.value(slug, "Skill DMG") / 100
+            if has_detail and "Skill DMG" in matrix.stats
+            else math.nan
+        )
+
+    if formula == "skill":
+        table.damage = _combine(
+            operator.mul,
+            _gather(character_atk, table.character),
+            _plus_one(_gather(_bonus(effects, CHARACTER_ATK_BONUS, ranks), weapon_rank)),
+            _combine(
+                operator.add,
+                _gather(skill_dmg, table.character),
+                _gather(_bonus(effects, SKILL_DMG_BONUS, ranks), weapon_rank),
+            ),
+        )
+        return table
+
+    weapons = catalog.weapons
+    weapon_atk = array("d", map(_weapon_atk, weapons))
+    crit_chance = array("d", (_percent(w.base_stats.get("crit_chance"), 0.0) for w in weapons))
+    crit_damage = array("d", (_percent(w.base_stats.get("crit_damage"), 1.0) for w in weapons))
+    speed = array("d", (_percent(w.base_stats.get("atk_speed"), 1.0) for w in weapons))
+    multishot = array("d", (_percent(w.base_stats.get("multishot"), 1.0) for w in weapons))
+
+    chance = _combine(
+        operator.mul,
+        _gather(crit_chance, table.weapon),
+        _plus_one(_gather(_bonus(effects, CRIT_CHANCE_BONUS, ranks), weapon_rank)),
+    )
+    crit_bonus = _combine(
+        operator.mul,
+        _gather(crit_damage, table.weapon),
+        _plus_one(_gather(_bonus(effects, CRIT_DAMAGE_BONUS, ranks), weapon_rank)),
+    )
+    crit_multiplier = _plus_one(
+        _combine(
+            operator.mul,
+            array("d", map(min, chance, repeat(1.0))),
+            array("d", map((1.0).__rsub__, crit_bonus)),
+        )
+    )
+    table.damage = _combine(
+        operator.mul,
+        _combine(
+            operator.add,
+            _gather(character_atk, table.character),
+            _gather(weapon_atk, table.weapon),
+        ),
+        _plus_one(_gather(_bonus(effects, ATK_BONUS, ranks), weapon_rank)),
+        crit_multiplier,
+        _gather(speed, table.weapon),
+        _gather(multishot, table.weapon),
+    )
+    return table
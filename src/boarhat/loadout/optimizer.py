@@ -0,0 +1,330 @@
+"""Branch-and-bound search for the demon wedge set that maximizes one stat."""
+
+import heapq
+import math
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from boarhat.models.catalog import Catalog
+from boarhat.models.demon_wedge import DemonWedge
+from boarhat.models.enums import Unit
+from boarhat.models.stats import StatMatrix, parse_attribute
+from boarhat.query.relations import RelationIndex
+
+
+@dataclass(frozen=True, slots=True)
+class SlotLayout:
+    """
+    Wedge slots of a character.
+
+    A wedge in a slot of its own polarity costs half its tolerance,
+    rounded up; in any other slot it costs its full tolerance.
+    """
+
+    slots: int = 8
+    capacity: int = 60  # Total tolerance
+    polarities: tuple[str, ...] = ()  # Polarity of each polarized slot; the rest are neutral
+
+    def __post_init__(self):
+        """Validate the layout."""
+        if self.slots < 0 or self.capacity < 0:
+            raise ValueError("Slots and capacity must not be negative")
+        if len(self.polarities) > self.slots:
+            raise ValueError(f"{len(self.polarities)} polarized slots but only {self.slots} slots")
+
+
+@dataclass(frozen=True, slots=True)
+class Candidate:
+    """A wedge that contributes to the optimized stat."""
+
+    wedge: int  # Position in `Catalog.wedges`
+    name: str
+    polarity: str
+    tolerance: int
+    value: float
+
+
+@dataclass(slots=True)
+class Loadout:
+    """Best wedge set found for one character."""
+
+    character: str
+    stat: str
+    value: float  # Total bonus from the wedges (percentage points for % stats)
+    tolerance: int  # Tolerance used
+    wedges: list[int] = field(default_factory=list)  # Positions in `Catalog.wedges`
+    nodes: int = 0  # Search nodes expanded
+    stat_total: float | None = None  # Max-level base stat with the bonus, if known
+
+
+def parse_tolerance(wedge: DemonWedge) -> int | None:
+    """Tolerance cost of a wedge, or None if the page does not give a number."""
+    try:
+        return int(wedge.tolerance)
+    except ValueError:
+        return None
+
+
+def wedge_value(wedge: DemonWedge, stat: str) -> float:
+    """Total bonus of a wedge's main attributes to one stat (case-insensitive)."""
+    target = stat.casefold()
+    total = 0.0
+    for attribute in wedge.main_attributes:
+        parsed = parse_attribute(attribute)
+        if parsed is not None and parsed[0].casefold() == target:
+            total += parsed[1].value
+    return total
+
+
+def candidates(wedges: Sequence[DemonWedge], ids: Iterable[int], stat: str) -> list[Candidate]:
+    """Wedges among `ids` with a known tolerance and a positive bonus to the stat."""
+    result = []
+    for i in ids:
+        tolerance = parse_tolerance(wedges[i])
+        value = wedge_value(wedges[i], stat)
+        if tolerance is not None and value > 0:
+            result.append(Candidate(i, wedges[i].name, wedges[i].polarity, tolerance, value))
+    return result
+
+
+class _Search:
+    """
+    Depth-first branch and bound over wedge groups.
+
+    Variants of one wedge (same name, other rarity or polarity) form a
+    group, of which at most one is equipped. Groups are visited in order
+    of their best value per tolerance; at each group the search takes
+    one variant or skips the group.
+
+    Pruning:
+        - Bound: the current value plus the smaller of two relaxations of
+          the rest (a fractional knapsack over the remaining variants at
+          their cheapest cost, and the best values that fit in the
+          remaining slots) cannot beat the best loadout found so far
+        - Memo: a state (next group, slots used, tolerance used, wedges in
+          polarized slots) already reached with at least this value
+    """
+
+    def __init__(self, options: Sequence[Candidate], layout: SlotLayout):
+        """Group and order the candidates."""
+        self.layout = layout
+        self.discount_slots = {p: layout.polarities.count(p) for p in set(layout.polarities)}
+
+        groups: dict[str, list[Candidate]] = {}
+        for option in options:
+            groups.setdefault(option.name, []).append(option)
+        self.groups = sorted(
+            (self._undominated(group) for group in groups.values()),
+            key=lambda group: max(self.ratio(c) for c in group),
+            reverse=True,
+        )
+
+        # Per group start: the remaining variants, best value per tolerance first
+        self.rest: list[list[Candidate]] = []
+        for start in range(len(self.groups)):
+            variants = [c for group in self.groups[start:] for c in group]
+            variants.sort(key=self.ratio, reverse=True)
+            self.rest.append(variants)
+        self.rest.append([])
+
+        # Per group start: the best value of each remaining group, highest first
+        self.best_values = [
+            sorted((max(c.value for c in group) for group in self.groups[start:]), reverse=True)
+            for start in range(len(self.groups) + 1)
+        ]
+
+        self.best_value = 0.0
+        self.best: tuple[Candidate, ...] = ()
+        self.memo: dict[tuple, float] = {}
+        self.nodes = 0
+
+    def min_cost(self, candidate: Candidate) -> int:
+        """Tolerance of a candidate in the cheapest slot it can take."""
+        if self.discount_slots.get(candidate.polarity):
+            return math.ceil(candidate.tolerance / 2)
+        return candidate.tolerance
+
+    def ratio(self, candidate: Candidate) -> float:
+        """Value per tolerance at the cheapest cost; infinite for free wedges."""
+        cost = self.min_cost(candidate)
+        return candidate.value / cost if cost else math.inf
+
+    def _undominated(self, group: list[Candidate]) -> list[Candidate]:
+        """Variants not beaten on both value and cost by another variant, best first."""
+        kept: list[Candidate] = []
+        for c in sorted(group, key=lambda c: (-c.value, c.tolerance)):
+            if not any(
+                k.value >= c.value
+                and (
+                    k.tolerance <= self.min_cost(c)
+                    or (k.polarity == c.polarity and k.tolerance <= c.tolerance)
+                )
+                for k in kept
+            ):
+                kept.append(c)
+        return kept
+
+    def bound(self, start: int, slots_left: int, capacity_left: int) -> float:
+        """Upper bound on the value that groups from `start` can add."""
+        by_slots = sum(self.best_values[start][:slots_left])
+
+        by_capacity = 0.0
+        for c in self.rest[start]:
+            cost = self.min_cost(c)
+            if cost <= capacity_left:
+                by_capacity += c.value
+                capacity_left -= cost
+            else:
+                by_capacity += c.value * capacity_left / cost
+                break
+            if by_capacity >= by_slots:
+                break
+        return min(by_slots, by_capacity)
+
+    def cost(self, full: int, held: dict[str, tuple[int, ...]]) -> int:
+        """
+        Tolerance of a wedge set.
+
+        Args:
+            full: Total tolerance of the set at full cost
+            held: Per polarity with slots, the tolerances of the wedges in
+                those slots (the largest ones, which save the most)
+        """
+        return full - sum(t // 2 for tolerances in held.values() for t in tolerances)
+
+    def run(
+        self,
+        start: int = 0,
+        chosen: tuple[Candidate, ...] = (),
+        value: float = 0.0,
+        full: int = 0,
+        held: dict[str, tuple[int, ...]] | None = None,
+    ) -> None:
+        """Search from one partial loadout, recording the best complete one."""
+        held = held or {}
+        self.nodes += 1
+        cost = self.cost(full, held)
+        if value > self.best_value:
+            self.best_value, self.best = value, chosen
+
+        slots_left = self.layout.slots - len(chosen)
+        if start == len(self.groups) or slots_left == 0:
+            return
+        if value + self.bound(start, slots_left, self.layout.capacity - cost) <= self.best_value:
+            return
+
+        key = (start, len(chosen), cost, tuple(sorted(held.items())))
+        if self.memo.get(key, -1.0) >= value:
+            return
+        self.memo[key] = value
+
+        for c in self.groups[start]:
+            next_held = held
+            if self.discount_slots.get(c.polarity):
+                tolerances = sorted((*held.get(c.polarity, ()), c.tolerance), reverse=True)
+                next_held = {
+                    **held,
+                    c.polarity: tuple(tolerances[: self.discount_slots[c.polarity]]),
+                }
+            if self.cost(full + c.tolerance, next_held) <= self.layout.capacity:
+                self.run(start + 1, (*chosen, c), value + c.value, full + c.tolerance, next_held)
+        self.run(start + 1, chosen, value, full, held)
+
+
+def best_wedges(
+    options: Sequence[Candidate], layout: SlotLayout
+) -> tuple[float, int, list[Candidate], int]:
+    """
+    Find the wedge set with the highest total value that fits the layout.
+
+    Args:
+        options: Candidate wedges
+        layout: Slots and tolerance available
+
+    Returns:
+        (total value, tolerance used, wedges, search nodes expanded)
+    """
+    search = _Search(options, layout)
+    search.run()
+
+    full = sum(c.tolerance for c in search.best)
+    held = {}
+    for polarity, count in search.discount_slots.items():
+        held[polarity] = tuple(
+            heapq.nlargest(count, (c.tolerance for c in search.best if c.polarity == polarity))
+        )
+    return search.best_value, search.cost(full, held), list(search.best), search.nodes
+
+
+def _with_bonus(matrix: StatMatrix, slug: str, element: str, stat: str, bonus: float):
+    """
+    Max-level base stat of a character with a percentage bonus applied.
+
+    Flat stats (ATK, HP) are scaled by the bonus; percentage stats (Skill
+    DMG) have it added. The element-specific name ("Pyro ATK") is tried
+    too. None if the character has no such base stat.
+    """
+    if slug not in matrix.slugs:
+        return None
+    for name in (stat, f"{element} {stat}"):
+        if name in matrix.stats:
+            value = matrix.value(slug, name)
+            if math.isnan(value):
+                continue
+            if matrix.units[matrix.stats.index(name)] == Unit.PERCENT:
+                return value + bonus
+            return value * (1 + bonus / 100)
+    return None
+
+
+def optimize_roster(
+    catalog: Catalog,
+    stat: str,
+    layout: SlotLayout | None = None,
+    characters: Iterable[str] | None = None,
+    relations: RelationIndex | None = None,
+    workers: int | None = None,
+) -> list[Loadout]:
+    """
+    Find the best wedge set for each character.
+
+    Args:
+        catalog: Loaded dataset
+        stat: Stat to maximize, as named in wedge main attributes ("ATK", "Skill DMG")
+        layout: Slots and tolerance (default: `SlotLayout()`)
+        characters: Names of the characters to optimize (default: all)
+        relations: Relations built from `catalog` (default: built here)
+        workers: Search in this many processes (default: in-process)
+
+    Returns:
+        One loadout per character, in catalog order
+
+    Raises:
+        KeyError: If a character name is unknown
+    """
+    layout = layout or SlotLayout()
+    if relations is None or not relations.matches(catalog):
+        relations = RelationIndex.build(catalog)
+    ids = (
+        list(range(len(catalog.characters)))
+        if characters is None
+        else [relations.character(name) for name in characters]
+    )
+    options = [candidates(catalog.wedges, relations.character_wedges[i], stat) for i in ids]
+
+    if workers is None:
+        results = [best_wedges(o, layout) for o in options]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(best_wedges, options, [layout] * len(options)))
+
+    matrix = catalog.stat_matrix()
+    loadouts = []
+    for i, (value, tolerance, chosen, nodes) in zip(ids, results, strict=True):
+        character = catalog.characters[i]
+        slug = character.url.rstrip("/").split("/")[-1]
+        loadout = Loadout(character.name, stat, value, tolerance, [c.wedge for c in chosen], nodes)
+        loadout.stat_total = _with_bonus(matrix, slug, character.element, stat, value)
+        loadouts.append(loadout)
+    return loadouts
@@ -1,7 +1,47 @@
 """Data models for Duet Night Abyss entities."""
 
+from .catalog import Catalog
 from .character import Character, CharacterTier
+from .enums import (
+    AttackType,
+    CharacterRarity,
+    Element,
+    GeniemonType,
+    Polarity,
+    Rarity,
+    Restriction,
+    Role,
+    Unit,
+    WeaponType,
+)
 from .geniemon import Geniemon
-from .weapon import Weapon
+from .snapshot import Snapshot, load_snapshot, write_snapshot
+from .stats import StatMatrix, StatValue, WeaponEffects, parse_attribute, parse_stat_value
+from .weapon import SkillEffect, Weapon
 
-__all__ = ["Character", "CharacterTier", "Weapon", "Geniemon"]
+__all__ = [
+    "Catalog",
+    "Character",
+    "CharacterTier",
+    "Weapon",
+    "Geniemon",
+    "Snapshot",
+    "load_snapshot",
+    "write_snapshot",
+    "Element",
+    "Role",
+    "CharacterRarity",
+    "Rarity",
+    "WeaponType",
+    "AttackType",
+    "GeniemonType",
+    "Restriction",
+    "Polarity",
+    "StatMatrix",
+    "StatValue",
+    "Unit",
+    "WeaponEffects",
+    "SkillEffect",
+    "parse_attribute",
+    "parse_stat_value",
+]
@@ -0,0 +1,185 @@
+"""Base class and generated serializers for data models."""
+
+import dataclasses
+import sys
+import types
+from typing import TYPE_CHECKING, Any, TypeVar, Union, get_args, get_origin, get_type_hints
+
+from .enums import Interned
+
+M = TypeVar("M", bound="Model")
+
+
+# Docstrings of the generated methods
+_DOCS = {
+    "to_dict": "Convert to dictionary.",
+    "from_dict": "Create from dictionary.",
+    "__post_init__": "Share categorical values.",
+}
+
+
+class Model:
+    """
+    Base class for data models.
+
+    Subclasses are slotted dataclasses decorated with `@serializable`,
+    which generates `to_dict`, `from_dict` and `__post_init__` from the
+    fields. `__post_init__` is defined here so that every dataclass
+    `__init__` calls it.
+    """
+
+    __slots__ = ()
+
+    def __post_init__(self) -> None:
+        """Share categorical values (replaced by `@serializable` when there are any)."""
+
+    if TYPE_CHECKING:
+
+        def to_dict(self) -> dict[str, Any]: ...
+
+        @classmethod
+        def from_dict(cls: type[M], data: dict[str, Any]) -> M: ...
+
+
+def required(*, missing: Any) -> Any:
+    """
+    Required field that `from_dict` fills with `missing` when the key is absent.
+
+    Args:
+        missing: Value used by `from_dict` when the key is absent
+    """
+    return dataclasses.field(metadata={"missing": missing})
+
+
+def category(enum: type[Interned] | None = None, *, missing: str = "Unknown") -> Any:
+    """
+    Required categorical field.
+
+    `from_dict` fills in `missing` when the key is absent. However the
+    object is created, its value is shared through `enum` (or `sys.intern`
+    when no enum is given), so thousands of records hold one copy of each
+    value.
+
+    Args:
+        enum: Enum holding the known values
+        missing: Value used by `from_dict` when the key is absent
+    """
+    return dataclasses.field(metadata={"enum": enum, "missing": missing, "intern": True})
+
+
+def _model_type(hint: Any) -> tuple[type | None, str]:
+    """
+    Classify a field annotation.
+
+    Returns:
+        (model class, shape), where shape is "model", "optional" or "list"
+        when the field holds models, and "" with no class otherwise
+    """
+    if isinstance(hint, type) and issubclass(hint, Model):
+        return hint, "model"
+    origin = get_origin(hint)
+    args = get_args(hint)
+    if origin in (Union, types.UnionType) and type(None) in args:
+        inner = [a for a in args if a is not type(None)]
+        if len(inner) == 1 and isinstance(inner[0], type) and issubclass(inner[0], Model):
+            return inner[0], "optional"
+    if origin is list and args and isinstance(args[0], type) and issubclass(args[0], Model):
+        return args[0], "list"
+    return None, ""
+
+
+def serializable(cls: type[M]) -> type[M]:
+    """
+    Generate `to_dict`, `from_dict` and `__post_init__` for a dataclass model.
+
+    Keys follow field order. Nested models (plain, optional, or in a list)
+    are converted recursively. In `from_dict`, a required field must be
+    present unless it has a `missing` value (see `required` and
+    `category`); any other absent field gets its default. `__post_init__`
+    shares the values of `category` fields.
+
+    Raises:
+        TypeError: If the class is not a dataclass yet
+    """
+    if not dataclasses.is_dataclass(cls):
+        raise TypeError(f"{cls.__qualname__} must be a dataclass (apply @dataclass first)")
+    hints = get_type_hints(cls)
+    namespace: dict[str, Any] = {"_intern": sys.intern}
+    to_items = []
+    from_args = []
+    coerce_lines = []
+
+    for i, f in enumerate(dataclasses.fields(cls)):
+        key = repr(f.name)
+        model, shape = _model_type(hints[f.name])
+        if model is not None:
+            namespace[f"_model{i}"] = model
+
+        # to_dict value
+        if shape == "model":
+            to_value = f"self.{f.name}.to_dict()"
+        elif shape == "optional":
+            to_value = f"None if (v := self.{f.name}) is None else v.to_dict()"
+        elif shape == "list":
+            to_value = f"[x.to_dict() for x in self.{f.name}]"
+        else:
+            to_value = f"self.{f.name}"
+        to_items.append(f"{key}: {to_value}")
+
+        # from_dict raw value
+        if "missing" in f.metadata:
+            raw = f"data.get({key}, {f.metadata['missing']!r})"
+        elif f.default is not dataclasses.MISSING:
+            namespace[f"_default{i}"] = f.default
+            raw = f"data.get({key}, _default{i})"
+        elif f.default_factory is not dataclasses.MISSING:
+            if shape == "model":
+                raw = f"data.get({key}, {{}})"
+            else:
+                namespace[f"_factory{i}"] = f.default_factory
+                raw = f"data[{key}] if {key} in data else _factory{i}()"
+        else:
+            raw = f"data[{key}]"
+
+        # __post_init__ sharing, so scraped and loaded objects hold the same values
+        if f.metadata.get("enum") is not None:
+            # Inlined `Interned.coerce`
+            namespace[f"_members{i}"] = f.metadata["enum"]._value2member_map_
+            coerce_lines.append(
+                f"    self.{f.name} = "
+                f"m if (m := _members{i}.get(v := self.{f.name})) is not None else _intern(v)\n"
+            )
+        elif f.metadata.get("intern"):
+            coerce_lines.append(f"    self.{f.name} = _intern(self.{f.name})\n")
+
+        # from_dict conversion
+        if shape == "model":
+            value = f"_model{i}.from_dict({raw})"
+        elif shape == "optional":
+            value = f"None if (v := {raw}) is None else _model{i}.from_dict(v)"
+        elif shape == "list":
+            value = f"[_model{i}.from_dict(x) for x in ({raw})]"
+        else:
+            value = raw
+        from_args.append(f"{f.name}=({value})")
+
+    source = (
+        "def to_dict(self):\n"
+        f"    return {{{', '.join(to_items)}}}\n"
+        "\n"
+        "def from_dict(cls, data):\n"
+        f"    return cls({', '.join(from_args)})\n"
+    )
+    names = ["to_dict", "from_dict"]
+    if coerce_lines:
+        source += "\ndef __post_init__(self):\n" + "".join(coerce_lines)
+        names.append("__post_init__")
+    exec(compile(source, f"<serializers for {cls.__qualname__}>", "exec"), namespace)
+
+    for name in names:
+        method = namespace[name]
+        method.__qualname__ = f"{cls.__qualname__}.{name}"
+        method.__module__ = cls.__module__
+        method.__doc__ = _DOCS[name]
+        setattr(cls, name, classmethod(method) if name == "from_dict" else method)
+    return cls
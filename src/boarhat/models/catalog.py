@@ -0,0 +1,102 @@
+"""Loader for the whole processed dataset."""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .character import Character
+from .character_detail import CharacterDetail
+from .demon_wedge import DemonWedge
+from .geniemon import Geniemon
+from .stats import StatMatrix, WeaponEffects
+from .weapon import Weapon
+
+DEFAULT_DATA_DIR = Path("data/processed")
+
+
+def output_file(stem: Path) -> Path | None:
+    """
+    The scraper output written for a stem, as `<stem>.json` or `<stem>.ndjson`.
+
+    If both exist (left over from a run in the other format), the newer
+    one is the current output.
+
+    Args:
+        stem: Output path without extension
+
+    Returns:
+        The file, or None if neither exists
+    """
+    files = [stem.with_name(f"{stem.name}{suffix}") for suffix in (".json", ".ndjson")]
+    return max(
+        (path for path in files if path.exists()),
+        key=lambda path: path.stat().st_mtime_ns,
+        default=None,
+    )
+
+
+def read_records(stem: Path) -> list[dict[str, Any]]:
+    """
+    Read a scraper output file written as `<stem>.json` or `<stem>.ndjson`.
+
+    Args:
+        stem: Output path without extension
+
+    Returns:
+        The records, or an empty list if neither file exists
+    """
+    path = output_file(stem)
+    if path is None:
+        return []
+    with open(path, encoding="utf-8") as f:
+        if path.suffix == ".ndjson":
+            return [json.loads(line) for line in f if line.strip()]
+        records: list[dict[str, Any]] = json.load(f)
+    return records
+
+
+@dataclass
+class Catalog:
+    """All scraped entities, as model objects."""
+
+    characters: list[Character] = field(default_factory=list)
+    details: dict[str, CharacterDetail] = field(default_factory=dict)  # slug -> detail
+    weapons: list[Weapon] = field(default_factory=list)
+    geniemon: list[Geniemon] = field(default_factory=list)
+    wedges: list[DemonWedge] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, data_dir: Path = DEFAULT_DATA_DIR) -> "Catalog":
+        """
+        Load every scraper output under a processed data directory.
+
+        Args:
+            data_dir: Directory written by the scrapers (e.g. `data/processed`)
+
+        Returns:
+            Catalog with whatever outputs exist
+        """
+        details = {}
+        detail_dir = data_dir / "characters"
+        stems = sorted({p.name.split(".", 1)[0] for p in detail_dir.glob("*_detail.*json")})
+        for stem in stems:
+            for record in read_records(detail_dir / stem):
+                detail = CharacterDetail.from_dict(record)
+                details[detail.slug] = detail
+
+        return cls(
+            characters=[Character.from_dict(r) for r in read_records(data_dir / "characters")],
+            details=details,
+            weapons=[Weapon.from_dict(r) for r in read_records(data_dir / "weapons")],
+            geniemon=[Geniemon.from_dict(r) for r in read_records(data_dir / "geniemon")],
+            wedges=[DemonWedge.from_dict(r) for r in read_records(data_dir / "demon_wedges")],
+        )
+
+    def stat_matrix(self) -> StatMatrix:
+        """Numeric base and skill stats of every character detail."""
+        return StatMatrix.from_details(self.details.values())
+
+    def weapon_effects(self) -> WeaponEffects:
+        """Refinement vectors of every weapon skill effect."""
+        return WeaponEffects.from_weapons(self.weapons)
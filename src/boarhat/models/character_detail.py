@@ -2,9 +2,12 @@
 
 from dataclasses import dataclass, field
 
+from .base import Model, required, serializable
 
-@dataclass
-class Profile:
+
+@serializable
+@dataclass(slots=True)
+class Profile(Model):
     """Character profile information."""
 
     gender: str = ""
@@ -13,16 +16,18 @@ class Profile:
     allegiance: str = ""
 
 
-@dataclass
-class Trait:
+@serializable
+@dataclass(slots=True)
+class Trait(Model):
     """Character trait."""
 
     name: str
     effect: str
 
 
-@dataclass
-class BaseStat:
+@serializable
+@dataclass(slots=True)
+class BaseStat(Model):
     """Base stat information."""
 
     stat: str
@@ -30,8 +35,9 @@ class BaseStat:
     level_max: str
 
 
-@dataclass
-class Skill:
+@serializable
+@dataclass(slots=True)
+class Skill(Model):
     """Skill information."""
 
     name: str
@@ -42,46 +48,16 @@ class Skill:
     )  # stat_name -> {level_1, level_max}
 
 
-@dataclass
-class CharacterDetail:
+@serializable
+@dataclass(slots=True)
+class CharacterDetail(Model):
     """Detailed character information from individual character pages."""
 
     name: str
-    slug: str  # URL slug (e.g., "berenica")
-    url: str
+    slug: str = required(missing="")  # URL slug (e.g., "berenica")
+    url: str = required(missing="")
     image_url: str = ""
     profile: Profile | None = None
     traits: list[Trait] = field(default_factory=list)
     base_stats: list[BaseStat] = field(default_factory=list)
     skills: list[Skill] = field(default_factory=list)
-
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return {
-            "name": self.name,
-            "slug": self.slug,
-            "url": self.url,
-            "image_url": self.image_url,
-            "profile": {
-                "gender": self.profile.gender if self.profile else "",
-                "birthplace": self.profile.birthplace if self.profile else "",
-                "birthday": self.profile.birthday if self.profile else "",
-                "allegiance": self.profile.allegiance if self.profile else "",
-            }
-            if self.profile
-            else None,
-            "traits": [{"name": t.name, "effect": t.effect} for t in self.traits],
-            "base_stats": [
-                {"stat": s.stat, "level_1": s.level_1, "level_max": s.level_max}
-                for s in self.base_stats
-            ],
-            "skills": [
-                {
-                    "name": s.name,
-                    "type": s.type,
-                    "description": s.description,
-                    "stats": s.stats,
-                }
-                for s in self.skills
-            ],
-        }
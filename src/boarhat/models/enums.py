@@ -0,0 +1,129 @@
+"""Shared values for categorical model fields."""
+
+import sys
+from enum import Enum
+
+
+class Interned(str, Enum):
+    """
+    Categorical string value shared by every object that uses it.
+
+    Members are plain strings to everything else (equality, hashing, JSON,
+    formatting), so outputs are unchanged. Values scraped from the site
+    that are not members yet (new elements, typos on the page) are kept
+    as interned strings rather than rejected.
+    """
+
+    __str__ = str.__str__
+
+    @classmethod
+    def coerce(cls, value: str) -> "Interned | str":
+        """The member with this value, or the value as an interned string."""
+        member = cls._value2member_map_.get(value)
+        if member is None:
+            return sys.intern(value)
+        return member  # type: ignore[return-value]
+
+
+class Element(Interned):
+    """Element of a character, weapon, geniemon or demon wedge."""
+
+    PYRO = "Pyro"
+    ANEMO = "Anemo"
+    HYDRO = "Hydro"
+    LUMINO = "Lumino"
+    ELECTRO = "Electro"
+    UMBRO = "Umbro"
+    NEUTRAL = "Neutral"
+    UNKNOWN = "Unknown"
+
+
+class Role(Interned):
+    """Character role."""
+
+    DPS = "DPS"
+    SUPPORT = "Support"
+    UNKNOWN = "Unknown"
+
+
+class CharacterRarity(Interned):
+    """Character rarity."""
+
+    SSR = "SSR"
+    SR = "SR"
+    R = "R"
+    UNKNOWN = "Unknown"
+
+
+class Rarity(Interned):
+    """Star rarity of geniemon and demon wedges."""
+
+    FIVE_STAR = "5★"
+    FOUR_STAR = "4★"
+    THREE_STAR = "3★"
+    TWO_STAR = "2★"
+    UNKNOWN = "Unknown"
+
+
+class WeaponType(Interned):
+    """Weapon type."""
+
+    SWORD = "Sword"
+    GREATSWORD = "Greatsword"
+    DUAL_BLADES = "Dual Blades"
+    KATANA = "Katana"
+    POLEARM = "Polearm"
+    WHIPSWORD = "Whipsword"
+    BOW = "Bow"
+    PISTOL = "Pistol"
+    DUAL_PISTOLS = "Dual Pistols"
+    SHOTGUN = "Shotgun"
+    ASSAULT_RIFLE = "Assault Rifle"
+    GRENADE_LAUNCHER = "Grenade Launcher"
+    UNKNOWN = "Unknown"
+
+
+class AttackType(Interned):
+    """Weapon attack type."""
+
+    SLASH = "Slash"
+    SPIKE = "Spike"
+    SMASH = "Smash"
+    UNKNOWN = "Unknown"
+
+
+class GeniemonType(Interned):
+    """Whether a geniemon has an active skill."""
+
+    ACTIVE = "Active"
+    INACTIVE = "Inactive"
+    UNKNOWN = "Unknown"
+
+
+class Restriction(Interned):
+    """What a demon wedge can be equipped on."""
+
+    CHARACTERS = "Characters"
+    MELEE_WEAPON = "Melee Weapon"
+    RANGED_WEAPON = "Ranged Weapon"
+    MELEE_CONSONANCE_WEAPON = "Melee Consonance Weapon"
+    RANGED_CONSONANCE_WEAPON = "Ranged Consonance Weapon"
+    UNKNOWN = "Unknown"
+
+
+class Polarity(Interned):
+    """Demon wedge polarity symbol."""
+
+    DIAMOND = "◊"
+    TRIANGLE = "◬"
+    CRESCENT = "☽"
+    CIRCLE = "⊙"
+
+
+class Unit(Interned):
+    """Unit of a numeric stat value."""
+
+    FLAT = "flat"
+    PERCENT = "percent"
+    SECONDS = "seconds"
+    METERS = "meters"
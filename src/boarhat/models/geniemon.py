@@ -2,15 +2,19 @@
 
 from dataclasses import dataclass, field
 
+from .base import Model, category, serializable
+from .enums import Element, GeniemonType, Rarity
 
-@dataclass
-class Geniemon:
+
+@serializable
+@dataclass(slots=True)
+class Geniemon(Model):
     """Duet Night Abyss geniemon data model."""
 
     name: str
-    element: str
-    geniemon_type: str  # Active or Inactive
-    rarity: str  # 5★, 4★, 3★, 2★
+    element: Element | str = category(Element, missing="Neutral")
+    geniemon_type: GeniemonType | str = category(GeniemonType)
+    rarity: Rarity | str = category(Rarity)
     image_url: str = ""
     active_skill: str = ""
     cooldown: str = ""
@@ -18,36 +22,3 @@ class Geniemon:
     ascensions: list[str] = field(default_factory=list)
     location: str = ""
     lore: str = ""
-
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return {
-            "name": self.name,
-            "element": self.element,
-            "geniemon_type": self.geniemon_type,
-            "rarity": self.rarity,
-            "image_url": self.image_url,
-            "active_skill": self.active_skill,
-            "cooldown": self.cooldown,
-            "passive_skill": self.passive_skill,
-            "ascensions": self.ascensions,
-            "location": self.location,
-            "lore": self.lore,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "Geniemon":
-        """Create from dictionary."""
-        return cls(
-            name=data["name"],
-            element=data.get("element", "Neutral"),
-            geniemon_type=data.get("geniemon_type", "Unknown"),
-            rarity=data.get("rarity", "Unknown"),
-            image_url=data.get("image_url", ""),
-            active_skill=data.get("active_skill", ""),
-            cooldown=data.get("cooldown", ""),
-            passive_skill=data.get("passive_skill", ""),
-            ascensions=data.get("ascensions", []),
-            location=data.get("location", ""),
-            lore=data.get("lore", ""),
-        )
@@ -0,0 +1,429 @@
+"""Versioned binary snapshot of the whole dataset."""
+
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Callable, Iterator, Sequence
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, overload
+
+from .catalog import Catalog
+from .character import Character
+from .character_detail import CharacterDetail
+from .demon_wedge import DemonWedge
+from .geniemon import Geniemon
+from .weapon import Weapon
+
+MAGIC = b"BHSNAP\0\0"
+FORMAT_VERSION = 1
+
+# Header: magic, format version, section count, string table offset
+HEADER = struct.Struct("<8sIIQ")
+# Section index entry: name, record count, column count
+SECTION = struct.Struct("<16sII")
+# Column entry: key string id, kind, offset and length (in 32-bit words) of its data
+COLUMN = struct.Struct("<IIQQ")
+# String table: string count, byte length of the NUL-separated UTF-8 blob
+STRINGS = struct.Struct("<IQ")
+
+# Column kinds:
+#   KIND_STR: one string id per record
+#   KIND_STR_LIST: one length per record, then all string ids
+#   KIND_VALUE: one word offset per record, then tagged words (any JSON-like value)
+KIND_STR, KIND_STR_LIST, KIND_VALUE = range(3)
+
+# A tagged value is one or more 32-bit words; the top 3 bits of the first are its tag
+TAG_SHIFT = 29
+PAYLOAD_MASK = (1 << TAG_SHIFT) - 1
+STRING_LIMIT = 1 << TAG_SHIFT  # TAG_STR is 0, so string words are below this
+TAG_STR, TAG_LIST, TAG_DICT, TAG_NULL, TAG_BOOL, TAG_INT, TAG_BIGINT, TAG_FLOAT = range(8)
+
+# Section name -> model class; "details" holds CharacterDetail records
+MODELS: dict[str, Any] = {
+    "characters": Character,
+    "details": CharacterDetail,
+    "weapons": Weapon,
+    "geniemon": Geniemon,
+    "wedges": DemonWedge,
+}
+
+
+class _Encoder:
+    """Builds columns of string ids and tagged words over a shared string table."""
+
+    def __init__(self) -> None:
+        self.strings: list[str] = []
+        self.string_ids: dict[str, int] = {}
+
+    def intern(self, text: str) -> int:
+        """Id of a string in the table, adding it on first use."""
+        sid = self.string_ids.get(text)
+        if sid is None:
+            if "\0" in text:
+                raise ValueError(f"Cannot store string containing NUL: {text!r}")
+            sid = self.string_ids[text] = len(self.strings)
+            self.strings.append(text)
+        return sid
+
+    def column(self, values: list[Any]) -> tuple[int, array]:
+        """Encode one field of every record as (kind, words), picking the most compact kind."""
+        words = array("I")
+        if all(isinstance(v, str) for v in values):
+            words.extend(self.intern(v) for v in values)
+            return KIND_STR, words
+
+        if all(isinstance(v, list) and all(isinstance(s, str) for s in v) for v in values):
+            words.extend(len(v) for v in values)
+            for v in values:
+                words.extend(self.intern(s) for s in v)
+            return KIND_STR_LIST, words
+
+        data = array("I")
+        for v in values:
+            words.append(len(data))
+            self.encode(v, data)
+        words.extend(data)
+        return KIND_VALUE, words
+
+    def encode(self, value: Any, words: array) -> None:
+        """Append the tagged words for one JSON-like value."""
+        if isinstance(value, str):
+            words.append(TAG_STR << TAG_SHIFT | self.intern(value))
+        elif isinstance(value, dict):
+            words.append(TAG_DICT << TAG_SHIFT | len(value))
+            for key, item in value.items():
+                words.append(self.intern(key))
+                self.encode(item, words)
+        elif isinstance(value, list | tuple):
+            words.append(TAG_LIST << TAG_SHIFT | len(value))
+            for item in value:
+                self.encode(item, words)
+        elif value is None:
+            words.append(TAG_NULL << TAG_SHIFT)
+        elif isinstance(value, bool):
+            words.append(TAG_BOOL << TAG_SHIFT | int(value))
+        elif isinstance(value, int):
+            if 0 <= value <= PAYLOAD_MASK:
+                words.append(TAG_INT << TAG_SHIFT | value)
+            else:
+                words.append(TAG_BIGINT << TAG_SHIFT | self.intern(str(value)))
+        elif isinstance(value, float):
+            words.append(TAG_FLOAT << TAG_SHIFT | self.intern(repr(value)))
+        else:
+            raise TypeError(f"Cannot store {type(value).__name__} in a snapshot")
+
+
+def _little_endian(values: array) -> bytes:
+    """Array bytes in little-endian order."""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _read_words(data: memoryview) -> array:
+    """Array of 32-bit words from little-endian bytes."""
+    values = array("I")
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def write_snapshot(catalog: Catalog, output_file: Path) -> dict[str, int]:
+    """
+    Write a catalog as a binary snapshot.
+
+    Layout (little-endian): header, then per section an index entry and
+    its column entries, then the column data, and finally the string
+    table. Records are stored column by column (one column per top-level
+    field), and every distinct string is stored once.
+
+    Args:
+        catalog: Dataset to store
+        output_file: Snapshot file to create or replace
+
+    Returns:
+        Section name -> number of records
+
+    Raises:
+        ValueError: If records in a section do not share the same fields
+    """
+    sections: dict[str, list[Any]] = {
+        "characters": catalog.characters,
+        "details": list(catalog.details.values()),
+        "weapons": catalog.weapons,
+        "geniemon": catalog.geniemon,
+        "wedges": catalog.wedges,
+    }
+
+    encoder = _Encoder()
+    encoded = []
+    for name, items in sections.items():
+        records = [item.to_dict() for item in items]
+        keys = list(records[0]) if records else []
+        if any(list(record) != keys for record in records):
+            raise ValueError(f"Records in section {name!r} do not share the same fields")
+        columns = [
+            (encoder.intern(key), *encoder.column([record[key] for record in records]))
+            for key in keys
+        ]
+        encoded.append((name, len(records), columns))
+
+    pos = HEADER.size + sum(SECTION.size + COLUMN.size * len(cols) for _, _, cols in encoded)
+    index = []
+    body = []
+    for name, count, columns in encoded:
+        index.append(SECTION.pack(name.encode("ascii"), count, len(columns)))
+        for key_id, kind, words in columns:
+            index.append(COLUMN.pack(key_id, kind, pos, len(words)))
+            body.append(_little_endian(words))
+            pos += words.itemsize * len(words)
+
+    blob = "\0".join(encoder.strings).encode("utf-8")
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(encoded), pos)
+    strings = STRINGS.pack(len(encoder.strings), len(blob))
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = output_file.with_name(f".{output_file.name}.{os.getpid()}.tmp")
+    tmp_file.write_bytes(b"".join([header, *index, *body, strings, blob]))
+    tmp_file.replace(output_file)
+
+    return {name: count for name, count, _ in encoded}
+
+
+def _decode(word: int, next_word: Callable[[], int], strings: list[str]) -> Any:
+    """
+    Decode the tagged value starting with `word`, reading further words from `next_word`.
+
+    Strings are by far the most common value, so containers resolve string
+    words inline and only recurse for anything else.
+    """
+    tag = word >> TAG_SHIFT
+    payload = word & PAYLOAD_MASK
+    if tag == TAG_DICT:
+        # Keys are evaluated before values, so words are read in order
+        return {
+            strings[next_word()]: (
+                strings[w] if (w := next_word()) < STRING_LIMIT else _decode(w, next_word, strings)
+            )
+            for _ in range(payload)
+        }
+    if tag == TAG_LIST:
+        return [
+            strings[w] if (w := next_word()) < STRING_LIMIT else _decode(w, next_word, strings)
+            for _ in range(payload)
+        ]
+    if tag == TAG_STR:
+        return strings[payload]
+    if tag == TAG_NULL:
+        return None
+    if tag == TAG_BOOL:
+        return bool(payload)
+    if tag == TAG_INT:
+        return payload
+    if tag == TAG_BIGINT:
+        return int(strings[payload])
+    return float(strings[payload])
+
+
+class _Column:
+    """One field of every record in a section."""
+
+    def __init__(self, kind: int, words: array, count: int, strings: list[str]):
+        """
+        Initialize the column.
+
+        Args:
+            kind: Column kind (KIND_*)
+            words: Column data
+            count: Number of records
+            strings: Snapshot string table
+        """
+        self.kind = kind
+        self.words = words
+        self.count = count
+        self.strings = strings
+        self._starts: list[int] | None = None
+
+    def starts(self) -> list[int]:
+        """Start of each record's data, plus the end (list and value columns)."""
+        if self._starts is None:
+            head = self.words[: self.count]
+            if self.kind == KIND_STR_LIST:
+                self._starts = list(accumulate(head, initial=self.count))
+            else:
+                self._starts = [self.count + offset for offset in head]
+                self._starts.append(len(self.words))
+        return self._starts
+
+    def __getitem__(self, index: int) -> Any:
+        """Decode the field of one record."""
+        if self.kind == KIND_STR:
+            return self.strings[self.words[index]]
+        start, end = self.starts()[index], self.starts()[index + 1]
+        if self.kind == KIND_STR_LIST:
+            return [self.strings[sid] for sid in self.words[start:end]]
+        next_word = iter(self.words[start:end]).__next__
+        return _decode(next_word(), next_word, self.strings)
+
+    def values(self) -> list[Any]:
+        """Decode the field of every record."""
+        lookup = self.strings.__getitem__
+        if self.kind == KIND_STR:
+            return list(map(lookup, self.words))
+        if self.kind == KIND_STR_LIST:
+            flat = list(map(lookup, self.words[self.count :]))
+            starts = [start - self.count for start in self.starts()]
+            return [flat[start:end] for start, end in zip(starts, starts[1:], strict=False)]
+        next_word = iter(self.words[self.count :]).__next__
+        return [_decode(next_word(), next_word, self.strings) for _ in range(self.count)]
+
+
+class SnapshotSection(Sequence):
+    """
+    Lazy view of one section: records are decoded only when accessed.
+
+    Indexing returns a plain dict; `model(i)` rebuilds the model object.
+    Iterating decodes the whole section column by column.
+    """
+
+    def __init__(self, name: str, count: int, columns: dict[str, _Column]):
+        """
+        Initialize the view.
+
+        Args:
+            name: Section name
+            count: Number of records
+            columns: Field name -> column
+        """
+        self.name = name
+        self._count = count
+        self.columns = columns
+
+    def __len__(self) -> int:
+        """Number of records."""
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        """Decode one record (or a slice of records) as dicts."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"{self.name} index out of range")
+        return {key: column[index] for key, column in self.columns.items()}
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Decode every record."""
+        return iter(self.records())
+
+    def field(self, key: str) -> list[Any]:
+        """Decode one field of every record, without decoding the rest."""
+        return self.columns[key].values()
+
+    def records(self) -> list[dict[str, Any]]:
+        """Decode every record as dicts."""
+        columns = {key: column.values() for key, column in self.columns.items()}
+        return [{key: values[i] for key, values in columns.items()} for i in range(self._count)]
+
+    def model(self, index: int) -> Any:
+        """Rebuild one record as its model object."""
+        return MODELS[self.name].from_dict(self[index])
+
+    def models(self) -> list[Any]:
+        """Rebuild every record as model objects."""
+        model_class = MODELS[self.name]
+        return [model_class.from_dict(record) for record in self.records()]
+
+
+class Snapshot:
+    """
+    Reader for snapshot files.
+
+    Opening reads the index and string table only; sections are decoded
+    on access.
+
+    Example:
+        snapshot = Snapshot.open(Path("data/boarhat.snap"))
+        wedges = snapshot["wedges"]        # lazy view
+        wedges[0]["name"]                  # decodes one record
+        wedges.field("element")            # decodes one column
+        catalog = snapshot.catalog()       # all model objects
+    """
+
+    def __init__(self, data: bytes):
+        """
+        Parse a snapshot held in memory.
+
+        Raises:
+            ValueError: If the data is not a snapshot of a supported version
+        """
+        if len(data) < HEADER.size:
+            raise ValueError("Not a boarhat snapshot (file too short)")
+        magic, version, section_count, strings_pos = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a boarhat snapshot (bad magic)")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {version} (expected {FORMAT_VERSION})")
+
+        view = memoryview(data)
+        count, blob_len = STRINGS.unpack_from(data, strings_pos)
+        blob_start = strings_pos + STRINGS.size
+        blob = bytes(view[blob_start : blob_start + blob_len]).decode("utf-8")
+        self.strings = blob.split("\0") if count else []
+
+        self.sections: dict[str, SnapshotSection] = {}
+        pos = HEADER.size
+        for _ in range(section_count):
+            raw_name, records, column_count = SECTION.unpack_from(data, pos)
+            pos += SECTION.size
+            columns = {}
+            for _ in range(column_count):
+                key_id, kind, data_pos, word_count = COLUMN.unpack_from(data, pos)
+                pos += COLUMN.size
+                words = _read_words(view[data_pos : data_pos + 4 * word_count])
+                columns[self.strings[key_id]] = _Column(kind, words, records, self.strings)
+            name = raw_name.rstrip(b"\0").decode("ascii")
+            self.sections[name] = SnapshotSection(name, records, columns)
+
+    @classmethod
+    def open(cls, path: Path) -> "Snapshot":
+        """Read a snapshot file."""
+        return cls(path.read_bytes())
+
+    def __getitem__(self, name: str) -> SnapshotSection:
+        """Lazy view of a section."""
+        return self.sections[name]
+
+    def __contains__(self, name: object) -> bool:
+        """Whether the snapshot has a section."""
+        return name in self.sections
+
+    def catalog(self) -> Catalog:
+        """Rebuild every section as model objects."""
+        return Catalog(
+            characters=self._models("characters"),
+            details={detail.slug: detail for detail in self._models("details")},
+            weapons=self._models("weapons"),
+            geniemon=self._models("geniemon"),
+            wedges=self._models("wedges"),
+        )
+
+    def _models(self, name: str) -> list[Any]:
+        """Model objects of a section, or an empty list if it is missing."""
+        return self.sections[name].models() if name in self else []
+
+
+def load_snapshot(path: Path) -> Catalog:
+    """Load a snapshot file as a catalog of model objects."""
+    return Snapshot.open(path).catalog()
@@ -0,0 +1,330 @@
+"""Numeric stat matrices parsed from character and weapon strings."""
+
+import math
+import re
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Literal
+
+from .character_detail import CharacterDetail
+from .enums import Unit
+from .weapon import Weapon
+
+Level = Literal["level_1", "level_max"]
+
+NAN = math.nan
+
+# One term of a stat value: "1,318", "130%", "20.7s", "29% Max HP", "200% x 2",
+# "14% x [Samael] enhancement level"
+TERM = re.compile(
+    r"""
+    (?P<number>\d[\d,]*(?:\.\d+)?)(?P<unit>%|s|m)?
+    (?:\ (?P<stat>[A-Za-z][A-Za-z ]*[A-Za-z]))?
+    (?:\ x\ (?:(?P<count>\d+)|(?P<per>\[[^\]]+\][A-Za-z ]*)))?
+    """,
+    re.VERBOSE,
+)
+TERM_SEPARATOR = re.compile(r"\s*\+\s*")
+
+# Stat bonus of a demon wedge: "ATK +75%", "DEF+40%", "HP -30%"
+ATTRIBUTE = re.compile(r"(?P<stat>[A-Za-z][A-Za-z :]*?)\s*(?P<sign>[+-])(?P<value>\d[\d.,]*[%sm]?)")
+
+
+UNIT_SUFFIXES = {None: Unit.FLAT, "%": Unit.PERCENT, "s": Unit.SECONDS, "m": Unit.METERS}
+
+
+@dataclass(slots=True)
+class StatValue:
+    """
+    Stat value parsed from its display string.
+
+    `value` is the total of all terms in the main unit, so multi-hit and
+    multi-part values ("200% x 2", "189% + 556%") are summed. `scaling`
+    names what a percentage is taken of ("Max HP", "DEF") or what the
+    value is multiplied by ("[Samael] enhancement level"). `flat` is a
+    plain number added on top ("29% Max HP + 33").
+    """
+
+    value: float
+    unit: Unit
+    scaling: str = ""
+    flat: float = 0.0
+
+
+def parse_stat_value(text: str) -> StatValue | None:
+    """
+    Parse a stat display string such as "1,318", "130%", "20.7s" or "29% Max HP + 33".
+
+    Args:
+        text: Value as shown on the site
+
+    Returns:
+        The parsed value, or None if the string has no numeric reading
+        (e.g. an area like "6m x 6m")
+    """
+    result: StatValue | None = None
+    for part in TERM_SEPARATOR.split(text.strip().lstrip("+")):
+        match = TERM.fullmatch(part)
+        if match is None:
+            return None
+        number = float(match["number"].replace(",", "")) * int(match["count"] or 1)
+        unit = UNIT_SUFFIXES[match["unit"]]
+        scaling = match["stat"] or (match["per"] or "").strip()
+
+        if result is None:
+            result = StatValue(number, unit, scaling)
+        elif unit == result.unit and scaling == result.scaling:
+            result.value += number
+        elif unit == Unit.FLAT and not scaling:
+            result.flat += number
+        else:
+            return None
+    return result
+
+
+def parse_attribute(text: str) -> tuple[str, StatValue] | None:
+    """
+    Parse a stat bonus such as "ATK +75%", "DEF+40%" or "HP -30%".
+
+    Args:
+        text: Demon wedge main attribute as shown on the site
+
+    Returns:
+        (stat name, bonus), negative for penalties, or None for descriptive
+        attributes
+    """
+    match = ATTRIBUTE.fullmatch(text.strip().rstrip("."))
+    if match is None:
+        return None
+    parsed = parse_stat_value(match["value"])
+    if parsed is None or parsed.scaling:
+        return None
+    if match["sign"] == "-":
+        parsed.value = -parsed.value
+    return match["stat"], parsed
+
+
+@dataclass(slots=True)
+class SkillStats:
+    """
+    Skill stats of every character as parallel arrays, one entry per (skill, stat).
+
+    Unparseable values are NaN with unit None.
+    """
+
+    owners: array = field(default_factory=lambda: array("I"))  # Row in the stat matrix
+    skills: list[str] = field(default_factory=list)
+    stats: list[str] = field(default_factory=list)
+    units: list[Unit | None] = field(default_factory=list)
+    scaling: list[str] = field(default_factory=list)
+    level_1: array = field(default_factory=lambda: array("d"))
+    level_max: array = field(default_factory=lambda: array("d"))
+
+    def __len__(self) -> int:
+        """Number of (skill, stat) entries."""
+        return len(self.stats)
+
+    def append(self, owner: int, skill: str, stat: str, values: dict[str, str]) -> None:
+        """Parse and add one skill stat."""
+        level_1 = parse_stat_value(values.get("level_1", ""))
+        level_max = parse_stat_value(values.get("level_max", ""))
+        parsed = level_max or level_1
+        self.owners.append(owner)
+        self.skills.append(skill)
+        self.stats.append(stat)
+        self.units.append(parsed.unit if parsed else None)
+        self.scaling.append(parsed.scaling if parsed else "")
+        self.level_1.append(level_1.value if level_1 else NAN)
+        self.level_max.append(level_max.value if level_max else NAN)
+
+    def matching(self, stat: str, unit: Unit | None = None) -> list[int]:
+        """
+        Indices of entries for a stat, with or without a `[Name] ` prefix.
+
+        Args:
+            stat: Stat name, e.g. "DMG" also matches "[Solar Eclipse] DMG"
+            unit: Only entries in this unit
+        """
+        suffix = f"] {stat}"
+        return [
+            i
+            for i, name in enumerate(self.stats)
+            if (name == stat or name.endswith(suffix)) and (unit is None or self.units[i] == unit)
+        ]
+
+
+@dataclass(slots=True)
+class StatMatrix:
+    """
+    Character base stats as dense (character, stat) arrays, plus skill stats.
+
+    `level_1` and `level_max` are row-major: the value of stat `j` for
+    character `i` is at `i * len(stats) + j`, NaN where a character has
+    no such stat. Columns are extracted with strided slices, so whole-roster
+    queries do no string parsing.
+
+    Example:
+        matrix = StatMatrix.from_details(catalog.details.values())
+        matrix.ranked("Lumino ATK")  # [(slug, value), ...], highest first
+    """
+
+    slugs: list[str] = field(default_factory=list)
+    stats: list[str] = field(default_factory=list)
+    units: list[Unit | None] = field(default_factory=list)
+    level_1: array = field(default_factory=lambda: array("d"))
+    level_max: array = field(default_factory=lambda: array("d"))
+    skills: SkillStats = field(default_factory=SkillStats)
+
+    @classmethod
+    def from_details(cls, details: Iterable[CharacterDetail]) -> "StatMatrix":
+        """
+        Parse the stat strings of character details.
+
+        Args:
+            details: Character details; one matrix row each
+
+        Returns:
+            The matrix
+        """
+        details = list(details)
+        matrix = cls(slugs=[d.slug for d in details])
+        columns: dict[str, int] = {}
+        parsed = []
+        for d in details:
+            row = {}
+            for base_stat in d.base_stats:
+                if base_stat.stat not in columns:
+                    columns[base_stat.stat] = len(columns)
+                    matrix.stats.append(base_stat.stat)
+                    matrix.units.append(None)
+                row[columns[base_stat.stat]] = (
+                    parse_stat_value(base_stat.level_1),
+                    parse_stat_value(base_stat.level_max),
+                )
+            parsed.append(row)
+
+        width = len(columns)
+        matrix.level_1 = array("d", [NAN]) * (len(details) * width)
+        matrix.level_max = array("d", [NAN]) * (len(details) * width)
+        for i, row in enumerate(parsed):
+            for j, (level_1, level_max) in row.items():
+                if level_1:
+                    matrix.level_1[i * width + j] = level_1.value
+                if level_max:
+                    matrix.level_max[i * width + j] = level_max.value
+                if matrix.units[j] is None and (level_max or level_1):
+                    matrix.units[j] = (level_max or level_1).unit  # type: ignore[union-attr]
+
+        for i, d in enumerate(details):
+            for skill in d.skills:
+                for stat, values in skill.stats.items():
+                    matrix.skills.append(i, skill.name, stat, values)
+        return matrix
+
+    def column(self, stat: str, level: Level = "level_max") -> array:
+        """
+        Values of one stat for every character, in row order.
+
+        Raises:
+            KeyError: If no character has the stat
+        """
+        if stat not in self.stats:
+            raise KeyError(stat)
+        values: array = getattr(self, level)
+        return values[self.stats.index(stat) :: len(self.stats)]
+
+    def value(self, slug: str, stat: str, level: Level = "level_max") -> float:
+        """
+        Value of one stat for one character (NaN if the character lacks it).
+
+        Raises:
+            KeyError: If the character or stat is unknown
+        """
+        if slug not in self.slugs or stat not in self.stats:
+            raise KeyError((slug, stat))
+        values: array[float] = getattr(self, level)
+        return values[self.slugs.index(slug) * len(self.stats) + self.stats.index(stat)]
+
+    def ranked(self, stat: str, level: Level = "level_max") -> list[tuple[str, float]]:
+        """Characters that have a stat, with its value, highest first."""
+        pairs = zip(self.slugs, self.column(stat, level), strict=True)
+        return sorted(
+            ((slug, value) for slug, value in pairs if not math.isnan(value)),
+            key=lambda pair: pair[1],
+            reverse=True,
+        )
+
+
+@dataclass(slots=True)
+class WeaponEffects:
+    """
+    Refinement vectors of every weapon skill effect as one dense array.
+
+    `ranks` is row-major with `width` values per effect (the longest
+    vector), NaN-padded; effect `i` belongs to `names[weapons[i]]`.
+
+    Example:
+        effects = WeaponEffects.from_weapons(catalog.weapons)
+        effects.ranked("CRIT Damage", rank=0)  # [(weapon, value), ...], highest first
+    """
+
+    names: list[str] = field(default_factory=list)
+    weapons: array = field(default_factory=lambda: array("I"))
+    stats: list[str] = field(default_factory=list)
+    units: list[Unit | str] = field(default_factory=list)
+    ranks: array = field(default_factory=lambda: array("d"))
+    width: int = 0
+
+    @classmethod
+    def from_weapons(cls, weapons: Iterable[Weapon]) -> "WeaponEffects":
+        """
+        Collect the skill effects of weapons.
+
+        Args:
+            weapons: Weapons with extracted `skill_effects`
+
+        Returns:
+            The effects table
+        """
+        weapons = list(weapons)
+        table = cls(names=[w.name for w in weapons])
+        table.width = max((len(e.ranks) for w in weapons for e in w.skill_effects), default=0)
+        for i, weapon in enumerate(weapons):
+            for effect in weapon.skill_effects:
+                table.weapons.append(i)
+                table.stats.append(effect.stat)
+                table.units.append(effect.unit)
+                table.ranks.extend(effect.ranks)
+                table.ranks.extend([NAN] * (table.width - len(effect.ranks)))
+        return table
+
+    def __len__(self) -> int:
+        """Number of effects."""
+        return len(self.stats)
+
+    def column(self, rank: int = -1) -> array:
+        """
+        Value of every effect at one refinement rank.
+
+        Args:
+            rank: Index into the rank vectors (0 = unrefined, -1 = highest)
+        """
+        if rank < 0:
+            rank += self.width
+        if not 0 <= rank < self.width:
+            raise IndexError(f"Refinement rank out of range (0-{self.width - 1})")
+        return self.ranks[rank :: self.width]
+
+    def ranked(self, stat: str, rank: int = -1) -> list[tuple[str, float]]:
+        """Effects on a stat as (weapon name, value at `rank`), highest first."""
+        column = self.column(rank)
+        return sorted(
+            (
+                (self.names[self.weapons[i]], column[i])
+                for i, name in enumerate(self.stats)
+                if name == stat and not math.isnan(column[i])
+            ),
+            key=lambda pair: pair[1],
+            reverse=True,
+        )
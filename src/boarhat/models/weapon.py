@@ -2,43 +2,31 @@
 
 from dataclasses import dataclass, field
 
+from .base import Model, category, serializable
+from .enums import AttackType, Element, Unit, WeaponType
 
-@dataclass
-class Weapon:
+
+@serializable
+@dataclass(slots=True)
+class SkillEffect(Model):
+    """Effect of a weapon skill with its value at each refinement rank."""
+
+    stat: str  # "" when the skill text does not name it
+    unit: Unit | str = category(Unit, missing="flat")
+    ranks: list[float] = field(default_factory=list)
+
+
+@serializable
+@dataclass(slots=True)
+class Weapon(Model):
     """Duet Night Abyss weapon data model."""
 
     name: str
-    element: str
-    weapon_type: str
-    attack_type: str
+    element: Element | str = category(Element, missing="Neutral")
+    weapon_type: WeaponType | str = category(WeaponType)
+    attack_type: AttackType | str = category(AttackType)
     image_url: str = ""
     skill: str = ""
+    skill_effects: list[SkillEffect] = field(default_factory=list)
     base_stats: dict = field(default_factory=dict)
     attributes: dict = field(default_factory=dict)
-
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return {
-            "name": self.name,
-            "element": self.element,
-            "weapon_type": self.weapon_type,
-            "attack_type": self.attack_type,
-            "image_url": self.image_url,
-            "skill": self.skill,
-            "base_stats": self.base_stats,
-            "attributes": self.attributes,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "Weapon":
-        """Create from dictionary."""
-        return cls(
-            name=data["name"],
-            element=data.get("element", "Neutral"),
-            weapon_type=data.get("weapon_type", "Unknown"),
-            attack_type=data.get("attack_type", "Unknown"),
-            image_url=data.get("image_url", ""),
-            skill=data.get("skill", ""),
-            base_stats=data.get("base_stats", {}),
-            attributes=data.get("attributes", {}),
-        )
@@ -0,0 +1,21 @@
+"""Querying the processed dataset."""
+
+from .engine import INDEXED_FIELDS, CategoryIndex, Condition, QueryEngine, parse_filters
+from .relations import RELATIONS_FILE, Adjacency, RelationIndex
+from .search import SEARCH_INDEX_FILE, Document, SearchHit, SearchIndex, tokenize
+
+__all__ = [
+    "INDEXED_FIELDS",
+    "RELATIONS_FILE",
+    "SEARCH_INDEX_FILE",
+    "Adjacency",
+    "CategoryIndex",
+    "Condition",
+    "Document",
+    "QueryEngine",
+    "RelationIndex",
+    "SearchHit",
+    "SearchIndex",
+    "parse_filters",
+    "tokenize",
+]
@@ -0,0 +1,248 @@
+"""In-memory query engine with hash indexes on categorical fields."""
+
+import dataclasses
+import shlex
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+from boarhat.models.catalog import DEFAULT_DATA_DIR, Catalog
+from boarhat.models.snapshot import load_snapshot
+
+Operator = Literal["=", "!=", "~"]
+
+# Category -> fields with a hash index
+INDEXED_FIELDS: dict[str, tuple[str, ...]] = {
+    "characters": ("element", "role", "rarity"),
+    "weapons": ("element", "weapon_type", "attack_type"),
+    "geniemon": ("element", "geniemon_type", "rarity"),
+    "wedges": ("element", "rarity", "restriction", "polarity"),
+}
+
+# Checked longest first, so "!=" is not read as "="
+OPERATORS: tuple[Operator, ...] = ("!=", "=", "~")
+
+
+def _key(value: Any) -> str:
+    """Case-insensitive index key of a field value."""
+    return str(value).casefold()
+
+
+@dataclass(frozen=True)
+class Condition:
+    """
+    One filter term.
+
+    Operators:
+        =: field equals one of `values`
+        !=: field equals none of `values`
+        ~: field contains one of `values` as a substring
+    """
+
+    field: str
+    op: Operator
+    values: tuple[str, ...]
+
+
+def parse_filters(terms: str | Iterable[str]) -> list[Condition]:
+    """
+    Parse filter terms such as `element=Pyro,Hydro`, `rarity!=SR` or `name~blade`.
+
+    Matching is case-insensitive, and commas separate alternatives.
+
+    Args:
+        terms: Terms, or one string of space-separated terms (quotes group
+            values with spaces: `restriction="Melee Weapon"`)
+
+    Returns:
+        Conditions, all of which must hold
+
+    Raises:
+        ValueError: If a term has no operator, field or value
+    """
+    if isinstance(terms, str):
+        terms = shlex.split(terms)
+
+    conditions = []
+    for term in terms:
+        for op in OPERATORS:
+            field, sep, raw = term.partition(op)
+            if sep and "=" not in field and "~" not in field:
+                break
+        else:
+            raise ValueError(f"Invalid filter {term!r} (expected field=value, !=, or ~)")
+
+        field = field.strip()
+        values = tuple(v.strip() for v in raw.split(",") if v.strip())
+        if not field or not values:
+            raise ValueError(f"Invalid filter {term!r} (missing field or value)")
+        conditions.append(Condition(field, op, values))
+    return conditions
+
+
+class CategoryIndex:
+    """Records of one category with posting lists for their categorical fields."""
+
+    def __init__(self, records: Sequence[Any], fields: Iterable[str]):
+        """
+        Build the indexes.
+
+        Args:
+            records: Model objects
+            fields: Fields to index
+        """
+        self.records = records
+        self.all_ids = frozenset(range(len(records)))
+        self.postings: dict[str, dict[str, frozenset[int]]] = {}
+
+        for field in fields:
+            lists: dict[str, list[int]] = {}
+            for i, record in enumerate(records):
+                lists.setdefault(_key(getattr(record, field)), []).append(i)
+            self.postings[field] = {key: frozenset(ids) for key, ids in lists.items()}
+
+    def field_names(self) -> list[str]:
+        """Fields that can be filtered on."""
+        if not self.records:
+            return list(self.postings)
+        return [f.name for f in dataclasses.fields(self.records[0])]
+
+    def matching(self, condition: Condition) -> frozenset[int]:
+        """
+        Ids of records satisfying one condition.
+
+        Raises:
+            ValueError: If the record type has no such field
+        """
+        if self.records and condition.field not in self.field_names():
+            raise ValueError(
+                f"Unknown field {condition.field!r} (available: {', '.join(self.field_names())})"
+            )
+
+        keys = [_key(value) for value in condition.values]
+        postings = self.postings.get(condition.field)
+        if postings is not None and condition.op != "~":
+            ids = frozenset().union(*(postings.get(key, frozenset()) for key in keys))
+            return ids if condition.op == "=" else self.all_ids - ids
+
+        # Not indexed (or substring match): scan
+        def test(value: Any) -> bool:
+            text = _key(value)
+            if condition.op == "~":
+                return any(key in text for key in keys)
+            return (text in keys) == (condition.op == "=")
+
+        return frozenset(
+            i for i, record in enumerate(self.records) if test(getattr(record, condition.field))
+        )
+
+    def select(self, conditions: Sequence[Condition]) -> list[int]:
+        """
+        Ids of records satisfying every condition, in record order.
+
+        Indexed conditions are intersected smallest first; scans run last,
+        only if the indexed result is not already empty.
+        """
+        indexed = [c for c in conditions if c.field in self.postings and c.op != "~"]
+        scanned = [c for c in conditions if c not in indexed]
+
+        ids = self.all_ids
+        for posting in sorted((self.matching(c) for c in indexed), key=len):
+            ids = ids & posting
+            if not ids:
+                return []
+        for condition in scanned:
+            ids = ids & self.matching(condition)
+            if not ids:
+                return []
+        return sorted(ids)
+
+
+class QueryEngine:
+    """
+    Filter queries over every category, answered from hash indexes.
+
+    Example:
+        engine = QueryEngine.load()
+        engine.query("wedges", "element=Pyro rarity=5★")
+    """
+
+    def __init__(self, catalog: Catalog):
+        """
+        Index a loaded catalog.
+
+        Args:
+            catalog: Dataset to query
+        """
+        self.catalog = catalog
+        self.indexes = {
+            category: CategoryIndex(getattr(catalog, category), fields)
+            for category, fields in INDEXED_FIELDS.items()
+        }
+
+    @classmethod
+    def load(cls, source: Path = DEFAULT_DATA_DIR) -> "QueryEngine":
+        """
+        Load and index the dataset.
+
+        Args:
+            source: Processed data directory, or a snapshot file
+
+        Returns:
+            Query engine over the loaded data
+        """
+        catalog = load_snapshot(source) if source.is_file() else Catalog.load(source)
+        return cls(catalog)
+
+    def _index(self, category: str) -> CategoryIndex:
+        """Index of a category; raises ValueError for unknown categories."""
+        index = self.indexes.get(category)
+        if index is None:
+            raise ValueError(
+                f"Unknown category {category!r} (available: {', '.join(self.indexes)})"
+            )
+        return index
+
+    def query(
+        self, category: str, filters: str | Iterable[str] = (), limit: int | None = None
+    ) -> list[Any]:
+        """
+        Records of a category matching every filter term.
+
+        Args:
+            category: "characters", "weapons", "geniemon" or "wedges"
+            filters: Filter terms (see `parse_filters`)
+            limit: Maximum number of records
+
+        Returns:
+            Matching model objects, in catalog order
+
+        Raises:
+            ValueError: If the category, a field, or a filter term is invalid
+        """
+        index = self._index(category)
+        ids = index.select(parse_filters(filters))
+        return [index.records[i] for i in ids[:limit]]
+
+    def count(self, category: str, filters: str | Iterable[str] = ()) -> int:
+        """Number of records matching every filter term."""
+        return len(self._index(category).select(parse_filters(filters)))
+
+    def facets(self, category: str, field: str) -> Counter[str]:
+        """
+        Number of records per value of an indexed field.
+
+        Raises:
+            ValueError: If the category or field is not indexed
+        """
+        index = self._index(category)
+        if field not in index.postings:
+            raise ValueError(f"Field {field!r} of {category} is not indexed")
+        return Counter(
+            {
+                str(getattr(index.records[min(ids)], field)): len(ids)
+                for ids in index.postings[field].values()
+            }
+        )
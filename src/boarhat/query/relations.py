@@ -0,0 +1,248 @@
+"""Precomputed relations between characters, weapons and demon wedges."""
+
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from boarhat.models.catalog import DEFAULT_DATA_DIR, Catalog
+from boarhat.models.enums import Element, Restriction, WeaponType
+
+from .storage import is_fresh, read_index, write_index
+
+RELATIONS_FILE = "relations.json"
+FORMAT_VERSION = 1
+
+MELEE_WEAPON_TYPES = frozenset(
+    {
+        WeaponType.SWORD,
+        WeaponType.GREATSWORD,
+        WeaponType.DUAL_BLADES,
+        WeaponType.KATANA,
+        WeaponType.POLEARM,
+        WeaponType.WHIPSWORD,
+    }
+)
+
+# Wedges without an element fit characters of any element
+ANY_ELEMENT = frozenset({Element.UNKNOWN, Element.NEUTRAL})
+
+
+@dataclass(slots=True)
+class Adjacency:
+    """
+    Integer adjacency lists in compressed form.
+
+    The targets of source `i` are `targets[offsets[i]:offsets[i + 1]]`,
+    so a lookup is two array reads and a slice.
+    """
+
+    offsets: array = field(default_factory=lambda: array("I", [0]))
+    targets: array = field(default_factory=lambda: array("I"))
+
+    @classmethod
+    def from_lists(cls, lists: Iterable[Iterable[int]]) -> "Adjacency":
+        """Pack one list of target ids per source."""
+        adjacency = cls()
+        for targets in lists:
+            adjacency.targets.extend(targets)
+            adjacency.offsets.append(len(adjacency.targets))
+        return adjacency
+
+    def __len__(self) -> int:
+        """Number of sources."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, source: int) -> array:
+        """Target ids of one source, in ascending order."""
+        return self.targets[self.offsets[source] : self.offsets[source + 1]]
+
+    def to_dict(self) -> dict[str, list[int]]:
+        """Lists for JSON."""
+        return {"offsets": self.offsets.tolist(), "targets": self.targets.tolist()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, list[int]]) -> "Adjacency":
+        """Adjacency read from JSON."""
+        return cls(array("I", data["offsets"]), array("I", data["targets"]))
+
+
+def _invert(adjacency: Adjacency, size: int) -> Adjacency:
+    """Adjacency from targets back to sources, for `size` targets."""
+    lists: list[list[int]] = [[] for _ in range(size)]
+    for source in range(len(adjacency)):
+        for target in adjacency[source]:
+            lists[target].append(source)
+    return Adjacency.from_lists(lists)
+
+
+@dataclass(slots=True)
+class RelationIndex:
+    """
+    What each character and weapon can be combined with.
+
+    Ids are positions in the catalog lists (`Catalog.characters`,
+    `Catalog.weapons`, `Catalog.wedges`); the names are stored alongside
+    so saved relations can be checked against the data they were built from.
+
+    Relations:
+        character_weapons: Weapons whose type is in the character's proficiency
+        weapon_characters: The inverse of `character_weapons`
+        character_wedges: "Characters" wedges of the character's element or of none
+        weapon_wedges: Melee or ranged weapon wedges, by weapon type
+
+    Example:
+        relations = RelationIndex.open()
+        relations.character_weapons[relations.character("Berenica")]
+    """
+
+    characters: list[str] = field(default_factory=list)
+    weapons: list[str] = field(default_factory=list)
+    wedges: list[str] = field(default_factory=list)
+    character_weapons: Adjacency = field(default_factory=Adjacency)
+    weapon_characters: Adjacency = field(default_factory=Adjacency)
+    character_wedges: Adjacency = field(default_factory=Adjacency)
+    weapon_wedges: Adjacency = field(default_factory=Adjacency)
+    _character_ids: dict[str, int] = field(init=False, repr=False)
+    _weapon_ids: dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Name lookups."""
+        self._character_ids = {name: i for i, name in enumerate(self.characters)}
+        self._weapon_ids = {name: i for i, name in enumerate(self.weapons)}
+
+    @classmethod
+    def build(cls, catalog: Catalog) -> "RelationIndex":
+        """
+        Join the categories of a catalog.
+
+        Each relation is built by grouping one side by its join key, so the
+        cost is linear in the number of records and relations.
+
+        Args:
+            catalog: Loaded dataset
+
+        Returns:
+            The relations
+        """
+        weapons_by_type: dict[str, list[int]] = {}
+        for i, weapon in enumerate(catalog.weapons):
+            weapons_by_type.setdefault(weapon.weapon_type, []).append(i)
+
+        character_wedges: dict[str, list[int]] = {}  # Element -> wedge ids
+        weapon_wedges: dict[str, list[int]] = {}  # Restriction -> wedge ids
+        universal: list[int] = []
+        for i, wedge in enumerate(catalog.wedges):
+            if wedge.restriction != Restriction.CHARACTERS:
+                weapon_wedges.setdefault(wedge.restriction, []).append(i)
+            elif wedge.element in ANY_ELEMENT:
+                universal.append(i)
+            else:
+                character_wedges.setdefault(wedge.element, []).append(i)
+
+        character_weapons = Adjacency.from_lists(
+            sorted({i for kind in c.proficiency for i in weapons_by_type.get(kind, ())})
+            for c in catalog.characters
+        )
+        return cls(
+            characters=[c.name for c in catalog.characters],
+            weapons=[w.name for w in catalog.weapons],
+            wedges=[w.name for w in catalog.wedges],
+            character_weapons=character_weapons,
+            weapon_characters=_invert(character_weapons, len(catalog.weapons)),
+            character_wedges=Adjacency.from_lists(
+                sorted(universal + character_wedges.get(c.element, [])) for c in catalog.characters
+            ),
+            weapon_wedges=Adjacency.from_lists(
+                weapon_wedges.get(
+                    Restriction.MELEE_WEAPON
+                    if w.weapon_type in MELEE_WEAPON_TYPES
+                    else Restriction.RANGED_WEAPON,
+                    [],
+                )
+                for w in catalog.weapons
+            ),
+        )
+
+    @classmethod
+    def open(cls, data_dir: Path = DEFAULT_DATA_DIR) -> "RelationIndex":
+        """
+        Load the relations saved next to the processed data, rebuilding them if missing or stale.
+
+        Args:
+            data_dir: Processed data directory
+
+        Returns:
+            The relations
+        """
+        relations_file = data_dir / RELATIONS_FILE
+        if is_fresh(relations_file, data_dir):
+            try:
+                return cls.load(relations_file)
+            except ValueError:
+                pass  # Older format: rebuild
+
+        relations = cls.build(Catalog.load(data_dir))
+        relations.save(relations_file)
+        return relations
+
+    @classmethod
+    def load(cls, path: Path) -> "RelationIndex":
+        """
+        Read saved relations.
+
+        Raises:
+            ValueError: If the file was written by an incompatible version
+        """
+        data = read_index(path, FORMAT_VERSION)
+        return cls(
+            characters=data["characters"],
+            weapons=data["weapons"],
+            wedges=data["wedges"],
+            character_weapons=Adjacency.from_dict(data["character_weapons"]),
+            weapon_characters=Adjacency.from_dict(data["weapon_characters"]),
+            character_wedges=Adjacency.from_dict(data["character_wedges"]),
+            weapon_wedges=Adjacency.from_dict(data["weapon_wedges"]),
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the relations next to the processed data."""
+        write_index(
+            path,
+            {
+                "version": FORMAT_VERSION,
+                "characters": self.characters,
+                "weapons": self.weapons,
+                "wedges": self.wedges,
+                "character_weapons": self.character_weapons.to_dict(),
+                "weapon_characters": self.weapon_characters.to_dict(),
+                "character_wedges": self.character_wedges.to_dict(),
+                "weapon_wedges": self.weapon_wedges.to_dict(),
+            },
+        )
+
+    def character(self, name: str) -> int:
+        """
+        Id of a character by name.
+
+        Raises:
+            KeyError: If there is no such character
+        """
+        return self._character_ids[name]
+
+    def weapon(self, name: str) -> int:
+        """
+        Id of a weapon by name.
+
+        Raises:
+            KeyError: If there is no such weapon
+        """
+        return self._weapon_ids[name]
+
+    def matches(self, catalog: Catalog) -> bool:
+        """Whether the ids refer to the records of this catalog."""
+        return (
+            self.characters == [c.name for c in catalog.characters]
+            and self.weapons == [w.name for w in catalog.weapons]
+            and self.wedges == [w.name for w in catalog.wedges]
+        )
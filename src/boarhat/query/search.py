@@ -0,0 +1,266 @@
+"""Full-text inverted index over the descriptive text of every entity, ranked with BM25."""
+
+import heapq
+import math
+import re
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from operator import itemgetter
+from pathlib import Path
+
+from boarhat.models.catalog import DEFAULT_DATA_DIR, Catalog
+
+from .storage import is_fresh, read_index, write_index
+
+SEARCH_INDEX_FILE = "search_index.json"
+FORMAT_VERSION = 1
+
+# Letters and digits; "CRIT" -> "crit", "20.7s" -> "20", "7s"
+TOKEN = re.compile(r"[^\W_]+")
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase search terms."""
+    return TOKEN.findall(text.casefold())
+
+
+def _texts(catalog: Catalog) -> Iterator[tuple[str, int, str, list[tuple[str, str]]]]:
+    """(category, position, name, [(field label, text), ...]) for every record."""
+    for i, detail in enumerate(catalog.details.values()):
+        fields = [("Name", detail.name)]
+        fields += [(f"Trait: {trait.name}", trait.effect) for trait in detail.traits]
+        fields += [(f"Skill: {skill.name}", skill.description) for skill in detail.skills]
+        yield "characters", i, detail.name, fields
+    for i, weapon in enumerate(catalog.weapons):
+        yield "weapons", i, weapon.name, [("Name", weapon.name), ("Skill", weapon.skill)]
+    for i, geniemon in enumerate(catalog.geniemon):
+        fields = [
+            ("Name", geniemon.name),
+            ("Active Skill", geniemon.active_skill),
+            ("Passive Skill", geniemon.passive_skill),
+            ("Lore", geniemon.lore),
+        ]
+        yield "geniemon", i, geniemon.name, fields
+    for i, wedge in enumerate(catalog.wedges):
+        fields = [("Name", wedge.name)] + [("Effect", effect) for effect in wedge.effects]
+        yield "wedges", i, wedge.name, fields
+
+
+@dataclass(slots=True)
+class Document:
+    """
+    One indexed record.
+
+    `position` is the record's index in its catalog list (for characters,
+    in `Catalog.details`).
+    """
+
+    category: str
+    position: int
+    name: str
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """A ranked search result."""
+
+    document: Document
+    score: float
+    fields: list[str] = field(default_factory=list)  # Labels of the fields that matched
+
+
+class SearchIndex:
+    """
+    Inverted index from term to (field, position) postings.
+
+    Every text field of a record (a skill description, a trait, a wedge
+    effect, ...) is one entry in `fields`, owned by a document (the
+    record). A term's postings are flat `array("I")` pairs of field id and
+    token position, in field order, so phrase matching can check adjacency.
+
+    Example:
+        index = SearchIndex.open()
+        index.search("crit damage")  # [SearchHit, ...], best first
+    """
+
+    def __init__(
+        self,
+        documents: list[Document],
+        fields: list[tuple[int, str]],
+        postings: dict[str, array],
+    ):
+        """
+        Wrap index data.
+
+        Args:
+            documents: Indexed records
+            fields: (document id, label) of every field
+            postings: Term -> flat (field id, position) pairs
+        """
+        self.documents = documents
+        self.field_docs = array("I", (doc for doc, _ in fields))
+        self.field_labels = [label for _, label in fields]
+        self.postings = postings
+
+        self.lengths = array("I", [0]) * len(documents)
+        for pairs in postings.values():
+            for field_id in pairs[::2]:
+                self.lengths[self.field_docs[field_id]] += 1
+        self.average_length = sum(self.lengths) / len(documents) if documents else 0.0
+
+        # Term -> ({document id: weight}, {document id: field ids}), filled on first use
+        self._terms: dict[str, tuple[dict[int, float], dict[int, list[int]]]] = {}
+
+    @classmethod
+    def build(cls, catalog: Catalog) -> "SearchIndex":
+        """
+        Tokenize the descriptive text of a catalog.
+
+        Args:
+            catalog: Loaded dataset
+
+        Returns:
+            The index
+        """
+        documents: list[Document] = []
+        fields: list[tuple[int, str]] = []
+        postings: dict[str, array] = {}
+        for category, position, name, texts in _texts(catalog):
+            doc = len(documents)
+            documents.append(Document(category, position, name))
+            for label, text in texts:
+                field_id = len(fields)
+                fields.append((doc, label))
+                for token_position, term in enumerate(tokenize(text)):
+                    pairs = postings.get(term)
+                    if pairs is None:
+                        pairs = postings[term] = array("I")
+                    pairs.append(field_id)
+                    pairs.append(token_position)
+        return cls(documents, fields, postings)
+
+    @classmethod
+    def open(cls, data_dir: Path = DEFAULT_DATA_DIR) -> "SearchIndex":
+        """
+        Load the index saved next to the processed data, rebuilding it if missing or stale.
+
+        Args:
+            data_dir: Processed data directory
+
+        Returns:
+            The index
+        """
+        index_file = data_dir / SEARCH_INDEX_FILE
+        if is_fresh(index_file, data_dir):
+            try:
+                return cls.load(index_file)
+            except ValueError:
+                pass  # Older format: rebuild
+
+        index = cls.build(Catalog.load(data_dir))
+        index.save(index_file)
+        return index
+
+    @classmethod
+    def load(cls, path: Path) -> "SearchIndex":
+        """
+        Read a saved index.
+
+        Raises:
+            ValueError: If the file was written by an incompatible version
+        """
+        data = read_index(path, FORMAT_VERSION)
+        return cls(
+            [Document(*doc) for doc in data["documents"]],
+            [(doc, label) for doc, label in data["fields"]],
+            {term: array("I", pairs) for term, pairs in data["postings"].items()},
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the index next to the processed data."""
+        fields = zip(self.field_docs, self.field_labels, strict=True)
+        write_index(
+            path,
+            {
+                "version": FORMAT_VERSION,
+                "documents": [[d.category, d.position, d.name] for d in self.documents],
+                "fields": [list(pair) for pair in fields],
+                "postings": {term: pairs.tolist() for term, pairs in self.postings.items()},
+            },
+        )
+
+    def _term(self, term: str) -> tuple[dict[int, float], dict[int, list[int]]]:
+        """
+        BM25 weight of a term in each document containing it, and the fields it occurs in.
+
+        Both depend only on the index, so they are computed once per term.
+        """
+        cached = self._terms.get(term)
+        if cached is None:
+            occurrences: dict[int, list[int]] = {}
+            for field_id in self.postings.get(term, array("I"))[::2]:
+                occurrences.setdefault(self.field_docs[field_id], []).append(field_id)
+
+            n, df = len(self.documents), len(occurrences)
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            weights = {}
+            for doc, field_ids in occurrences.items():
+                tf = len(field_ids)
+                norm = K1 * (1 - B + B * self.lengths[doc] / self.average_length)
+                weights[doc] = idf * tf * (K1 + 1) / (tf + norm)
+            cached = self._terms[term] = (weights, occurrences)
+        return cached
+
+    def _phrase_fields(self, terms: list[str]) -> set[int]:
+        """Fields in which the terms occur consecutively."""
+        occurrences = []
+        for term in terms:
+            pairs = self.postings.get(term, array("I"))
+            occurrences.append(set(zip(pairs[::2], pairs[1::2], strict=True)))
+        return {
+            field_id
+            for field_id, start in occurrences[0]
+            if all((field_id, start + i) in occurrences[i] for i in range(1, len(terms)))
+        }
+
+    def search(self, query: str, limit: int = 10, phrase: bool = False) -> list[SearchHit]:
+        """
+        Rank documents against a keyword query with BM25.
+
+        Args:
+            query: Free text; every term contributes to the score
+            limit: Maximum number of hits
+            phrase: Only match documents containing the terms in this order, adjacent
+
+        Returns:
+            Hits, best first
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        allowed: set[int] | None = None
+        if phrase:
+            phrase_fields = self._phrase_fields(tokenize(query))
+            allowed = {self.field_docs[field_id] for field_id in phrase_fields}
+
+        scores: dict[int, float] = {}
+        for term in terms:
+            for doc, weight in self._term(term)[0].items():
+                if allowed is None or doc in allowed:
+                    scores[doc] = scores.get(doc, 0.0) + weight
+
+        hits = []
+        for doc, score in heapq.nlargest(limit, scores.items(), key=itemgetter(1)):
+            if phrase:
+                matched = {f for f in phrase_fields if self.field_docs[f] == doc}
+            else:
+                matched = {f for term in terms for f in self._term(term)[1].get(doc, ())}
+            labels = dict.fromkeys(self.field_labels[f] for f in sorted(matched))
+            hits.append(SearchHit(self.documents[doc], score, list(labels)))
+        return hits
@@ -0,0 +1,45 @@
+"""Index files saved next to the processed data."""
+
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+
+def source_files(data_dir: Path) -> Iterator[Path]:
+    """Scraper outputs that indexes are built from."""
+    for stem in ("characters", "weapons", "geniemon", "demon_wedges"):
+        yield from data_dir.glob(f"{stem}.*json")
+    yield from (data_dir / "characters").glob("*_detail.*json")
+
+
+def is_fresh(index_file: Path, data_dir: Path) -> bool:
+    """Whether an index file exists and is no older than any scraper output."""
+    if not index_file.exists():
+        return False
+    newest = max((p.stat().st_mtime for p in source_files(data_dir)), default=0.0)
+    return index_file.stat().st_mtime >= newest
+
+
+def read_index(path: Path, version: int) -> dict[str, Any]:
+    """
+    Read an index file.
+
+    Raises:
+        ValueError: If the file was written by an incompatible version
+    """
+    with open(path, encoding="utf-8") as f:
+        data: dict[str, Any] = json.load(f)
+    if data.get("version") != version:
+        raise ValueError(f"Unsupported {path.name} version: {data.get('version')}")
+    return data
+
+
+def write_index(path: Path, data: dict[str, Any]) -> None:
+    """Write an index file as compact JSON, replacing any previous file atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    tmp_file.replace(path)
@@ -4,6 +4,7 @@ from .base import BaseScraper
 from .character import CharacterScraper
 from .demon_wedge import DemonWedgeScraper
 from .geniemon import GeniemonScraper
+from .transport import Transport
 from .weapon import WeaponScraper
 
 __all__ = [
@@ -11,5 +12,6 @@ __all__ = [
     "CharacterScraper",
     "DemonWedgeScraper",
     "GeniemonScraper",
+    "Transport",
     "WeaponScraper",
 ]
@@ -0,0 +1,69 @@
+"""HTML parser backends used by scrapers."""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml import etree
+
+
+class ParserBackend(ABC):
+    """Turns raw HTML into the document object a scraper walks."""
+
+    name: str
+
+    @abstractmethod
+    def parse(self, html_content: str) -> Any:
+        """Parse an HTML document."""
+        pass
+
+
+class BeautifulSoupBackend(ParserBackend):
+    """BeautifulSoup tree built on the lxml parser (the original code path)."""
+
+    name = "bs4"
+
+    def parse(self, html_content: str) -> BeautifulSoup:
+        """Parse into a BeautifulSoup tree."""
+        return BeautifulSoup(html_content, "lxml")
+
+
+class LxmlBackend(ParserBackend):
+    """Plain `lxml.html` element tree, queried with compiled XPath."""
+
+    name = "lxml"
+
+    def parse(self, html_content: str) -> etree._Element:
+        """Parse into an lxml element tree."""
+        return lxml.html.document_fromstring(html_content)
+
+
+BACKENDS: dict[str, ParserBackend] = {
+    backend.name: backend for backend in (LxmlBackend(), BeautifulSoupBackend())
+}
+
+
+def get_backend(name: str) -> ParserBackend:
+    """
+    Look up a parser backend by name.
+
+    Raises:
+        ValueError: If no backend has that name
+    """
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown parser backend: {name} (choose from {', '.join(BACKENDS)})")
+
+
+def class_contains(token: str) -> str:
+    """XPath predicate matching elements whose class list contains `token`."""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {token} ")'
+
+
+def element_text(element: etree._Element, separator: str = "", strip: bool = True) -> str:
+    """Text of an lxml element, matching BeautifulSoup's `get_text` semantics."""
+    if not strip:
+        return separator.join(element.itertext())
+    return separator.join(s for s in (t.strip() for t in element.itertext()) if s)
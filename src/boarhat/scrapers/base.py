@@ -1,24 +1,50 @@
 """Base scraper class."""
 
+import io
 import json
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any, Generic, TypeVar
 
 import httpx
 from bs4 import BeautifulSoup
 
+from boarhat.cache.manager import CacheManager
+from boarhat.cache.metadata import PageMeta, content_hash, utc_now
+from boarhat.cache.parsed import PageSource, ParseCache
+from boarhat.cache.store import RawStore
+from boarhat.models.base import Model
+from boarhat.models.catalog import read_records
+from boarhat.scrapers.backends import get_backend
+from boarhat.scrapers.output import AtomicWriter, StreamWriter, WriteStatus
+from boarhat.scrapers.transport import Transport, get_default_transport
+
 T = TypeVar("T")
 
+OUTPUT_FORMATS = ("json", "ndjson")
+NDJSON_BUFFER_SIZE = 1024 * 1024
+
 
 class BaseScraper(ABC, Generic[T]):
     """Base class for all scrapers."""
 
+    # Parser backends this scraper implements, and the one used by default
+    supported_parsers: tuple[str, ...] = ("bs4",)
+    default_parser = "bs4"
+
+    # Model rebuilt from reused parse results (needs a `from_dict` classmethod)
+    model_class: type[Model] | None = None
+
     def __init__(
         self,
         source: str | Path,
         output_dir: Path,
         cache_dir: Path | None = None,
+        transport: Transport | None = None,
+        revalidate: bool = False,
+        parser: str | None = None,
+        output_format: str = "json",
     ):
         """
         Initialize the scraper.
@@ -26,14 +52,55 @@ class BaseScraper(ABC, Generic[T]):
         Args:
             source: URL or Path to HTML file to scrape
             output_dir: Directory to save output files
-            cache_dir: Optional directory to cache downloaded HTML
+            cache_dir: Optional directory for the raw page store
+            transport: Optional shared HTTP transport (defaults to the process-wide one)
+            revalidate: Check cached pages with conditional requests even if
+                they have not expired yet
+            parser: Parser backend name (defaults to the scraper's preferred one)
+            output_format: "json" (indented array) or "ndjson" (one compact
+                object per line, written as items are scraped)
         """
+        parser = parser or self.default_parser
+        if parser not in self.supported_parsers:
+            raise ValueError(
+                f"{type(self).__name__} does not support the {parser!r} parser "
+                f"(choose from {', '.join(self.supported_parsers)})"
+            )
+
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Unknown output format: {output_format} (choose from {', '.join(OUTPUT_FORMATS)})"
+            )
+
         self.source = source
         self.output_dir = output_dir
         self.cache_dir = cache_dir or Path("data/raw")
+        self.transport = transport or get_default_transport()
+        self.store = RawStore(self.cache_dir)
+        self.cache = CacheManager(self.store)
+        self.revalidate = revalidate
+        self._refreshed = False
+        self.backend = get_backend(parser)
+        self.output_format = output_format
+        self.output_status: WriteStatus | None = None
+        self.parsed = ParseCache(self.cache_dir)
+        self._preloaded_html: str | None = None
+        self._parse_key: str | None = None
+        self._page_hash: str | None = None
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle without the HTTP transport, which holds open connections."""
+        state = self.__dict__.copy()
+        state["transport"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled scraper with this process's default transport."""
+        self.__dict__.update(state)
+        self.transport = get_default_transport()
+
     @property
     @abstractmethod
     def category_name(self) -> str:
@@ -41,38 +108,130 @@ class BaseScraper(ABC, Generic[T]):
         pass
 
     @abstractmethod
-    def scrape(self) -> list[T]:
+    def scrape(self) -> Iterable[T]:
         """
         Scrape data from the HTML file.
 
+        Scrapers for large pages may return a generator so items are
+        produced while the page is still being parsed.
+
         Returns:
-            List of scraped data objects
+            Scraped data objects
         """
         pass
 
-    def load_html(self) -> BeautifulSoup:
-        """Load and parse HTML from source (URL or file)."""
+    @property
+    def is_remote(self) -> bool:
+        """Whether the source is a URL rather than a local file."""
+        return isinstance(self.source, str) and self.source.startswith("http")
+
+    @property
+    def is_cached(self) -> bool:
+        """Whether a current copy of this scraper's page is in the cache."""
+        return self.store.has(self.category_name)
+
+    @property
+    def needs_fetch(self) -> bool:
+        """Whether the page must be requested before it can be read from cache."""
+        if not self.is_remote:
+            return False
+        if self._refreshed:
+            return False
+        if not self.is_cached:
+            return True
+        return self.revalidate or self.cache.is_expired(self.category_name)
+
+    def clear_cache(self) -> bool:
+        """
+        Drop the cached page so the next run fetches it again.
+
+        Returns:
+            True if a page was cached
+        """
+        return self.store.invalidate(self.category_name)
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Validator headers for the cached copy, if there is one."""
+        meta = self.store.meta(self.category_name)
+        return meta.conditional_headers() if meta else {}
+
+    def cache_html(self, html_content: str, response: httpx.Response | None = None) -> None:
+        """Write fetched HTML and its metadata to the cache."""
+        meta = PageMeta(url=str(self.source), fetched_at=utc_now())
+        if response is not None:
+            meta.etag = response.headers.get("ETag", "")
+            meta.last_modified = response.headers.get("Last-Modified", "")
+        digest = self.store.put(self.category_name, html_content, meta)
+        print(f"[{self.category_name}] Cached to: {self.store.object_path(digest)}")
+        self.cache.enforce_size_limit()
+
+    def read_cache(self) -> str:
+        """Read the cached HTML and mark it as recently used."""
+        html_content = self.store.read(self.category_name)
+        self.store.touch(self.category_name)
+        return html_content
+
+    def fall_back_to_cache(self, error: Exception) -> bool:
+        """
+        Keep using a stale cached copy when refreshing it failed.
+
+        Returns:
+            True if a cached copy is available
+        """
+        if not self.is_cached:
+            return False
+        print(f"[{self.category_name}] Refresh failed ({error}), using cached copy")
+        self._refreshed = True
+        return True
+
+    def accept_response(self, response: httpx.Response) -> str:
+        """
+        Update the cache from a (possibly conditional) response.
+
+        Returns:
+            Page HTML, taken from the cache when the server answered 304
+        """
+        self._refreshed = True
+
+        if response.status_code == 304 and self.is_cached:
+            print(f"[{self.category_name}] Not modified, using cache")
+            meta = self.store.meta(self.category_name) or PageMeta(url=str(self.source))
+            meta.fetched_at = utc_now()
+            self.store.update_meta(self.category_name, meta)
+            return self.read_cache()
+
+        response.raise_for_status()
+        html_content = response.text
+        self.cache_html(html_content, response)
+        return html_content
+
+    def fetch_html(self) -> str:
+        """Request the page, sending validators for any cached copy."""
+        headers = self.conditional_headers()
+        verb = "Revalidating" if headers else "Fetching"
+        print(f"[{self.category_name}] {verb} from URL: {self.source}")
+        try:
+            response = self.transport.get(str(self.source), headers=headers)
+            return self.accept_response(response)
+        except httpx.HTTPError as e:
+            if not self.fall_back_to_cache(e):
+                raise
+            return self.read_cache()
+
+    def read_html(self) -> str:
+        """Read raw HTML from source (URL or file), using the cache for URLs."""
+        if self._preloaded_html is not None:
+            return self._preloaded_html
+
         html_content = ""
 
         # Check if source is a URL
-        if isinstance(self.source, str) and self.source.startswith("http"):
-            # Check cache first
-            cache_file = self.cache_dir / f"{self.category_name}.html"
-
-            if cache_file.exists():
-                print(f"[{self.category_name}] Loading from cache: {cache_file}")
-                with open(cache_file, encoding="utf-8") as f:
-                    html_content = f.read()
+        if self.is_remote:
+            if self.needs_fetch:
+                html_content = self.fetch_html()
             else:
-                print(f"[{self.category_name}] Fetching from URL: {self.source}")
-                response = httpx.get(self.source, follow_redirects=True, timeout=30.0)
-                response.raise_for_status()
-                html_content = response.text
-
-                # Cache the response
-                with open(cache_file, "w", encoding="utf-8") as f:
-                    f.write(html_content)
-                print(f"[{self.category_name}] Cached to: {cache_file}")
+                print(f"[{self.category_name}] Loading from cache: {self.store.root}")
+                html_content = self.read_cache()
         else:
             # Load from file
             file_path = Path(self.source)
@@ -82,52 +241,276 @@ class BaseScraper(ABC, Generic[T]):
             with open(file_path, encoding="utf-8") as f:
                 html_content = f.read()
 
-        return BeautifulSoup(html_content, "lxml")
+        return html_content
+
+    def open_html(self) -> io.BufferedIOBase:
+        """Open raw HTML from source as a byte stream, fetching into the cache first for URLs."""
+        if self._preloaded_html is not None:
+            return io.BytesIO(self._preloaded_html.encode("utf-8"))
+
+        if not self.is_remote:
+            file_path = Path(self.source)
+            if not file_path.exists():
+                raise FileNotFoundError(f"HTML file not found: {file_path}")
+            return open(file_path, "rb")
+
+        if self.needs_fetch:
+            self.fetch_html()
+        else:
+            print(f"[{self.category_name}] Loading from cache: {self.store.root}")
+            self.store.touch(self.category_name)
+        return self.store.open(self.category_name)
+
+    def load_html(self) -> BeautifulSoup:
+        """Load and parse HTML from source (URL or file)."""
+        return BeautifulSoup(self.read_html(), "lxml")
 
-    def save_json(self, data: list[dict[str, Any]], filename: str | None = None) -> Path:
+    def parse_html(self) -> Any:
+        """Load HTML and parse it with the selected backend."""
+        return self.backend.parse(self.read_html())
+
+    @property
+    def output_stem(self) -> str:
+        """Output file name without extension."""
+        return self.category_name
+
+    def save_output(self, data: Iterable[dict[str, Any]]) -> Path:
+        """
+        Save records in the configured output format.
+
+        An output left in the other format is removed, so readers never
+        pick up stale data from an earlier run.
+        """
+        if self.output_format == "ndjson":
+            output_path = self.save_ndjson(data)
+        else:
+            output_path = self.save_json(data)
+
+        for output_format in OUTPUT_FORMATS:
+            stale = output_path.with_suffix(f".{output_format}")
+            if stale != output_path and stale.exists():
+                stale.unlink()
+                print(f"[{self.category_name}] Removed {stale} (now written as {output_path.name})")
+                if self.output_status == "unchanged":
+                    self.output_status = "changed"
+        return output_path
+
+    def save_json(self, data: Iterable[dict[str, Any]], filename: str | None = None) -> Path:
         """
         Save data to JSON file.
 
+        Items are written as they are produced, so a generator is never
+        materialized in full. The output matches `json.dump(..., indent=2)`.
+        The file is replaced atomically, and left untouched if unchanged.
+
         Args:
-            data: List of dictionaries to save
-            filename: Optional filename (defaults to category_name.json)
+            data: Dictionaries to save
+            filename: Optional filename (defaults to <output_stem>.json)
 
         Returns:
             Path to the saved file
         """
         if filename is None:
-            filename = f"{self.category_name}.json"
+            filename = f"{self.output_stem}.json"
 
         output_file = self.output_dir / filename
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with AtomicWriter(output_file) as f:
+            separator = "[\n"
+            for item in data:
+                f.write(separator)
+                f.write(_indent(json.dumps(item, indent=2, ensure_ascii=False)))
+                separator = ",\n"
+            f.write("[]" if separator == "[\n" else "\n]")
 
+        self.output_status = f.status
         return output_file
 
-    def run(self) -> tuple[list[T], Path]:
+    def save_ndjson(self, data: Iterable[dict[str, Any]], filename: str | None = None) -> Path:
+        """
+        Save data as newline-delimited JSON, one compact object per line.
+
+        The file is written in place (see `StreamWriter`), so readers can
+        consume it while a scrape is still running; lines reach the file
+        as the write buffer fills. Unlike JSON output, it is not replaced
+        atomically and is rewritten even when unchanged.
+
+        Args:
+            data: Dictionaries to save
+            filename: Optional filename (defaults to <output_stem>.ndjson)
+
+        Returns:
+            Path to the saved file
+        """
+        if filename is None:
+            filename = f"{self.output_stem}.ndjson"
+
+        output_file = self.output_dir / filename
+
+        with StreamWriter(output_file, buffering=NDJSON_BUFFER_SIZE) as f:
+            for item in data:
+                f.write(json.dumps(item, ensure_ascii=False, separators=(",", ":")))
+                f.write("\n")
+
+        self.output_status = f.status
+        return output_file
+
+    def to_record(self, item: T) -> dict[str, Any]:
+        """Convert a scraped item to a plain dictionary."""
+        # Convert to dict if objects have to_dict method
+        if hasattr(item, "to_dict"):
+            record: dict[str, Any] = item.to_dict()
+            return record
+        if isinstance(item, dict):
+            return item
+        return item.__dict__
+
+    def parse_records(self, html_content: str) -> list[dict[str, Any]]:
+        """
+        Parse already-fetched HTML into plain dictionaries.
+
+        Used to parse pages in worker processes, which never touch the
+        network and send back picklable results.
+
+        Args:
+            html_content: Raw HTML of this scraper's page
+
+        Returns:
+            Scraped items as dictionaries
+        """
+        self._preloaded_html = html_content
+        try:
+            return [self.to_record(item) for item in self.scrape()]
+        finally:
+            self._preloaded_html = None
+
+    def page_hash(self) -> str | None:
+        """
+        Content hash of the page to parse, fetching it first when the cache is stale.
+
+        Returns:
+            The hash, or None if the source file does not exist
+        """
+        if self._preloaded_html is not None:
+            return content_hash(self._preloaded_html)
+
+        if not self.is_remote:
+            file_path = Path(self.source)
+            return content_hash(file_path.read_bytes()) if file_path.exists() else None
+
+        if self.needs_fetch:
+            self.fetch_html()
+        return self.store.current_hash(self.category_name)
+
+    @property
+    def page_source(self) -> PageSource:
+        """Where the parsed page comes from, which decides when its parse result expires."""
+        return "store" if self.is_remote else "file"
+
+    def parse_key_parts(self) -> list[str]:
+        """Inputs besides the page and the code that decide the parse output."""
+        return [type(self).__qualname__, self.backend.name, str(self.source)]
+
+    def lookup_parsed(self) -> list[dict[str, Any]] | None:
+        """
+        Records from an earlier parse of the same page with the same code.
+
+        Also remembers the key, so `remember_parsed` can store a fresh parse.
+
+        Returns:
+            The stored records, or None if the page must be parsed
+        """
+        self._page_hash = self.page_hash()
+        if self._page_hash is None:
+            self._parse_key = None
+            return None
+
+        self._parse_key = ParseCache.key(self._page_hash, *self.parse_key_parts())
+        records = self.parsed.get(self._parse_key)
+        if records is not None:
+            print(f"[{self.category_name}] Page unchanged since last parse, reusing results")
+            if self.is_remote:
+                self.store.touch(self.category_name)
+        return records
+
+    def remember_parsed(self, records: list[dict[str, Any]]) -> None:
+        """Store records parsed from the page last looked up with `lookup_parsed`."""
+        if self._parse_key is not None and self._page_hash is not None:
+            self.parsed.put(self._parse_key, self._page_hash, records, self.page_source)
+
+    def tee_parsed(self, records: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        """
+        Pass records through while storing them like `remember_parsed`.
+
+        The entry is written as records go by and stored once the last one
+        has passed; a parse that fails part-way stores nothing.
+        """
+        if self._parse_key is None or self._page_hash is None:
+            yield from records
+            return
+        with self.parsed.writer(self._parse_key, self._page_hash, self.page_source) as writer:
+            for record in records:
+                writer.add(record)
+                yield record
+
+    def from_records(self, records: list[dict[str, Any]]) -> list[T]:
+        """Rebuild scraped items from their dictionaries."""
+        if self.model_class is None:
+            return records  # type: ignore[return-value]
+        return [self.model_class.from_dict(record) for record in records]  # type: ignore[misc]
+
+    def load_output(self) -> list[T]:
+        """Read back the items saved by the last run (or an earlier one)."""
+        return self.from_records(read_records(self.output_dir / self.output_stem))
+
+    def save_records(self, records: list[dict[str, Any]]) -> Path:
+        """Save records parsed elsewhere (e.g. by `parse_records`) and report them."""
+        print(f"[{self.category_name}] Found {len(records)} items")
+        output_path = self.save_output(records)
+        self._report_saved(output_path)
+        return output_path
+
+    def _report_saved(self, output_path: Path) -> None:
+        """Log where the output went and whether it changed."""
+        if self.output_status == "unchanged":
+            print(f"[{self.category_name}] Unchanged: {output_path}")
+        else:
+            print(f"[{self.category_name}] Saved to {output_path}")
+
+    def run(self) -> tuple[int, Path]:
         """
         Run the scraper and save results.
 
+        Items are converted and written one at a time as `scrape()` yields
+        them, and none are kept, so memory does not grow with the page.
+        Use `load_output` to read the saved items back.
+
         Returns:
-            Tuple of (scraped data, output file path)
+            Tuple of (number of items, output file path)
         """
         print(f"[{self.category_name}] Scraping from {self.source}...")
-        data = self.scrape()
 
-        print(f"[{self.category_name}] Found {len(data)} items")
+        # Skip parsing entirely when this exact page was parsed by this exact code
+        cached = self.lookup_parsed()
+        if cached is not None:
+            return len(cached), self.save_records(cached)
 
-        # Convert to dict if objects have to_dict method
-        dict_data = []
-        for item in data:
-            if hasattr(item, "to_dict"):
-                dict_data.append(item.to_dict())
-            elif isinstance(item, dict):
-                dict_data.append(item)
-            else:
-                dict_data.append(item.__dict__)
+        count = 0
+
+        def convert() -> Iterator[dict[str, Any]]:
+            nonlocal count
+            for item in self.scrape():
+                count += 1
+                yield self.to_record(item)
+
+        output_path = self.save_output(self.tee_parsed(convert()))
+
+        print(f"[{self.category_name}] Found {count} items")
+        self._report_saved(output_path)
+
+        return count, output_path
 
-        output_path = self.save_json(dict_data)
-        print(f"[{self.category_name}] Saved to {output_path}")
 
-        return data, output_path
+def _indent(text: str, prefix: str = "  ") -> str:
+    """Indent every line of a JSON fragment one level."""
+    return prefix + text.replace("\n", "\n" + prefix)
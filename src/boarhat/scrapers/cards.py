@@ -0,0 +1,402 @@
+"""Declarative card schemas and helpers for card-style list pages (weapons, geniemon, wedges)."""
+
+import io
+import re
+from bisect import bisect_left
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Any, Literal
+
+from bs4 import Tag
+from lxml import etree
+
+from boarhat.scrapers.backends import class_contains, element_text
+
+CARD_HEADINGS = etree.XPath('//h2[@class="text-xl font-bold text-white"]')
+CARD_HEADINGS_WITHIN = etree.XPath('.//h2[@class="text-xl font-bold text-white"]')
+CARD_CONTAINER = etree.XPath(f"ancestor::div[{class_contains('bg-gray-900')}][1]")
+
+STYLE_URL_PREFIX = "background-image:url("
+
+# Byte patterns used to find card boundaries without parsing
+CARD_HEADING_BYTES = re.compile(rb'<h2 class="text-xl font-bold text-white"')
+CARD_START_BYTES = b'<div class="bg-gray-900'
+
+# Elements the card visitor looks at; everything else is passed over
+VISITED_TAGS = ("span", "div", "h3", "ul", "p")
+
+
+def first(result: list) -> etree._Element | None:
+    """First element of an XPath result, or None."""
+    return result[0] if result else None
+
+
+class LxmlNodes:
+    """Tree access for cards parsed by the lxml backend."""
+
+    @staticmethod
+    def walk(card: etree._Element) -> Iterator[etree._Element]:
+        """The card and its descendants with a visited tag, in document order."""
+        elements: Iterator[etree._Element] = card.iter(VISITED_TAGS)
+        return elements
+
+    tag = attrgetter("tag")  # Tag name
+
+    @staticmethod
+    def attr(element: etree._Element, name: str) -> str:
+        """Attribute value, or "" if absent."""
+        value: str = element.get(name, "")
+        return value
+
+    @staticmethod
+    def descendants(element: etree._Element, tag: str) -> Iterator[etree._Element]:
+        """Descendants with a tag, in document order."""
+        elements: Iterator[etree._Element] = element.iter(tag)
+        return elements
+
+    @staticmethod
+    def container(element: etree._Element) -> etree._Element | None:
+        """Nearest enclosing `<div>`."""
+        return next(element.iterancestors("div"), None)
+
+    text = staticmethod(element_text)
+
+
+class SoupNodes:
+    """Tree access for cards parsed by the bs4 backend."""
+
+    @staticmethod
+    def walk(card: Tag) -> Iterator[Tag]:
+        """The card and its descendants with a visited tag, in document order."""
+        if card.name in VISITED_TAGS:
+            yield card
+        yield from card.find_all(VISITED_TAGS)
+
+    tag = attrgetter("name")  # Tag name
+
+    @staticmethod
+    def attr(element: Tag, name: str) -> str:
+        """Attribute value, or "" if absent (multi-valued ones joined by spaces)."""
+        value = element.get(name)
+        if isinstance(value, list):
+            return " ".join(value)
+        return value or ""
+
+    @staticmethod
+    def descendants(element: Tag, tag: str) -> Iterator[Tag]:
+        """Descendants with a tag, in document order."""
+        return iter(element.find_all(tag))
+
+    @staticmethod
+    def container(element: Tag) -> Tag | None:
+        """Nearest enclosing `<div>`."""
+        return element.find_parent("div")
+
+    @staticmethod
+    def text(element: Tag, separator: str = "") -> str:
+        """Text of the element, stripped piecewise."""
+        return element.get_text(separator=separator, strip=True)
+
+
+Nodes = type[LxmlNodes] | type[SoupNodes]
+
+
+@dataclass(frozen=True)
+class Badge:
+    """
+    Rule assigning a badge (`<span class="px-2 py-1 ...">`) to a field.
+
+    A badge fills the field of the first rule it matches. Every condition
+    that is set must hold.
+    """
+
+    field: str
+    css_class: str | None = None
+    contains: str | None = None
+    title: str | None = None
+    values: tuple[str, ...] = ()
+
+    def matches(self, text: str, css_class: str, title: str) -> bool:
+        """Whether a badge with this text, class attribute and title matches the rule."""
+        if self.css_class is not None and self.css_class not in css_class:
+            return False
+        if self.contains is not None and self.contains not in text:
+            return False
+        if self.title is not None and self.title != title:
+            return False
+        return not self.values or text in self.values
+
+
+@dataclass(frozen=True)
+class Section:
+    """
+    Field read from the content after an `<h3>` heading.
+
+    Kinds:
+        text: text of the next `<p>`
+        list: texts of the `<li>` items in the next `<ul>`
+        container: text of the heading's enclosing `<div>`, minus the heading
+    """
+
+    field: str
+    heading: str
+    kind: Literal["text", "list", "container"] = "text"
+    exact: bool = True
+    separator: str = ""
+
+    def matches(self, heading_text: str) -> bool:
+        """Whether a heading introduces this section."""
+        if self.exact:
+            return heading_text == self.heading
+        return self.heading in heading_text
+
+
+@dataclass(frozen=True)
+class Block:
+    """Field read from the first `<div>` whose class attribute contains all of `classes`."""
+
+    field: str
+    classes: tuple[str, ...]
+    paragraphs: bool = False  # Collect each `<p>` text instead of the whole text
+
+
+@dataclass(frozen=True)
+class CardSchema:
+    """
+    Declarative description of the fields on a card.
+
+    `extract` fills every field in a single walk over the card's subtree,
+    instead of one subtree search per field. Cards from either parser
+    backend are read natively (see `LxmlNodes` and `SoupNodes`).
+    """
+
+    badges: tuple[Badge, ...] = ()
+    sections: tuple[Section, ...] = ()
+    blocks: tuple[Block, ...] = ()
+    image_field: str | None = "image_url"
+    defaults: dict[str, Any] = field(default_factory=dict)
+
+    def _initial_values(self) -> dict[str, Any]:
+        """Field values for a card with none of the described content."""
+        values: dict[str, Any] = {}
+        for section in self.sections:
+            values[section.field] = [] if section.kind == "list" else ""
+        for block in self.blocks:
+            values[block.field] = [] if block.paragraphs else ""
+        if self.image_field:
+            values[self.image_field] = ""
+        values.update(self.defaults)
+        return values
+
+    def _classify_badge(self, nodes: Nodes, badge: Any, values: dict[str, Any]) -> None:
+        """Store a badge's text in the field of the first matching rule."""
+        text = nodes.text(badge)
+        css_class = nodes.attr(badge, "class")
+        title = nodes.attr(badge, "title")
+        for rule in self.badges:
+            if rule.matches(text, css_class, title):
+                values[rule.field] = text
+                return
+
+    def extract(self, card: etree._Element | Tag) -> dict[str, Any]:
+        """
+        Extract every described field from a card in one pass.
+
+        Args:
+            card: lxml element or BeautifulSoup tag containing the card
+
+        Returns:
+            Field name -> value
+        """
+        nodes: Nodes = SoupNodes if isinstance(card, Tag) else LxmlNodes
+        text = nodes.text
+        attr = nodes.attr
+        tag_of = nodes.tag
+        values = self._initial_values()
+        found: set[str] = set()
+        # Sections waiting for the next <ul> or <p> after their heading
+        pending: dict[str, list[Section]] = {"ul": [], "p": []}
+
+        for element in nodes.walk(card):
+            tag = tag_of(element)
+
+            if tag == "span":
+                css_class = attr(element, "class")
+                if "px-2" in css_class and "py-1" in css_class:
+                    self._classify_badge(nodes, element, values)
+
+            elif tag == "div":
+                if self.image_field and self.image_field not in found:
+                    style = attr(element, "style")
+                    if STYLE_URL_PREFIX in style:
+                        values[self.image_field] = _style_url(style)
+                        found.add(self.image_field)
+                css_class = attr(element, "class")
+                for block in self.blocks:
+                    if block.field in found or not all(c in css_class for c in block.classes):
+                        continue
+                    found.add(block.field)
+                    if block.paragraphs:
+                        values[block.field] = [text(p) for p in nodes.descendants(element, "p")]
+                    else:
+                        values[block.field] = text(element)
+
+            elif tag == "h3":
+                heading_text = text(element)
+                for section in self.sections:
+                    if section.field in found or not section.matches(heading_text):
+                        continue
+                    found.add(section.field)
+                    if section.kind == "container":
+                        values[section.field] = _container_text(nodes, element, section)
+                    else:
+                        pending["ul" if section.kind == "list" else "p"].append(section)
+
+            elif pending[tag]:
+                for section in pending[tag]:
+                    if section.kind == "list":
+                        values[section.field] = [
+                            text(li, section.separator) for li in nodes.descendants(element, "li")
+                        ]
+                    else:
+                        values[section.field] = text(element)
+                pending[tag].clear()
+
+        return values
+
+
+def _style_url(style: str) -> str:
+    """Image URL from a `background-image:url(...)` style attribute."""
+    start_idx = style.find(STYLE_URL_PREFIX) + len(STYLE_URL_PREFIX)
+    end_idx = style.find(")", start_idx)
+    image_url = style[start_idx:end_idx]
+    if image_url.startswith("/"):
+        image_url = f"https://boarhat.gg{image_url}"
+    return image_url
+
+
+def _container_text(nodes: Nodes, heading: Any, section: Section) -> str:
+    """Text of a heading's enclosing `<div>` with the heading text removed."""
+    container = nodes.container(heading)
+    if container is None:
+        return ""
+    full_text = nodes.text(container, section.separator)
+    if section.heading not in full_text:
+        return ""
+    return full_text.replace(section.heading, "", 1).strip()
+
+
+def iter_cards(
+    document: etree._Element, skip: list[str]
+) -> Iterator[tuple[str, etree._Element, etree._Element]]:
+    """
+    Yield (name, heading, card) for each card on a list page.
+
+    Args:
+        document: Parsed page
+        skip: Heading texts that belong to filters rather than cards
+    """
+    for heading in CARD_HEADINGS(document):
+        name = element_text(heading)
+        if name in skip:
+            continue
+        card = first(CARD_CONTAINER(heading))
+        if card is not None:
+            yield name, heading, card
+
+
+def iter_soup_cards(soup: Tag, skip: list[str]) -> Iterator[tuple[str, Tag, Tag]]:
+    """
+    Yield (name, heading, card) for each card found in a BeautifulSoup tree.
+
+    This is the bs4 fallback: cards stay BeautifulSoup tags, which
+    `CardSchema` reads without going through lxml.
+
+    Args:
+        soup: Page parsed by the bs4 backend
+        skip: Heading texts that belong to filters rather than cards
+    """
+    for heading in soup.find_all("h2", class_="text-xl font-bold text-white"):
+        name = heading.get_text(strip=True)
+        if name in skip:
+            continue
+        card = heading.find_parent("div", class_="bg-gray-900")
+        if card is not None:
+            yield name, heading, card
+
+
+def iter_streamed_cards(
+    stream: io.BufferedIOBase, skip: list[str]
+) -> Iterator[tuple[str, etree._Element, etree._Element]]:
+    """
+    Yield (name, heading, card) for each card while the page is still being parsed.
+
+    Each card's subtree, and everything parsed before it, is freed once the
+    consumer asks for the next card, so memory stays flat however long the
+    page is. Callers must finish with a card before advancing.
+
+    Args:
+        stream: Raw HTML byte stream
+        skip: Heading texts that belong to filters rather than cards
+    """
+    for _, element in etree.iterparse(stream, events=("end",), tag="div", html=True):
+        if "bg-gray-900" not in element.get("class", "").split():
+            continue
+
+        # A card closes before any container that wraps it, so each heading
+        # is seen exactly once, under its nearest card container
+        for heading in CARD_HEADINGS_WITHIN(element):
+            name = element_text(heading)
+            if name not in skip:
+                yield name, heading, element
+
+        element.clear(keep_tail=True)
+        parent = element.getparent()
+        while parent is not None and element.getprevious() is not None:
+            del parent[0]
+
+
+def card_offsets(html: bytes) -> list[int]:
+    """
+    Byte offsets where cards start, found by scanning the raw page.
+
+    A card starts at the last `bg-gray-900` container opened before its
+    heading, which is where `CARD_CONTAINER` finds it in the parsed tree.
+    """
+    offsets = set()
+    for match in CARD_HEADING_BYTES.finditer(html):
+        start = html.rfind(CARD_START_BYTES, 0, match.start())
+        if start != -1:
+            offsets.add(start)
+    return sorted(offsets)
+
+
+def shard_ranges(offsets: list[int], end: int, shards: int) -> list[tuple[int, int]]:
+    """
+    Split a page into about `shards` byte ranges of similar size, cut only at card starts.
+
+    Args:
+        offsets: Sorted card start offsets
+        end: Length of the page
+        shards: Number of ranges wanted
+
+    Returns:
+        (start, end) pairs in document order, covering every card
+    """
+    if not offsets:
+        return [(0, end)]
+
+    bounds = [offsets[0]]
+    span = end - offsets[0]
+    for i in range(1, shards):
+        k = bisect_left(offsets, offsets[0] + span * i // shards)
+        if k < len(offsets) and offsets[k] > bounds[-1]:
+            bounds.append(offsets[k])
+    bounds.append(end)
+    return list(zip(bounds, bounds[1:], strict=False))
+
+
+def parse_fragment(fragment: bytes) -> etree._Element:
+    """Parse a range of a page; stray closing tags at the edges are dropped."""
+    return etree.fromstring(fragment, etree.HTMLParser(encoding="utf-8"))
@@ -7,6 +7,8 @@ from boarhat.scrapers.base import BaseScraper
 class CharacterScraper(BaseScraper[Character]):
     """Scraper for character data."""
 
+    model_class = Character
+
     @property
     def category_name(self) -> str:
         """Category name."""
@@ -78,14 +80,14 @@ class CharacterScraper(BaseScraper[Character]):
 
                 if tooltip:
                     # Extract proficiency
-                    prof_elem = tooltip.find("strong", string="Proficiency:")  # type: ignore
+                    prof_elem = tooltip.find("strong", string="Proficiency:")
                     if prof_elem and prof_elem.parent:
                         prof_text = prof_elem.parent.get_text(strip=True)
                         prof_text = prof_text.replace("Proficiency:", "").strip()
                         proficiency = [p.strip() for p in prof_text.split(",")]
 
                     # Extract features
-                    feat_elem = tooltip.find("strong", string="Feature:")  # type: ignore
+                    feat_elem = tooltip.find("strong", string="Feature:")
                     if feat_elem and feat_elem.parent:
                         feat_text = feat_elem.parent.get_text(strip=True)
                         feat_text = feat_text.replace("Feature:", "").strip()
@@ -110,9 +112,9 @@ class CharacterScraper(BaseScraper[Character]):
 
                 character = Character(
                     name=name,
-                    element=element,  # type: ignore
-                    role=role,  # type: ignore
-                    rarity=rarity,  # type: ignore
+                    element=element,
+                    role=role,
+                    rarity=rarity,
                     proficiency=proficiency,
                     features=features,
                     tier=tier,
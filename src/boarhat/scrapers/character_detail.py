@@ -4,17 +4,23 @@ from pathlib import Path
 
 from boarhat.models.character_detail import BaseStat, CharacterDetail, Profile, Skill, Trait
 from boarhat.scrapers.base import BaseScraper
+from boarhat.scrapers.transport import Transport
 
 
 class CharacterDetailScraper(BaseScraper[CharacterDetail]):
     """Scraper for individual character detail pages."""
 
+    model_class = CharacterDetail
+
     def __init__(
         self,
         source: str | Path,
         output_dir: Path,
         cache_dir: Path | None = None,
         character_slug: str | None = None,
+        transport: Transport | None = None,
+        revalidate: bool = False,
+        output_format: str = "json",
     ):
         """
         Initialize the character detail scraper.
@@ -24,8 +30,13 @@ class CharacterDetailScraper(BaseScraper[CharacterDetail]):
             output_dir: Directory to save output files
             cache_dir: Optional cache directory
             character_slug: Character slug (e.g., "berenica") for caching
+            transport: Optional shared HTTP transport
+            revalidate: Check the cached page with a conditional request
+            output_format: "json" or "ndjson"
         """
-        super().__init__(source, output_dir, cache_dir)
+        super().__init__(
+            source, output_dir, cache_dir, transport, revalidate, output_format=output_format
+        )
         self.character_slug = character_slug
 
     @property
@@ -207,8 +218,13 @@ class CharacterDetailScraper(BaseScraper[CharacterDetail]):
 
         return [character_detail]
 
-    def save_json(self, data: list[dict], filename: str | None = None) -> Path:
-        """Override to save individual character file."""
-        if filename is None and self.character_slug:
-            filename = f"{self.character_slug}_detail.json"
-        return super().save_json(data, filename)
+    def parse_key_parts(self) -> list[str]:
+        """The slug also decides the output file's contents."""
+        return [*super().parse_key_parts(), self.character_slug or ""]
+
+    @property
+    def output_stem(self) -> str:
+        """Individual character file name without extension."""
+        if self.character_slug:
+            return f"{self.character_slug}_detail"
+        return self.category_name
@@ -1,163 +1,188 @@
 """Demon Wedge list scraper for Duet Night Abyss."""
 
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from bs4 import Tag
+from lxml import etree
+
 from boarhat.models.demon_wedge import DemonWedge
+from boarhat.scrapers.backends import element_text
 from boarhat.scrapers.base import BaseScraper
+from boarhat.scrapers.cards import (
+    Badge,
+    Block,
+    CardSchema,
+    Section,
+    card_offsets,
+    first,
+    iter_cards,
+    iter_soup_cards,
+    iter_streamed_cards,
+    parse_fragment,
+    shard_ranges,
+)
+from boarhat.scrapers.transport import Transport
+
+SKIP_HEADINGS = ["DEMON WEDGE", "Polarity", "Restriction", "Source", "Rarity"]
+ELEMENTS = ["Pyro", "Anemo", "Hydro", "Lumino", "Electro", "Umbro"]
+
+SUBTYPE = etree.XPath("following-sibling::p[1]")
+INFO_PREFIXES = {"tolerance": "Tolerance:", "track": "Track:", "source": "Source:"}
+
+CARD_SCHEMA = CardSchema(
+    badges=(
+        Badge("rarity", contains="★"),
+        Badge("restriction", css_class="bg-gray-700"),
+        Badge("polarity", title="Polarity"),
+        Badge("element", values=tuple(ELEMENTS)),
+    ),
+    sections=(
+        Section("main_attributes", "Main Attribute", kind="list"),
+        Section("effects", "Effect", kind="list"),
+    ),
+    # Tolerance, track, and source sit in the gray footer
+    blocks=(Block("info", ("text-gray-400", "text-xs"), paragraphs=True),),
+    defaults={"rarity": "Unknown", "restriction": "Unknown", "element": "Unknown", "polarity": ""},
+)
 
 
 class DemonWedgeScraper(BaseScraper[DemonWedge]):
     """Scraper for demon wedge list from boarhat.gg."""
 
+    model_class = DemonWedge
+    supported_parsers = ("lxml", "bs4")
+    default_parser = "lxml"
+
+    def __init__(
+        self,
+        source: str | Path,
+        output_dir: Path,
+        cache_dir: Path | None = None,
+        transport: Transport | None = None,
+        revalidate: bool = False,
+        parser: str | None = None,
+        workers: int | None = None,
+        output_format: str = "json",
+    ):
+        """
+        Initialize the demon wedge scraper.
+
+        Args:
+            source: URL or Path to HTML file
+            output_dir: Directory to save output files
+            cache_dir: Optional cache directory
+            transport: Optional shared HTTP transport
+            revalidate: Check the cached page with a conditional request
+            parser: Parser backend name (defaults to lxml)
+            workers: Split the page into card-aligned shards and parse them in
+                this many processes (lxml backend only)
+            output_format: "json" or "ndjson"
+        """
+        super().__init__(
+            source, output_dir, cache_dir, transport, revalidate, parser, output_format
+        )
+        self.workers = workers
+
     @property
     def category_name(self) -> str:
         """Category name for demon wedge scraper."""
         return "demon_wedges"
 
-    def scrape(self) -> list[DemonWedge]:
+    def scrape(self) -> Iterable[DemonWedge]:
         """
         Scrape demon wedge data from the HTML.
 
+        With the lxml backend cards are yielded as the page is parsed.
+
         Returns:
-            List of DemonWedge objects
+            DemonWedge objects
         """
-        soup = self.load_html()
-        wedges = []
-
-        # Find all demon wedge name headings (h2 with specific class)
-        wedge_headings = soup.find_all("h2", class_="text-xl font-bold text-white")
-
-        for heading in wedge_headings:
-            # Skip headings that are not wedge names
-            heading_text = heading.get_text(strip=True)
-            if heading_text in ["DEMON WEDGE", "Polarity", "Restriction", "Source", "Rarity"]:
-                continue
-
-            try:
-                # Find the parent card div
-                card = heading.find_parent("div", class_="bg-gray-900")
-                if not card:
-                    continue
-
-                # Get subtype from the <p> tag after the heading
-                subtype = "Unknown"
-                subtype_p = heading.find_next_sibling("p")
-                if subtype_p:
-                    subtype = subtype_p.get_text(strip=True)
-
-                wedge = self._parse_wedge_card(heading_text, subtype, card)
-                if wedge:
-                    wedges.append(wedge)
-            except Exception as e:
-                print(f"Warning: Failed to parse demon wedge '{heading_text}': {e}")
-                continue
-
-        return wedges
-
-    def _parse_wedge_card(self, name: str, subtype: str, card) -> DemonWedge | None:
+        if self.backend.name == "lxml" and self.workers and self.workers > 1:
+            return self._scrape_sharded(self.workers)
+        if self.backend.name == "lxml":
+            return self._scrape_lxml()
+        return self._scrape_bs4(self.parse_html())
+
+    def _scrape_lxml(self) -> Iterator[DemonWedge]:
+        """Stream demon wedge cards from an incremental lxml parse."""
+        with self.open_html() as stream:
+            yield from _wedges_from_cards(iter_streamed_cards(stream, SKIP_HEADINGS))
+
+    def _scrape_sharded(self, workers: int) -> Iterator[DemonWedge]:
+        """Parse card-aligned byte ranges of the page in worker processes, in document order."""
+        with self.open_html() as stream:
+            html = stream.read()
+
+        ranges = shard_ranges(card_offsets(html), len(html), workers)
+        print(f"[{self.category_name}] Parsing {len(ranges)} shards in {workers} processes")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            shards = pool.map(_parse_shard, [html[start:end] for start, end in ranges])
+            for wedges in shards:
+                yield from wedges
+
+    def _scrape_bs4(self, soup) -> list[DemonWedge]:
+        """Scrape demon wedge cards found in a BeautifulSoup tree."""
+        return list(_wedges_from_cards(iter_soup_cards(soup, SKIP_HEADINGS)))
+
+    @staticmethod
+    def _parse_wedge_card(name: str, subtype: str, card) -> DemonWedge:
         """
         Parse a single demon wedge card.
 
         Args:
             name: Demon wedge name
             subtype: Demon wedge subtype (Volition, Spectrum, etc.)
-            card: BeautifulSoup element containing wedge card
+            card: lxml element or BeautifulSoup tag containing the wedge card
 
         Returns:
-            DemonWedge object or None if parsing fails
+            DemonWedge object
         """
-        # Extract metadata from span tags
-        rarity = "Unknown"
-        restriction = "Unknown"
-        element = "Unknown"
-        polarity = ""
-
-        # Find all badge spans
-        badges = card.find_all("span", class_=lambda c: c and "px-2" in c and "py-1" in c)
-
-        for badge in badges:
-            text = badge.get_text(strip=True)
-            bg_class = badge.get("class", [])
-            bg_color = " ".join(bg_class)
-
-            # Rarity has star symbol
-            if "★" in text:
-                rarity = text
-            # Restriction/Type (bg-gray-700)
-            elif "bg-gray-700" in bg_color:
-                restriction = text
-            # Polarity has special symbols (has title="Polarity")
-            elif badge.get("title") == "Polarity":
-                polarity = text
-            else:
-                # Check if it's an element
-                elements = ["Pyro", "Anemo", "Hydro", "Lumino", "Electro", "Umbro"]
-                if text in elements:
-                    element = text
-
-        # Extract image URL from the background-image style
-        image_url = ""
-        img_divs = card.find_all("div", style=lambda s: s and "background-image:url(" in str(s))
-        for img_div in img_divs:
-            style = img_div.get("style", "")
-            if "background-image:url(" in style:
-                start_idx = style.find("background-image:url(") + len("background-image:url(")
-                end_idx = style.find(")", start_idx)
-                image_url = style[start_idx:end_idx]
-                if image_url.startswith("/"):
-                    image_url = f"https://boarhat.gg{image_url}"
-                break
-
-        # Extract main attributes
-        main_attributes = []
-        attr_heading = card.find("h3", string="Main Attribute")
-        if attr_heading:
-            attr_list = attr_heading.find_next("ul")
-            if attr_list:
-                for li in attr_list.find_all("li"):
-                    text = li.get_text(strip=True)
-                    if text:
-                        main_attributes.append(text)
-
-        # Extract effects
-        effects = []
-        effect_heading = card.find("h3", string="Effect")
-        if effect_heading:
-            effect_list = effect_heading.find_next("ul")
-            if effect_list:
-                for li in effect_list.find_all("li"):
-                    text = li.get_text(strip=True)
-                    if text:
-                        effects.append(text)
-
-        # Extract tolerance, track, and source
-        tolerance = ""
-        track = ""
-        source = ""
-
-        # Find the div with gray text at the bottom
-        info_div = card.find(
-            "div", class_=lambda c: c and "text-gray-400" in str(c) and "text-xs" in str(c)
-        )
-        if info_div:
-            for p in info_div.find_all("p"):
-                text = p.get_text(strip=True)
-                if text.startswith("Tolerance:"):
-                    tolerance = text.replace("Tolerance:", "").strip()
-                elif text.startswith("Track:"):
-                    track = text.replace("Track:", "").strip()
-                elif text.startswith("Source:"):
-                    source = text.replace("Source:", "").strip()
+        fields = CARD_SCHEMA.extract(card)
+        fields["main_attributes"] = [text for text in fields["main_attributes"] if text]
+        fields["effects"] = [text for text in fields["effects"] if text]
+
+        info = dict.fromkeys(INFO_PREFIXES, "")
+        for text in fields.pop("info"):
+            for key, prefix in INFO_PREFIXES.items():
+                if text.startswith(prefix):
+                    info[key] = text.replace(prefix, "").strip()
+                    break
 
         return DemonWedge(
             name=name,
             subtype=subtype,
-            rarity=rarity,
-            restriction=restriction,
-            element=element,
-            polarity=polarity,
-            image_url=image_url,
-            main_attributes=main_attributes,
-            effects=effects,
-            tolerance=tolerance,
-            track=track,
-            source=source,
+            tolerance=info["tolerance"],
+            track=info["track"],
+            source=info["source"],
+            **fields,
         )
+
+
+def _subtype(heading: etree._Element | Tag) -> str:
+    """Subtype from the `<p>` right after a card heading."""
+    if isinstance(heading, Tag):
+        subtype_p = heading.find_next_sibling("p")
+        return subtype_p.get_text(strip=True) if subtype_p else "Unknown"
+    subtype_p = first(SUBTYPE(heading))
+    return element_text(subtype_p) if subtype_p is not None else "Unknown"
+
+
+def _wedges_from_cards(
+    cards: Iterable[tuple[str, etree._Element, etree._Element]] | Iterable[tuple[str, Tag, Tag]],
+) -> Iterator[DemonWedge]:
+    """Parse demon wedges from (name, heading, card) triples, skipping broken cards."""
+    for name, heading, card in cards:
+        try:
+            subtype = _subtype(heading)
+            wedge = DemonWedgeScraper._parse_wedge_card(name, subtype, card)
+        except Exception as e:
+            print(f"Warning: Failed to parse demon wedge '{name}': {e}")
+            continue
+        yield wedge
+
+
+def _parse_shard(fragment: bytes) -> list[DemonWedge]:
+    """Parse the demon wedges in one shard of the page (runs in a worker process)."""
+    return list(_wedges_from_cards(iter_cards(parse_fragment(fragment), SKIP_HEADINGS)))
@@ -0,0 +1,151 @@
+"""Concurrent fetching and parsing for batches of scrapers."""
+
+import asyncio
+from collections.abc import Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from boarhat.scrapers.base import BaseScraper
+from boarhat.scrapers.transport import Transport, get_default_transport
+
+ScrapeResult = tuple[int, Path]
+
+
+async def _fetch_page(
+    transport: Transport,
+    semaphore: asyncio.Semaphore,
+    scraper: BaseScraper,
+) -> None:
+    """Download (or revalidate) a scraper's page into its cache when needed."""
+    if not scraper.needs_fetch:
+        return
+
+    headers = scraper.conditional_headers()
+    try:
+        async with semaphore:
+            verb = "Revalidating" if headers else "Fetching"
+            print(f"[{scraper.category_name}] {verb} from URL: {scraper.source}")
+            response = await transport.aget(str(scraper.source), headers=headers)
+
+        scraper.accept_response(response)
+    except httpx.HTTPError as e:
+        if not scraper.fall_back_to_cache(e):
+            raise
+
+
+async def _fetch_and_run(
+    transport: Transport,
+    semaphore: asyncio.Semaphore,
+    scraper: BaseScraper,
+) -> ScrapeResult:
+    """Fetch a scraper's page, then parse and save it in a worker thread."""
+    await _fetch_page(transport, semaphore, scraper)
+    # Parsing is CPU-bound, keep it off the event loop
+    return await asyncio.to_thread(scraper.run)
+
+
+def _parse_page(scraper: BaseScraper, html_content: str) -> list[dict[str, Any]]:
+    """Parse one page in a worker process."""
+    return scraper.parse_records(html_content)
+
+
+def _parse_in_processes(
+    scrapers: Sequence[BaseScraper],
+    fetched: Sequence[BaseException | None],
+    workers: int,
+) -> list[ScrapeResult | BaseException]:
+    """
+    Parse fetched pages across a process pool and save the results in input order.
+
+    Args:
+        scrapers: Scrapers whose pages are in the cache
+        fetched: Per scraper, the exception raised while fetching, or None
+        workers: Number of worker processes
+
+    Returns:
+        One entry per scraper: (number of records, output file path), or the exception
+        raised while fetching or parsing that page
+    """
+    results: list[ScrapeResult | BaseException] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Per scraper: reused records, a pending parse, or the error so far
+        pending: list[list[dict[str, Any]] | Future | BaseException] = []
+        for scraper, error in zip(scrapers, fetched, strict=True):
+            if error is not None:
+                pending.append(error)
+                continue
+            try:
+                print(f"[{scraper.category_name}] Scraping from {scraper.source}...")
+                cached = scraper.lookup_parsed()
+                if cached is not None:
+                    pending.append(cached)
+                else:
+                    pending.append(pool.submit(_parse_page, scraper, scraper.read_html()))
+            except Exception as e:
+                pending.append(e)
+
+        # Results are written by this process only, one page at a time
+        for scraper, entry in zip(scrapers, pending, strict=True):
+            if isinstance(entry, BaseException):
+                results.append(entry)
+                continue
+            try:
+                if isinstance(entry, Future):
+                    records = entry.result()
+                    scraper.remember_parsed(records)
+                else:
+                    records = entry
+                results.append((len(records), scraper.save_records(records)))
+            except Exception as e:
+                results.append(e)
+    return results
+
+
+async def run_scrapers_async(
+    scrapers: Sequence[BaseScraper],
+    concurrency: int = 8,
+    transport: Transport | None = None,
+    workers: int | None = None,
+) -> list[ScrapeResult | BaseException]:
+    """
+    Run scrapers with at most `concurrency` page downloads in flight.
+
+    Args:
+        scrapers: Scrapers to run
+        concurrency: Maximum number of simultaneous HTTP requests
+        transport: Shared HTTP transport (defaults to the process-wide one)
+        workers: Parse pages in this many worker processes once all are
+            fetched, instead of in threads of this process
+
+    Returns:
+        One entry per scraper, in input order: the `run()` result, or the
+        exception raised while fetching or parsing that page
+    """
+    transport = transport or get_default_transport()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    try:
+        if workers is None:
+            tasks = [_fetch_and_run(transport, semaphore, scraper) for scraper in scrapers]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        fetches = [_fetch_page(transport, semaphore, scraper) for scraper in scrapers]
+        fetched = await asyncio.gather(*fetches, return_exceptions=True)
+    finally:
+        # The async client is bound to this event loop
+        await transport.aclose()
+
+    return await asyncio.to_thread(_parse_in_processes, scrapers, fetched, workers)
+
+
+def run_scrapers(
+    scrapers: Sequence[BaseScraper],
+    concurrency: int = 8,
+    transport: Transport | None = None,
+    workers: int | None = None,
+) -> list[ScrapeResult | BaseException]:
+    """Synchronous entry point for `run_scrapers_async`."""
+    return asyncio.run(run_scrapers_async(scrapers, concurrency, transport, workers))
@@ -0,0 +1,172 @@
+"""Atomic, change-aware writing of output files."""
+
+import hashlib
+import os
+import secrets
+from pathlib import Path
+from types import TracebackType
+from typing import Literal
+
+WriteStatus = Literal["new", "changed", "unchanged"]
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+TEMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 hex digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _create_temp(path: Path) -> tuple[int, Path]:
+    """
+    Create a new hidden temp file next to `path`.
+
+    Unlike `tempfile.mkstemp` (always 0600), the file is opened with mode
+    0666, so the process umask gives it the mode a plain `open` would.
+
+    Returns:
+        (file descriptor, temp file path)
+    """
+    while True:
+        tmp_path = path.with_name(f".{path.name}.{secrets.token_hex(8)}.tmp")
+        try:
+            return os.open(tmp_path, TEMP_FLAGS, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
+class AtomicWriter:
+    """
+    Text writer that replaces a file atomically, and only when its content changes.
+
+    Text goes to a temp file next to the target while being hashed. On a
+    clean exit the temp file is renamed over the target, unless the target
+    already has identical bytes, in which case it is left untouched (mtime
+    included). On an exception the target is not modified.
+
+    Example:
+        with AtomicWriter(path) as f:
+            f.write("...")
+        f.status  # "new", "changed" or "unchanged"
+    """
+
+    def __init__(self, path: Path, buffering: int = -1):
+        """
+        Initialize the writer.
+
+        Args:
+            path: File to write
+            buffering: Buffer size for the temp file (as for `open`)
+        """
+        self.path = path
+        self.buffering = buffering
+        self.status: WriteStatus | None = None
+
+    def __enter__(self) -> "AtomicWriter":
+        """Open the temp file."""
+        fd, self._tmp_path = _create_temp(self.path)
+        self._file = os.fdopen(fd, "wb", buffering=self.buffering)
+        self._digest = hashlib.sha256()
+        self._size = 0
+        return self
+
+    def write(self, text: str) -> None:
+        """Write text (encoded as UTF-8)."""
+        data = text.encode("utf-8")
+        self._digest.update(data)
+        self._size += len(data)
+        self._file.write(data)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Commit the temp file, or discard it if writing failed."""
+        self._file.close()
+        if exc_type is not None:
+            self._tmp_path.unlink(missing_ok=True)
+            return
+        self.status = self._commit()
+
+    def _commit(self) -> WriteStatus:
+        """Move the temp file into place if the content differs from the target."""
+        if self.path.exists():
+            unchanged = self.path.stat().st_size == self._size and (
+                file_hash(self.path) == self._digest.hexdigest()
+            )
+            if unchanged:
+                self._tmp_path.unlink()
+                return "unchanged"
+            status: WriteStatus = "changed"
+        else:
+            status = "new"
+
+        os.replace(self._tmp_path, self.path)
+        return status
+
+
+class StreamWriter:
+    """
+    Text writer that writes straight into the target file.
+
+    For outputs that readers follow while they are written (NDJSON): each
+    buffer flush lands in the file right away. The price is what
+    `AtomicWriter` avoids: a failed run leaves a partial file (every
+    complete line still valid), and the file is rewritten, mtime
+    included, even when the content comes out the same. `status` still
+    reports whether the content changed, by hashing the old file first.
+    """
+
+    def __init__(self, path: Path, buffering: int = -1):
+        """
+        Initialize the writer.
+
+        Args:
+            path: File to write
+            buffering: Buffer size for the file (as for `open`)
+        """
+        self.path = path
+        self.buffering = buffering
+        self.status: WriteStatus | None = None
+
+    def __enter__(self) -> "StreamWriter":
+        """Hash the previous content, then truncate and open the file."""
+        self._previous = (
+            (self.path.stat().st_size, file_hash(self.path)) if self.path.exists() else None
+        )
+        self._file = open(self.path, "wb", buffering=self.buffering)
+        self._digest = hashlib.sha256()
+        self._size = 0
+        return self
+
+    def write(self, text: str) -> None:
+        """Write text (encoded as UTF-8)."""
+        data = text.encode("utf-8")
+        self._digest.update(data)
+        self._size += len(data)
+        self._file.write(data)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the file and compare its content with what it held before."""
+        self._file.close()
+        if exc_type is not None:
+            return
+        if self._previous is None:
+            self.status = "new"
+        elif self._previous == (self._size, self._digest.hexdigest()):
+            self.status = "unchanged"
+        else:
+            self.status = "changed"
@@ -0,0 +1,207 @@
+"""Shared HTTP transport with connection pooling, rate limiting and retries."""
+
+import asyncio
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import httpx
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens the bucket can hold
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token, borrowing against the future if the bucket is empty.
+
+        Returns:
+            Seconds the caller must wait before using the token
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class Transport:
+    """
+    HTTP transport shared by all scrapers in a process.
+
+    Holds one pooled keep-alive client (plus an async twin for the concurrent
+    fetch engine), limits request rate per host, and retries throttled or
+    failed requests with jittered exponential backoff.
+    """
+
+    def __init__(
+        self,
+        rate: float = 2.0,
+        burst: int = 4,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        http2: bool = False,
+        timeout: float = 30.0,
+        max_connections: int = 10,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            rate: Requests per second allowed to each host (0 disables limiting)
+            burst: Requests allowed back-to-back before the rate applies
+            max_retries: Retries after the first attempt on 429/5xx or network errors
+            backoff: Base delay in seconds for exponential backoff
+            max_backoff: Upper bound for a single backoff delay
+            http2: Negotiate HTTP/2 (requires the `h2` package)
+            timeout: Request timeout in seconds
+            max_connections: Connection pool size
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.http2 = http2
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self._client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        """Pooled synchronous client, created on first use."""
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    http2=self.http2,
+                    timeout=self.timeout,
+                    limits=self.limits,
+                    follow_redirects=True,
+                )
+            return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Pooled async client, created on first use inside an event loop."""
+        with self._lock:
+            if self._async_client is None:
+                self._async_client = httpx.AsyncClient(
+                    http2=self.http2,
+                    timeout=self.timeout,
+                    limits=self.limits,
+                    follow_redirects=True,
+                )
+            return self._async_client
+
+    def _throttle_delay(self, url: str) -> float:
+        """Reserve a request slot for the URL's host and return the wait time."""
+        if self.rate <= 0:
+            return 0.0
+        host = urlsplit(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+        return bucket.reserve()
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None) -> float:
+        """Delay before retry `attempt` (0-based), honoring Retry-After."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), self.max_backoff)
+        delay = min(self.max_backoff, self.backoff * 2**attempt)
+        return random.uniform(delay / 2, delay)
+
+    def get(self, url: str, headers: dict[str, str] | None = None) -> httpx.Response:
+        """
+        GET a URL with rate limiting and retries.
+
+        Returns:
+            The final response; callers decide whether to raise on its status
+        """
+        attempt = 0
+        while True:
+            time.sleep(self._throttle_delay(url))
+            last_attempt = attempt >= self.max_retries
+            try:
+                response = self.client.get(url, headers=headers)
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+                time.sleep(self._retry_delay(attempt, None))
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or last_attempt:
+                    return response
+                time.sleep(self._retry_delay(attempt, response))
+            attempt += 1
+
+    async def aget(self, url: str, headers: dict[str, str] | None = None) -> httpx.Response:
+        """Async variant of `get`, sharing the same per-host rate limits."""
+        attempt = 0
+        while True:
+            await asyncio.sleep(self._throttle_delay(url))
+            last_attempt = attempt >= self.max_retries
+            try:
+                response = await self.async_client.get(url, headers=headers)
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt, None))
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or last_attempt:
+                    return response
+                await asyncio.sleep(self._retry_delay(attempt, response))
+            attempt += 1
+
+    def close(self) -> None:
+        """Close the synchronous client."""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    async def aclose(self) -> None:
+        """Close the async client; it is recreated on next use."""
+        with self._lock:
+            client, self._async_client = self._async_client, None
+        if client is not None:
+            await client.aclose()
+
+
+_default_transport: Transport | None = None
+
+
+def get_default_transport() -> Transport:
+    """Process-wide transport used by scrapers that are not given one."""
+    global _default_transport
+    if _default_transport is None:
+        _default_transport = Transport()
+    return _default_transport
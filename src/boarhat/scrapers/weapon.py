@@ -1,12 +1,50 @@
 """Weapon list scraper for Duet Night Abyss."""
 
-from boarhat.models.weapon import Weapon
+import re
+
+from boarhat.models.enums import Unit
+from boarhat.models.weapon import SkillEffect, Weapon
 from boarhat.scrapers.base import BaseScraper
+from boarhat.scrapers.cards import Badge, CardSchema, Section, iter_cards, iter_soup_cards
+
+SKIP_HEADINGS = ["WEAPON", "Element", "Type", "Attack Type"]
+ELEMENTS = ["Pyro", "Anemo", "Hydro", "Lumino", "Electro", "Umbro", "Neutral"]
+ATTACK_TYPES = ["Slash", "Spike", "Smash"]
+
+# Refinement vectors in skill text: "(+15% / 18% / 21% / 24% / 27% / 30%)"
+RANK_GROUP = re.compile(r"\(([^()]*/[^()]*)\)")
+RANK_VALUE = re.compile(r"\s*\+?\s*(\d+(?:\.\d+)?)\s*(%|s)?\s*")
+# Stat named before the vector ("Skill Duration (", "increases Resolve by (", "Skill Range +(")
+# or after it ("grants (...) CRIT Chance")
+STAT_BEFORE = re.compile(r"([A-Z][\w-]*(?: [A-Z][\w-]*)*)(?: by)?\s*\+?\s*$")
+STAT_AFTER = re.compile(r"\s*([A-Z][\w-]*(?: [A-Z][\w-]*)*)")
+DURATION_BEFORE = re.compile(r"\bfor\s*$")
+# Sentence-leading verbs that look like a stat name before a vector
+SKILL_VERBS = ("Deals", "Grants", "Increases", "Gains")
+RANK_UNITS = {None: Unit.FLAT, "%": Unit.PERCENT, "s": Unit.SECONDS}
+
+CARD_SCHEMA = CardSchema(
+    badges=(
+        Badge("weapon_type", css_class="bg-gray-700"),
+        Badge("element", values=tuple(ELEMENTS)),
+        Badge("attack_type", values=tuple(ATTACK_TYPES)),
+    ),
+    sections=(
+        Section("skill", "Skill", kind="container", separator=" "),
+        Section("base_stats", "Stats", kind="list", exact=False, separator=" "),
+        Section("attributes", "Attributes", kind="list", separator=" "),
+    ),
+    defaults={"element": "Neutral", "weapon_type": "Unknown", "attack_type": "Unknown"},
+)
 
 
 class WeaponScraper(BaseScraper[Weapon]):
     """Scraper for weapon list from boarhat.gg."""
 
+    model_class = Weapon
+    supported_parsers = ("lxml", "bs4")
+    default_parser = "lxml"
+
     @property
     def category_name(self) -> str:
         """Category name for weapon scraper."""
@@ -19,138 +57,82 @@ class WeaponScraper(BaseScraper[Weapon]):
         Returns:
             List of Weapon objects
         """
-        soup = self.load_html()
-        weapons = []
-
-        # Find all weapon name headings (h2 with specific class)
-        weapon_headings = soup.find_all("h2", class_="text-xl font-bold text-white")
-
-        for heading in weapon_headings:
-            # Skip headings that are not weapon names
-            heading_text = heading.get_text(strip=True)
-            if heading_text in ["WEAPON", "Element", "Type", "Attack Type"]:
-                continue
+        document = self.parse_html()
+        if self.backend.name == "lxml":
+            cards = iter_cards(document, SKIP_HEADINGS)
+        else:
+            cards = iter_soup_cards(document, SKIP_HEADINGS)
 
+        weapons = []
+        for name, _, card in cards:
             try:
-                # Find the parent card div
-                card = heading.find_parent("div", class_="bg-gray-900")
-                if not card:
-                    continue
-
-                weapon = self._parse_weapon_card(heading_text, card)
-                if weapon:
-                    weapons.append(weapon)
+                weapons.append(self._parse_weapon_card(name, card))
             except Exception as e:
-                print(f"Warning: Failed to parse weapon '{heading_text}': {e}")
-                continue
+                print(f"Warning: Failed to parse weapon '{name}': {e}")
 
         return weapons
 
-    def _parse_weapon_card(self, name: str, card) -> Weapon | None:
+    def _parse_weapon_card(self, name: str, card) -> Weapon:
         """
         Parse a single weapon card.
 
         Args:
             name: Weapon name
-            card: BeautifulSoup element containing weapon card
+            card: lxml element or BeautifulSoup tag containing the weapon card
 
         Returns:
-            Weapon object or None if parsing fails
+            Weapon object
         """
-        # Extract metadata from span tags
-        element = "Neutral"
-        weapon_type = "Unknown"
-        attack_type = "Unknown"
-
-        # Find all badge spans
-        badges = card.find_all("span", class_=lambda c: c and "px-2" in c and "py-1" in c)
-
-        for badge in badges:
-            text = badge.get_text(strip=True)
-            bg_class = badge.get("class", [])
-            bg_color = " ".join(bg_class)
-
-            # Weapon type is the one with bg-gray-700
-            if "bg-gray-700" in bg_color:
-                weapon_type = text
-            else:
-                # Check if it's an element or attack type
-                elements = ["Pyro", "Anemo", "Hydro", "Lumino", "Electro", "Umbro", "Neutral"]
-                attack_types = ["Slash", "Spike", "Smash"]
-
-                if text in elements:
-                    element = text
-                elif text in attack_types:
-                    attack_type = text
-
-        # Extract image URL from the background-image style
-        image_url = ""
-        # Look for div with background-image style
-        img_divs = card.find_all("div", style=lambda s: s and "background-image:url(" in str(s))
-        for img_div in img_divs:
-            style = img_div.get("style", "")
-            if "background-image:url(" in style:
-                start_idx = style.find("background-image:url(") + len("background-image:url(")
-                end_idx = style.find(")", start_idx)
-                image_url = style[start_idx:end_idx]
-                # Make absolute URL if needed
-                if image_url.startswith("/"):
-                    image_url = f"https://boarhat.gg{image_url}"
-                break
-
-        # Extract skill description
-        skill = ""
-        skill_heading = card.find("h3", string="Skill")
-        if skill_heading:
-            # Get the parent div containing the skill text
-            skill_div = skill_heading.find_parent("div")
-            if skill_div:
-                # Get all text from the div and remove the "Skill" heading
-                full_text = skill_div.get_text(separator=" ", strip=True)
-                if "Skill" in full_text:
-                    skill = full_text.replace("Skill", "", 1).strip()
-
-        # Extract base stats
-        base_stats = {}
-        stats_heading = card.find("h3", string=lambda t: t and "Stats" in str(t))
-        if stats_heading:
-            stats_list = stats_heading.find_next("ul")
-            if stats_list:
-                for li in stats_list.find_all("li"):
-                    text = li.get_text(separator=" ", strip=True)
-                    # Parse "Key: Value" format
-                    if ":" in text:
-                        parts = text.split(":", 1)
-                        if len(parts) == 2:
-                            key = parts[0].strip()
-                            value = parts[1].strip()
-                            # Normalize key
-                            stat_key = key.lower().replace(" ", "_").replace("-", "_")
-                            base_stats[stat_key] = value
-
-        # Extract attributes
-        attributes = {}
-        attr_heading = card.find("h3", string="Attributes")
-        if attr_heading:
-            attr_list = attr_heading.find_next("ul")
-            if attr_list:
-                for li in attr_list.find_all("li"):
-                    text = li.get_text(separator=" ", strip=True)
-                    if ":" in text:
-                        parts = text.split(":", 1)
-                        if len(parts) == 2:
-                            key = parts[0].strip()
-                            value = parts[1].strip()
-                            attr_key = key.lower().replace(" ", "_").replace("-", "_")
-                            attributes[attr_key] = value
-
-        return Weapon(
-            name=name,
-            element=element,
-            weapon_type=weapon_type,
-            attack_type=attack_type,
-            image_url=image_url,
-            skill=skill,
-            base_stats=base_stats,
-            attributes=attributes,
-        )
+        fields = CARD_SCHEMA.extract(card)
+        fields["base_stats"] = _key_values(fields["base_stats"])
+        fields["attributes"] = _key_values(fields["attributes"])
+        fields["skill_effects"] = _skill_effects(fields["skill"])
+        return Weapon(name=name, **fields)
+
+
+def _key_values(items: list[str]) -> dict[str, str]:
+    """Parse "Key: Value" list items into a dict with snake_case keys."""
+    values = {}
+    for text in items:
+        if ":" in text:
+            key, value = text.split(":", 1)
+            values[key.strip().lower().replace(" ", "_").replace("-", "_")] = value.strip()
+    return values
+
+
+def _skill_effects(skill: str) -> list[SkillEffect]:
+    """
+    Extract the refinement vectors from a weapon skill description.
+
+    Each parenthesized "a / b / c ..." group becomes an effect. Its stat is
+    the capitalized phrase right before the group, or else right after it;
+    a group of seconds after "for" is a duration. Effects whose stat the
+    text does not name keep an empty stat.
+
+    Args:
+        skill: Skill description
+
+    Returns:
+        Effects in text order
+    """
+    effects = []
+    for group in RANK_GROUP.finditer(skill):
+        values = [RANK_VALUE.fullmatch(part) for part in group[1].split("/")]
+        if not all(values):
+            continue
+
+        unit = RANK_UNITS[values[0][2]]  # type: ignore[index]
+        before = STAT_BEFORE.search(skill, 0, group.start())
+        after = STAT_AFTER.match(skill, group.end())
+        if before and not before[1].startswith(SKILL_VERBS):
+            stat = before[1]
+        elif after:
+            stat = after[1]
+        elif unit == Unit.SECONDS and DURATION_BEFORE.search(skill, 0, group.start()):
+            stat = "Duration"
+        else:
+            stat = ""
+
+        ranks = [float(value[1]) for value in values]  # type: ignore[index]
+        effects.append(SkillEffect(stat=stat, unit=unit, ranks=ranks))
+    return effects
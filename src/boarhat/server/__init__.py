@@ -0,0 +1,6 @@
+"""Serving the processed dataset over HTTP."""
+
+from .app import DataServer
+from .responses import Response, build_responses, slugify
+
+__all__ = ["DataServer", "Response", "build_responses", "slugify"]
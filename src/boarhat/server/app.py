@@ -0,0 +1,191 @@
+"""Read-only asyncio HTTP server for the processed dataset."""
+
+import asyncio
+import contextlib
+from email.utils import formatdate
+from pathlib import Path
+
+from boarhat.models.catalog import DEFAULT_DATA_DIR, Catalog
+from boarhat.query.storage import source_files
+
+from .responses import Response, build_responses
+
+MAX_HEADER_SIZE = 16 * 1024
+
+REASONS = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+}
+
+NOT_FOUND = Response.json({"error": "not found"})
+NOT_ALLOWED = Response.json({"error": "method not allowed"})
+
+
+def _fingerprint(data_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    """Name, size and mtime of every scraper output, to detect changes."""
+    return tuple(
+        sorted(
+            (str(p), (stat := p.stat()).st_size, stat.st_mtime_ns) for p in source_files(data_dir)
+        )
+    )
+
+
+def _load(data_dir: Path) -> dict[str, Response]:
+    """Load the dataset and build every response."""
+    return build_responses(Catalog.load(data_dir))
+
+
+class DataServer:
+    """
+    Serves pre-built responses from memory.
+
+    Every response body is serialized and gzipped when the dataset is
+    loaded, so a request is a dict lookup and a socket write. The whole
+    response table is replaced in one assignment when the scraper outputs
+    change; a request in flight keeps using the table it started with.
+
+    Example:
+        server = DataServer(Path("data/processed"))
+        asyncio.run(server.serve("127.0.0.1", 8000))
+    """
+
+    def __init__(self, data_dir: Path = DEFAULT_DATA_DIR, poll_interval: float = 2.0):
+        """
+        Load the dataset.
+
+        Args:
+            data_dir: Processed data directory
+            poll_interval: Seconds between checks for changed scraper outputs
+                (0 disables reloading)
+        """
+        self.data_dir = data_dir
+        self.poll_interval = poll_interval
+        self.fingerprint = _fingerprint(data_dir)
+        self.responses = _load(data_dir)
+        self.date = formatdate(usegmt=True)
+
+    async def reload_if_changed(self) -> bool:
+        """
+        Rebuild the responses if any scraper output changed since the last load.
+
+        Returns:
+            Whether the responses were replaced
+        """
+        fingerprint = await asyncio.to_thread(_fingerprint, self.data_dir)
+        if fingerprint == self.fingerprint:
+            return False
+        try:
+            responses = await asyncio.to_thread(_load, self.data_dir)
+        except (OSError, ValueError):
+            return False  # Output half-written: keep serving, retry next poll
+        self.responses, self.fingerprint = responses, fingerprint
+        return True
+
+    async def _watch(self) -> None:
+        """Refresh the Date header every second and poll for changed data, until cancelled."""
+        elapsed = 0.0
+        while True:
+            await asyncio.sleep(1.0)
+            self.date = formatdate(usegmt=True)
+            elapsed += 1.0
+            if self.poll_interval and elapsed >= self.poll_interval:
+                elapsed = 0.0
+                if await self.reload_if_changed():
+                    print(f"Reloaded {self.data_dir} ({len(self.responses)} responses)")
+
+    def _head(self, status: int, response: Response | None, gzipped: bool, length: int) -> bytes:
+        """Status line and headers."""
+        lines = [f"HTTP/1.1 {status} {REASONS[status]}", f"Date: {self.date}"]
+        if response is not None:
+            lines += [
+                f"Content-Type: {response.content_type}",
+                f"ETag: {response.etag}",
+                "Vary: Accept-Encoding",
+                "Cache-Control: no-cache",
+            ]
+            if gzipped:
+                lines.append("Content-Encoding: gzip")
+        lines.append(f"Content-Length: {length}")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    def respond(self, method: str, target: str, headers: dict[str, str]) -> bytes:
+        """
+        Complete HTTP response to one request.
+
+        Args:
+            method: Request method
+            target: Request target (path and optional query string)
+            headers: Request headers, names lowercased
+
+        Returns:
+            Status line, headers and body
+        """
+        if method not in ("GET", "HEAD"):
+            status, response = 405, NOT_ALLOWED
+        else:
+            path = target.split("?", 1)[0].rstrip("/") or "/"
+            response = self.responses.get(path, NOT_FOUND)
+            if response is NOT_FOUND:
+                status = 404
+            elif response.etag in headers.get("if-none-match", ""):
+                return self._head(304, response, False, 0)
+            else:
+                status = 200
+
+        gzipped = "gzip" in headers.get("accept-encoding", "")
+        body = response.gzipped if gzipped else response.body
+        head = self._head(status, response, gzipped, len(body))
+        return head if method == "HEAD" else head + body
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one connection until the client closes it."""
+        try:
+            while True:
+                try:
+                    raw = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    break
+                except asyncio.LimitOverrunError:
+                    writer.write(self._head(400, None, False, 0))
+                    break
+
+                request_line, *header_lines = raw.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = request_line.split(" ")
+                except ValueError:
+                    writer.write(self._head(400, None, False, 0))
+                    break
+                headers = {}
+                for line in header_lines:
+                    name, sep, value = line.partition(":")
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+
+                writer.write(self.respond(method, target, headers))
+                await writer.drain()
+
+                # Request bodies are not read, so nothing else on this connection can be trusted
+                if method not in ("GET", "HEAD"):
+                    break
+                connection = headers.get("connection", "").lower()
+                if connection == "close" or (version == "HTTP/1.0" and connection != "keep-alive"):
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8000) -> None:
+        """Accept connections until cancelled."""
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER_SIZE)
+        watcher = asyncio.create_task(self._watch())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            watcher.cancel()
@@ -0,0 +1,94 @@
+"""Pre-serialized, pre-compressed API responses built from the processed dataset."""
+
+import gzip
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from boarhat.models.catalog import Catalog
+
+NON_SLUG = re.compile(r"[^a-z0-9]+")
+
+
+def slugify(name: str) -> str:
+    """URL path segment of a name ("Fafnir's Decline" -> "fafnir-s-decline")."""
+    return NON_SLUG.sub("-", name.casefold()).strip("-")
+
+
+@dataclass(frozen=True, slots=True)
+class Response:
+    """A response body ready to send as-is."""
+
+    body: bytes
+    gzipped: bytes
+    etag: str
+    content_type: str = "application/json; charset=utf-8"
+
+    @classmethod
+    def json(cls, data: Any) -> "Response":
+        """Serialize and compress a JSON body once."""
+        body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        return cls(body, gzip.compress(body, compresslevel=9, mtime=0), etag)
+
+
+def _keyed(names: list[str]) -> list[str]:
+    """Unique slugs for names, numbering repeats ("name", "name-2", ...)."""
+    seen: dict[str, int] = {}
+    keys = []
+    for name in names:
+        slug = slugify(name) or "item"
+        seen[slug] = seen.get(slug, 0) + 1
+        keys.append(slug if seen[slug] == 1 else f"{slug}-{seen[slug]}")
+    return keys
+
+
+def build_responses(catalog: Catalog) -> dict[str, Response]:
+    """
+    Every response the server can send, by request path.
+
+    Routes:
+        /: Lists and entity counts
+        /<category>: Every record of a category, each with its `key`
+        /<category>/<key>: One record; for characters, the detail page
+            data when it was scraped, otherwise the list entry
+
+    Args:
+        catalog: Loaded dataset
+
+    Returns:
+        Path -> response
+    """
+    lists: dict[str, list[dict[str, Any]]] = {
+        "characters": [c.to_dict() for c in catalog.characters],
+        "weapons": [w.to_dict() for w in catalog.weapons],
+        "geniemon": [g.to_dict() for g in catalog.geniemon],
+        "wedges": [w.to_dict() for w in catalog.wedges],
+    }
+    details = {slugify(slug): detail.to_dict() for slug, detail in catalog.details.items()}
+
+    responses: dict[str, Response] = {}
+    for category, records in lists.items():
+        keys = _keyed([record["name"] for record in records])
+        if category == "characters":
+            # Keep the slugs used by the site (and by the detail files)
+            keys = [
+                slugify(record["url"].rstrip("/").rsplit("/", 1)[-1]) or key
+                for record, key in zip(records, keys, strict=True)
+            ]
+        for key, record in zip(keys, records, strict=True):
+            entity = details.get(key, record) if category == "characters" else record
+            responses[f"/{category}/{key}"] = Response.json(entity)
+        responses[f"/{category}"] = Response.json(
+            [{"key": key, **record} for key, record in zip(keys, records, strict=True)]
+        )
+
+    responses["/"] = Response.json(
+        {
+            category: {"path": f"/{category}", "count": len(records)}
+            for category, records in lists.items()
+        }
+    )
+    return responses
@@ -0,0 +1,92 @@
+"""Tests for card extraction on both parser backends."""
+
+from pathlib import Path
+
+import pytest
+
+from boarhat.cache.store import RawStore
+from boarhat.scrapers import DemonWedgeScraper, GeniemonScraper, WeaponScraper
+from boarhat.scrapers.backends import get_backend
+from boarhat.scrapers.cards import iter_cards, iter_soup_cards
+from boarhat.scrapers.weapon import CARD_SCHEMA, SKIP_HEADINGS
+
+RAW_DIR = Path(__file__).parent.parent / "data" / "raw"
+
+CARD = """
+<html><body><div class="grid">
+<div class="bg-gray-900 border rounded-lg p-4">
+  <div class="border-b pb-2"><div class="flex">
+    <h2 class="text-xl font-bold text-white">Aurate Yore</h2>
+    <div class="flex flex-wrap gap-2">
+      <span class="px-2 py-1 rounded-md bg-white">Neutral</span>
+      <span class="px-2 py-1 rounded-md bg-gray-700 text-gray-200">Dual Blades</span>
+      <span class="px-2 py-1 rounded-md bg-white">Smash</span>
+    </div>
+  </div></div>
+  <div class="relative"><div class="bg-contain" style="background-image:url(/assets/aurate.png)"></div></div>
+  <div class="text-gray-200 text-sm"><h3 class="text-white">Skill</h3>CRIT Damage (+62.5% / 125%).</div>
+  <div><h3 class="text-white">Stats (Lv. 1) | (Lv. MAX)</h3><ul>
+    <li><strong>Smash ATK<!-- -->:</strong> <!-- -->(18 | 225.94)</li>
+    <li><strong>CRIT Chance<!-- -->:</strong> <!-- -->24%</li>
+  </ul></div>
+  <div><h3 class="text-white">Attributes</h3><ul>
+    <li><strong>1-Hit DMG<!-- -->:</strong> <!-- -->20% x 2</li>
+  </ul></div>
+</div>
+<div class="bg-gray-900"><h2 class="text-xl font-bold text-white">Element</h2></div>
+</div></body></html>
+"""
+
+
+def _cards(parser: str, html: str) -> list:
+    document = get_backend(parser).parse(html)
+    if parser == "lxml":
+        return list(iter_cards(document, SKIP_HEADINGS))
+    return list(iter_soup_cards(document, SKIP_HEADINGS))
+
+
+@pytest.mark.parametrize("parser", ["lxml", "bs4"])
+def test_extract_card_fields(parser: str):
+    [(name, _, card)] = _cards(parser, CARD)
+
+    assert name == "Aurate Yore"
+    assert CARD_SCHEMA.extract(card) == {
+        "skill": "CRIT Damage (+62.5% / 125%).",
+        "base_stats": ["Smash ATK : (18 | 225.94)", "CRIT Chance : 24%"],
+        "attributes": ["1-Hit DMG : 20% x 2"],
+        "image_url": "https://boarhat.gg/assets/aurate.png",
+        "element": "Neutral",
+        "weapon_type": "Dual Blades",
+        "attack_type": "Smash",
+    }
+
+
+def test_bs4_cards_are_not_reparsed():
+    [(_, heading, card)] = _cards("bs4", CARD)
+
+    assert type(card).__module__.startswith("bs4")
+    assert type(heading).__module__.startswith("bs4")
+
+
+@pytest.mark.parametrize(
+    ("scraper_class", "category"),
+    [
+        (WeaponScraper, "weapons"),
+        (GeniemonScraper, "geniemon"),
+        (DemonWedgeScraper, "demon_wedges"),
+    ],
+)
+def test_backends_agree_on_cached_pages(tmp_path: Path, scraper_class, category: str):
+    store = RawStore(RAW_DIR)
+    if not store.has(category):
+        pytest.skip(f"{category} page is not cached")
+    page = tmp_path / f"{category}.html"
+    page.write_text(store.read(category), encoding="utf-8")
+
+    results = {}
+    for parser in ("lxml", "bs4"):
+        scraper = scraper_class(page, tmp_path / parser, tmp_path / "raw", parser=parser)
+        results[parser] = [item.to_dict() for item in scraper.scrape()]
+
+    assert results["lxml"]
+    assert results["lxml"] == results["bs4"]
@@ -0,0 +1,88 @@
+"""Tests for the wedge set search, checked against exhaustive search."""
+
+import itertools
+import random
+
+import pytest
+
+from boarhat.loadout.optimizer import Candidate, SlotLayout, best_wedges
+
+
+def brute_cost(chosen: tuple[Candidate, ...], layout: SlotLayout) -> int | None:
+    """Cheapest tolerance over every slot assignment, or None if the set does not fit."""
+    if len(chosen) > layout.slots:
+        return None
+    best = None
+    for slots in itertools.permutations(range(layout.slots), len(chosen)):
+        cost = 0
+        for c, slot in zip(chosen, slots, strict=True):
+            polarized = slot < len(layout.polarities) and layout.polarities[slot] == c.polarity
+            cost += -(-c.tolerance // 2) if polarized else c.tolerance
+        if best is None or cost < best:
+            best = cost
+    return best
+
+
+def brute_force(options: list[Candidate], layout: SlotLayout) -> float:
+    """Best total value over every set with at most one variant per wedge."""
+    best = 0.0
+    for size in range(len(options) + 1):
+        for chosen in itertools.combinations(options, size):
+            if len({c.name for c in chosen}) < len(chosen):
+                continue
+            cost = brute_cost(chosen, layout)
+            if cost is not None and cost <= layout.capacity:
+                best = max(best, sum(c.value for c in chosen))
+    return best
+
+
+def check(options: list[Candidate], layout: SlotLayout):
+    value, tolerance, chosen, _ = best_wedges(options, layout)
+
+    assert value == pytest.approx(brute_force(options, layout))
+    assert value == pytest.approx(sum(c.value for c in chosen))
+    assert len({c.name for c in chosen}) == len(chosen)
+    assert tolerance == brute_cost(tuple(chosen), layout)
+    assert tolerance <= layout.capacity
+
+
+def test_free_wedge_at_zero_capacity():
+    options = [
+        Candidate(0, "Costly", "x", 2, 40.0),
+        Candidate(1, "Free", "x", 0, 14.0),
+    ]
+    assert best_wedges(options, SlotLayout(slots=2, capacity=0))[0] == 14.0
+
+
+def test_free_wedges_behind_costly_ones():
+    options = [
+        Candidate(0, "A", "x", 1, 30.0),
+        Candidate(1, "B", "y", 4, 80.0),
+        Candidate(2, "C", "x", 0, 5.0),
+        Candidate(3, "D", "y", 0, 3.0),
+    ]
+    for capacity in range(6):
+        check(options, SlotLayout(slots=3, capacity=capacity, polarities=("x",)))
+
+
+def test_no_slots():
+    options = [Candidate(0, "A", "x", 0, 10.0)]
+    assert best_wedges(options, SlotLayout(slots=0, capacity=10))[0] == 0.0
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_matches_brute_force(seed: int):
+    rng = random.Random(seed)
+    options = [
+        Candidate(
+            i,
+            rng.choice("ABCDE"),
+            rng.choice("xy"),
+            rng.choice((0, 0, *range(1, 13))),
+            float(rng.randint(1, 30)),
+        )
+        for i in range(rng.randint(0, 7))
+    ]
+    slots = rng.randint(0, 4)
+    polarities = tuple(rng.choice("xy") for _ in range(rng.randint(0, slots)))
+    check(options, SlotLayout(slots, rng.randint(0, 30), polarities))
@@ -0,0 +1,77 @@
+"""Tests for the parse result cache."""
+
+import gzip
+import json
+import os
+import time
+from pathlib import Path
+
+from boarhat.cache.parsed import FILE_ENTRY_MAX_AGE, ParseCache
+
+RECORDS = [{"name": "Aurate Yore"}, {"name": "Blade Amberglow"}]
+
+
+def test_put_and_get(tmp_path: Path):
+    cache = ParseCache(tmp_path)
+    key = ParseCache.key("page", "WeaponScraper")
+    cache.put(key, "page", RECORDS)
+
+    assert cache.get(key) == RECORDS
+    assert cache.get(ParseCache.key("other", "WeaponScraper")) is None
+
+
+def test_failed_write_keeps_nothing(tmp_path: Path):
+    cache = ParseCache(tmp_path)
+    key = ParseCache.key("page")
+    try:
+        with cache.writer(key, "page") as writer:
+            writer.add(RECORDS[0])
+            raise RuntimeError("parse failed")
+    except RuntimeError:
+        pass
+
+    assert cache.get(key) is None
+    assert list(cache.root.rglob("*.tmp")) == []
+
+
+def test_prune_drops_entries_of_pages_no_longer_stored(tmp_path: Path):
+    cache = ParseCache(tmp_path)
+    live, gone = ParseCache.key("live"), ParseCache.key("gone")
+    cache.put(live, "live", RECORDS)
+    cache.put(gone, "gone", RECORDS)
+
+    assert cache.prune({"live"})[0] == 1
+    assert cache.get(live) == RECORDS
+    assert cache.get(gone) is None
+
+
+def test_prune_keeps_recent_local_file_entries(tmp_path: Path):
+    cache = ParseCache(tmp_path)
+    key = ParseCache.key("local")
+    cache.put(key, "local", RECORDS, source="file")
+
+    assert cache.prune(set()) == (0, 0)
+    assert cache.get(key) == RECORDS
+
+
+def test_prune_expires_unused_local_file_entries(tmp_path: Path):
+    cache = ParseCache(tmp_path)
+    key = ParseCache.key("local")
+    cache.put(key, "local", RECORDS, source="file")
+    old = time.time() - FILE_ENTRY_MAX_AGE - 60
+    os.utime(cache.path(key), (old, old))
+
+    assert cache.prune(set())[0] == 1
+    assert cache.get(key) is None
+
+
+def test_prune_treats_entries_without_source_as_store_entries(tmp_path: Path):
+    cache = ParseCache(tmp_path)
+    key = ParseCache.key("legacy")
+    path = cache.path(key)
+    path.parent.mkdir(parents=True)
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump({"page": "legacy", "records": RECORDS}, f)
+
+    assert cache.prune({"legacy"})[0] == 0
+    assert cache.prune(set())[0] == 1
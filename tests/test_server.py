@@ -0,0 +1,90 @@
+"""Tests for the dataset HTTP server's request handling."""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from boarhat.server.app import DataServer
+
+DATA_DIR = Path(__file__).parent.parent / "data" / "processed"
+
+
+@pytest.fixture(scope="module")
+def server() -> DataServer:
+    return DataServer(DATA_DIR, poll_interval=0)
+
+
+def split(raw: bytes) -> tuple[int, dict[str, str], bytes]:
+    """Status, headers (names lowercased) and body of a response."""
+    head, _, body = raw.partition(b"\r\n\r\n")
+    status_line, *lines = head.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in lines:
+        name, _, value = line.partition(":")
+        headers[name.lower()] = value.strip()
+    return int(status_line.split(" ")[1]), headers, body
+
+
+def test_ok(server: DataServer):
+    status, headers, body = split(server.respond("GET", "/characters", {}))
+
+    assert status == 200
+    assert headers["content-type"].startswith("application/json")
+    assert int(headers["content-length"]) == len(body)
+    assert json.loads(body)
+    assert "content-encoding" not in headers
+
+
+def test_ignores_trailing_slash_and_query(server: DataServer):
+    assert server.respond("GET", "/characters/?page=2", {}) == server.respond(
+        "GET", "/characters", {}
+    )
+
+
+def test_gzip(server: DataServer):
+    plain = split(server.respond("GET", "/", {}))
+    status, headers, body = split(server.respond("GET", "/", {"accept-encoding": "gzip, br"}))
+
+    assert status == 200
+    assert headers["content-encoding"] == "gzip"
+    assert gzip.decompress(body) == plain[2]
+
+
+def test_not_modified(server: DataServer):
+    _, headers, _ = split(server.respond("GET", "/characters", {}))
+    status, not_modified, body = split(
+        server.respond("GET", "/characters", {"if-none-match": headers["etag"]})
+    )
+
+    assert status == 304
+    assert not_modified["etag"] == headers["etag"]
+    assert body == b""
+
+
+def test_stale_etag(server: DataServer):
+    status, _, _ = split(server.respond("GET", "/characters", {"if-none-match": '"stale"'}))
+    assert status == 200
+
+
+def test_not_found(server: DataServer):
+    status, _, body = split(server.respond("GET", "/no-such-path", {}))
+
+    assert status == 404
+    assert json.loads(body) == {"error": "not found"}
+
+
+def test_head_has_no_body(server: DataServer):
+    status, headers, body = split(server.respond("HEAD", "/characters", {}))
+
+    assert status == 200
+    assert int(headers["content-length"]) > 0
+    assert body == b""
+
+
+def test_method_not_allowed(server: DataServer):
+    status, _, body = split(server.respond("POST", "/characters", {}))
+
+    assert status == 405
+    assert json.loads(body) == {"error": "method not allowed"}
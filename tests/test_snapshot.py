@@ -0,0 +1,78 @@
+"""Tests for the binary dataset snapshot."""
+
+from pathlib import Path
+
+import pytest
+
+from boarhat.models import Catalog, Snapshot, load_snapshot, write_snapshot
+from boarhat.models.snapshot import FORMAT_VERSION, HEADER, MAGIC
+
+DATA_DIR = Path(__file__).parent.parent / "data" / "processed"
+
+SECTIONS = {
+    "characters": lambda catalog: catalog.characters,
+    "details": lambda catalog: list(catalog.details.values()),
+    "weapons": lambda catalog: catalog.weapons,
+    "geniemon": lambda catalog: catalog.geniemon,
+    "wedges": lambda catalog: catalog.wedges,
+}
+
+
+@pytest.fixture(scope="module")
+def catalog() -> Catalog:
+    return Catalog.load(DATA_DIR)
+
+
+@pytest.fixture
+def snapshot_file(tmp_path: Path, catalog: Catalog) -> Path:
+    path = tmp_path / "boarhat.snap"
+    counts = write_snapshot(catalog, path)
+
+    assert counts == {name: len(items(catalog)) for name, items in SECTIONS.items()}
+    return path
+
+
+def test_round_trip(snapshot_file: Path, catalog: Catalog):
+    assert catalog.characters
+    assert load_snapshot(snapshot_file) == catalog
+
+
+def test_sections_decode_like_the_models(snapshot_file: Path, catalog: Catalog):
+    snapshot = Snapshot.open(snapshot_file)
+
+    for name, items in SECTIONS.items():
+        section = snapshot[name]
+        expected = [item.to_dict() for item in items(catalog)]
+        assert len(section) == len(expected)
+        assert section.records() == expected
+        assert list(section) == expected
+        if expected:
+            assert section[0] == expected[0]
+            assert section[-1] == expected[-1]
+            assert section[1:3] == expected[1:3]
+            assert section.model(0) == items(catalog)[0]
+            for key in expected[0]:
+                assert section.field(key) == [record[key] for record in expected]
+
+
+def test_index_out_of_range(snapshot_file: Path, catalog: Catalog):
+    section = Snapshot.open(snapshot_file)["weapons"]
+
+    with pytest.raises(IndexError):
+        section[len(catalog.weapons)]
+
+
+def test_empty_catalog(tmp_path: Path):
+    path = tmp_path / "empty.snap"
+    write_snapshot(Catalog(), path)
+
+    assert load_snapshot(path) == Catalog()
+
+
+def test_rejects_other_files():
+    with pytest.raises(ValueError, match="too short"):
+        Snapshot(b"")
+    with pytest.raises(ValueError, match="bad magic"):
+        Snapshot(HEADER.pack(b"NOTSNAP\0", FORMAT_VERSION, 0, HEADER.size))
+    with pytest.raises(ValueError, match="Unsupported snapshot version"):
+        Snapshot(HEADER.pack(MAGIC, FORMAT_VERSION + 1, 0, HEADER.size))
@@ -0,0 +1,115 @@
+"""Tests for the raw page store and its cache policy."""
+
+import json
+from pathlib import Path
+
+from boarhat.cache.manager import CacheManager
+from boarhat.cache.metadata import PageMeta
+from boarhat.cache.store import RawStore
+
+
+def _store(tmp_path: Path) -> RawStore:
+    return RawStore(tmp_path / "raw")
+
+
+def test_put_and_read(tmp_path: Path):
+    store = _store(tmp_path)
+    digest = store.put("weapons", "<html>v1</html>", PageMeta(url="https://example.com"))
+
+    assert store.has("weapons")
+    assert store.current_hash("weapons") == digest
+    assert store.read("weapons") == "<html>v1</html>"
+    assert store.object_path(digest).exists()
+
+
+def test_put_keeps_previous_version_in_history(tmp_path: Path):
+    store = _store(tmp_path)
+    first = store.put("weapons", "<html>v1</html>", PageMeta())
+    second = store.put("weapons", "<html>v2</html>", PageMeta())
+
+    assert store.current_hash("weapons") == second
+    assert store.history("weapons") == [first]
+
+
+def test_invalidate_moves_current_page_to_history(tmp_path: Path):
+    store = _store(tmp_path)
+    digest = store.put("weapons", "<html>v1</html>", PageMeta())
+
+    assert store.invalidate("weapons")
+    assert not store.has("weapons")
+    assert store.history("weapons") == [digest]
+    assert store.object_path(digest).exists()
+    assert "weapons" not in store.access_times()
+
+
+def test_invalidate_missing_category(tmp_path: Path):
+    assert not _store(tmp_path).invalidate("weapons")
+
+
+def test_evict_deletes_objects_and_references(tmp_path: Path):
+    store = _store(tmp_path)
+    first = store.put("weapons", "<html>v1</html>", PageMeta())
+    second = store.put("weapons", "<html>v2</html>", PageMeta())
+    other = store.put("geniemon", "<html>g</html>", PageMeta())
+
+    store.evict({first, second})
+
+    assert not store.has("weapons")
+    assert store.history("weapons") == []
+    assert not store.object_path(first).exists()
+    assert not store.object_path(second).exists()
+    assert store.object_hashes() == {other}
+    assert store.read("geniemon") == "<html>g</html>"
+
+
+def test_reading_leaves_manifest_untouched(tmp_path: Path):
+    store = _store(tmp_path)
+    store.put("weapons", "<html>v1</html>", PageMeta())
+    before = store.manifest_file.read_bytes()
+
+    store.read("weapons")
+    store.touch("weapons")
+
+    assert store.manifest_file.read_bytes() == before
+    assert "weapons" in store.access_times()
+
+
+def test_prune_keeps_expired_pages_current(tmp_path: Path):
+    store = _store(tmp_path)
+    digest = store.put(
+        "weapons", "<html>v1</html>", PageMeta(fetched_at="2000-01-01T00:00:00+00:00")
+    )
+    manager = CacheManager(store)
+
+    result = manager.prune()
+
+    assert result.expired == ["weapons"]
+    assert manager.is_expired("weapons")
+    assert store.current_hash("weapons") == digest
+    assert store.read("weapons") == "<html>v1</html>"
+
+
+def test_prune_removes_orphaned_objects(tmp_path: Path):
+    store = _store(tmp_path)
+    digest = store.put("weapons", "<html>v1</html>", PageMeta())
+    manifest = json.loads(store.manifest_file.read_text())
+    del manifest["pages"]["weapons"]
+    store.manifest_file.write_text(json.dumps(manifest))
+
+    result = CacheManager(store).prune()
+
+    assert result.removed_objects == 1
+    assert not store.object_path(digest).exists()
+
+
+def test_size_limit_evicts_history_before_current_pages(tmp_path: Path):
+    store = _store(tmp_path)
+    old = store.put("weapons", "<html>" + "a" * 5000 + "</html>", PageMeta())
+    current = store.put("weapons", "<html>" + "b" * 5000 + "</html>", PageMeta())
+    manager = CacheManager(store, max_size=store.object_path(current).stat().st_size)
+
+    result = manager.enforce_size_limit()
+
+    assert not store.object_path(old).exists()
+    assert store.current_hash("weapons") == current
+    assert result.evicted == []